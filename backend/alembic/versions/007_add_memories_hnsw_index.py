@@ -0,0 +1,38 @@
+"""Replace the ivfflat memory embedding index with HNSW.
+
+Revision ID: 007_memories_hnsw_index
+Revises: 006_user_profiles_observations
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007_memories_hnsw_index"
+down_revision: Union[str, None] = "006_user_profiles_observations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The ivfflat index from 001 was created unnamed; Postgres names it memories_embedding_idx
+    op.execute("DROP INDEX IF EXISTS memories_embedding_idx")
+
+    # HNSW (pgvector >= 0.5) needs no training data and keeps recall high as memories grow
+    op.execute(
+        "CREATE INDEX ix_memories_embedding_hnsw ON memories "
+        "USING hnsw (embedding vector_cosine_ops)"
+    )
+
+    # Similarity search is always scoped to one user
+    op.create_index("ix_memories_user_id", "memories", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memories_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_memories_embedding_hnsw")
+    op.execute(
+        "CREATE INDEX memories_embedding_idx ON memories "
+        "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+    )
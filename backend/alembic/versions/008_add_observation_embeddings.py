@@ -0,0 +1,29 @@
+"""Add embeddings to user_observations for similarity de-duplication.
+
+Revision ID: 008_observation_embeddings
+Revises: 007_memories_hnsw_index
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008_observation_embeddings"
+down_revision: Union[str, None] = "007_memories_hnsw_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same dimensions as memories.embedding (text-embedding-3-small)
+    op.execute("ALTER TABLE user_observations ADD COLUMN embedding vector(1536)")
+    op.execute(
+        "CREATE INDEX ix_user_observations_embedding_hnsw ON user_observations "
+        "USING hnsw (embedding vector_cosine_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_user_observations_embedding_hnsw")
+    op.execute("ALTER TABLE user_observations DROP COLUMN IF EXISTS embedding")
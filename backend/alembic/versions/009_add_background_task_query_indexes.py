@@ -0,0 +1,46 @@
+"""Add indexes for stale-task cleanup and per-node task listings.
+
+Revision ID: 009_background_task_indexes
+Revises: 008_observation_embeddings
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "009_background_task_indexes"
+down_revision: Union[str, None] = "008_observation_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so workers can keep writing tasks during the migration
+    with op.get_context().autocommit_block():
+        # cleanup_stale_tasks only looks at the few rows still processing
+        op.create_index(
+            "ix_background_tasks_stale",
+            "background_tasks",
+            ["started_at"],
+            postgresql_where=sa.text("status = 'processing'"),
+            postgresql_concurrently=True,
+        )
+
+        # Per-node listings filter by node and return newest first, without a sort
+        op.create_index(
+            "ix_background_tasks_node_created",
+            "background_tasks",
+            ["node_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+
+        # Covered by the leading column of ix_background_tasks_node_created
+        op.drop_index("ix_background_tasks_node_id", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_background_tasks_node_id", "background_tasks", ["node_id"])
+    op.drop_index("ix_background_tasks_node_created")
+    op.drop_index("ix_background_tasks_stale")
@@ -0,0 +1,36 @@
+"""Add a full-text search column to user_observations for context relevance.
+
+Revision ID: 010_observation_search_tsv
+Revises: 009_background_task_indexes
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010_observation_search_tsv"
+down_revision: Union[str, None] = "009_background_task_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Observation text outranks theme and tags, mirroring the old keyword scores
+    op.execute(
+        "ALTER TABLE user_observations ADD COLUMN search_tsv tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', observation_text), 'A') || "
+        "setweight(to_tsvector('english', coalesce(related_theme, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(tags, '[]'::jsonb)), 'B')"
+        ") STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_user_observations_search_tsv ON user_observations "
+        "USING gin (search_tsv)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_user_observations_search_tsv")
+    op.execute("ALTER TABLE user_observations DROP COLUMN IF EXISTS search_tsv")
@@ -0,0 +1,116 @@
+"""Request coalescing for embedding calls."""
+
+import asyncio
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+from app.ai.gateway import AIGateway
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched provider calls.
+
+    Texts submitted within max_wait_ms of each other (or until max_batch
+    texts are waiting) are embedded with one API request, and each caller
+    gets its own vector back.
+
+    Pending texts and the flush timer belong to the event loop that queued
+    them. Celery runs each task on a fresh loop, so when submit() sees a
+    different running loop it drops that state instead of waiting on a timer
+    that will never fire.
+    """
+
+    def __init__(self, ai: AIGateway, max_batch: int = 16, max_wait_ms: int = 10):
+        self.ai = ai
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str) -> list[float]:
+        """Queue text for the next batch and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._reset(loop)
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Forget state left behind by a previous (possibly closed) loop."""
+        if self._pending:
+            logger.warning(
+                "Dropping %d embedding requests from a previous event loop",
+                len(self._pending),
+            )
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self._loop = loop
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._embed(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            embeddings = await self.ai.get_embeddings([text for text, _ in batch])
+        except Exception as e:
+            logger.warning("Embedding batch of %d failed: %s", len(batch), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+
+# Batchers per event loop, then per API key (BYOK requests can't share a
+# provider client). Loops are weakly referenced so per-task Celery loops are
+# forgotten once closed, and each loop keeps only its most recently used keys.
+_BATCHERS_PER_LOOP = 256
+
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[Optional[str], EmbeddingBatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_embedding_batcher(api_key: Optional[str]) -> EmbeddingBatcher:
+    """Return the shared embedding batcher for an API key on the running loop."""
+    loop = asyncio.get_running_loop()
+    batchers = _batchers.get(loop)
+    if batchers is None:
+        batchers = OrderedDict()
+        _batchers[loop] = batchers
+
+    batcher = batchers.get(api_key)
+    if batcher is None:
+        batcher = EmbeddingBatcher(AIGateway(api_key))
+        batchers[api_key] = batcher
+        while len(batchers) > _BATCHERS_PER_LOOP:
+            batchers.popitem(last=False)
+    else:
+        batchers.move_to_end(api_key)
+    return batcher
@@ -96,3 +96,7 @@ class AIGateway:
     async def get_embedding(self, text: str) -> list[float]:
         """Get embedding vector for text."""
         return await self._provider.get_embedding(text)
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embedding vectors for several texts in one provider call."""
+        return await self._provider.get_embeddings(texts)
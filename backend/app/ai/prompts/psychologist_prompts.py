@@ -18,10 +18,18 @@ def get_phase_prompt(phase: ConversationPhase) -> str:
     return PHASE_PROMPTS.get(phase, PHASE_PROMPTS[ConversationPhase.OPENING])
 
 
+def format_recent_history(chat_history: list[dict]) -> str:
+    """Format the last 10 messages as "ROLE: content" lines."""
+    return "\n".join(
+        [f"{msg['role'].upper()}: {msg['content']}" for msg in chat_history[-10:]]
+    )
+
+
 def build_psychologist_system_prompt(
     state: PsychologistConversationState,
     situation_text: str,
     chat_history: list[dict],
+    recent_history: str | None = None,
 ) -> str:
     """Build the complete system prompt for the psychologist coach.
 
@@ -30,6 +38,9 @@ def build_psychologist_system_prompt(
     2. Phase-specific instructions
     3. Current state context (threads, observations, etc.)
     4. Move requirements and constraints
+
+    recent_history is the output of format_recent_history, for callers that
+    formatted it ahead of time; it is formatted here when omitted.
     """
     # Core identity
     core = PSYCHOLOGIST_CORE_IDENTITY
@@ -44,10 +55,11 @@ def build_psychologist_system_prompt(
     constraints = _build_constraints(state)
 
     # Conversation history summary
-    num_exchanges = len([m for m in chat_history if m.get("role") == "user"])
-    history_str = "\n".join(
-        [f"{msg['role'].upper()}: {msg['content']}" for msg in chat_history[-10:]]
-    )
+    # The state keeps the user messages seen so far, so only new ones are scanned
+    user_messages = state.user_history_lower(chat_history)
+    num_exchanges = len(user_messages)
+    if recent_history is None:
+        recent_history = format_recent_history(chat_history)
 
     return f"""{core}
 
@@ -64,7 +76,7 @@ Exchanges: {num_exchanges} | Phase: {state.current_phase.value.upper()} ({state.
 {constraints}
 
 ## Recent Conversation
-{history_str}
+{recent_history}
 
 ## Response Format
 {RESPONSE_FORMAT}
@@ -151,16 +163,14 @@ def _build_constraints(state: PsychologistConversationState) -> str:
         )
 
     # Move variety requirement
-    recent_moves = state.move_history[-3:] if len(state.move_history) >= 3 else state.move_history
-    if recent_moves.count(ResponseMove.DEEPENING_QUESTION) >= 2:
+    if state.move_history[-3:].count(ResponseMove.DEEPENING_QUESTION) >= 2:
         constraints.append(
             "VARIETY: You've asked 2+ questions in a row. "
             "Include a REFLECTION or SYNTHESIS before the next question."
         )
 
     # Challenge limit
-    challenge_count = state.move_history.count(ResponseMove.CHALLENGE)
-    if challenge_count >= 1:
+    if ResponseMove.CHALLENGE in state.move_history:
         constraints.append(
             "CHALLENGE LIMIT: You've already made 1 challenge. "
             "Do not make another challenge in this conversation."
@@ -3,5 +3,12 @@
 from .base import LLMProvider
 from .openai_provider import OpenAIProvider
 from .ollama_provider import OllamaProvider
+from .http_client import get_http_client, close_http_client
 
-__all__ = ["LLMProvider", "OpenAIProvider", "OllamaProvider"]
+__all__ = [
+    "LLMProvider",
+    "OpenAIProvider",
+    "OllamaProvider",
+    "get_http_client",
+    "close_http_client",
+]
@@ -50,6 +50,21 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Get embedding vectors for several texts.
+
+        Providers whose API accepts batched input should override this to
+        embed all texts in one request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        return [await self.get_embedding(text) for text in texts]
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -0,0 +1,37 @@
+"""Shared HTTP connection pool for LLM provider clients."""
+
+from typing import Optional
+
+import httpx
+
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client used by all provider SDK clients.
+
+    Providers are constructed per request (and per API key), but they all
+    share this client so keep-alive connections and TLS sessions are reused
+    instead of being re-established on every LLM call. HTTP/2 lets
+    concurrent calls to the same host multiplex over one connection.
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
@@ -1,7 +1,6 @@
 """Ollama LLM provider implementation using OpenAI-compatible API."""
 
 import hashlib
-import json
 import logging
 import time
 from typing import TypeVar, Type
@@ -10,6 +9,8 @@ from openai import OpenAI
 from pydantic import BaseModel, ValidationError
 
 from .base import LLMProvider
+from .http_client import get_http_client
+from app.ai.validators import is_invalid_json
 from app.config import get_settings
 from app.logging_config import sanitize_api_key, truncate_text
 
@@ -44,6 +45,7 @@ class OllamaProvider(LLMProvider):
         self.client = OpenAI(
             base_url=base_url,
             api_key="ollama",  # Dummy key - Ollama ignores this
+            http_client=get_http_client(),
         )
         self.model = model
         self.embedding_model = embedding_model
@@ -136,26 +138,9 @@ class OllamaProvider(LLMProvider):
                     "provider": self.provider_name,
                 }
 
-                # Parse JSON
+                # Parse JSON and validate against Pydantic model in one pass
                 try:
-                    data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"JSON parse error (attempt {attempt + 1}): {e}")
-                    if attempt < max_retries:
-                        messages.append({"role": "assistant", "content": content})
-                        messages.append({
-                            "role": "user",
-                            "content": (
-                                f"Your response was not valid JSON. Error: {e}. "
-                                "Please fix and return ONLY valid JSON, no other text."
-                            ),
-                        })
-                        continue
-                    raise ValueError(f"Failed to parse JSON after {max_retries + 1} attempts")
-
-                # Validate against Pydantic model
-                try:
-                    validated = response_model.model_validate(data)
+                    validated = response_model.model_validate_json(content)
 
                     duration = time.time() - start_time
                     input_tokens = metadata.get("input_tokens", 0)
@@ -171,6 +156,20 @@ class OllamaProvider(LLMProvider):
                     )
                     return validated, metadata
                 except ValidationError as e:
+                    if is_invalid_json(e):
+                        logger.warning(f"JSON parse error (attempt {attempt + 1}): {e}")
+                        if attempt < max_retries:
+                            messages.append({"role": "assistant", "content": content})
+                            messages.append({
+                                "role": "user",
+                                "content": (
+                                    f"Your response was not valid JSON. Error: {e}. "
+                                    "Please fix and return ONLY valid JSON, no other text."
+                                ),
+                            })
+                            continue
+                        raise ValueError(f"Failed to parse JSON after {max_retries + 1} attempts")
+
                     logger.warning(f"Validation error (attempt {attempt + 1}): {e}")
                     if attempt < max_retries:
                         messages.append({"role": "assistant", "content": content})
@@ -225,3 +224,15 @@ class OllamaProvider(LLMProvider):
             # Return empty embedding if Ollama doesn't support the embedding model
             # This allows the app to work without embeddings
             return []
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embedding vectors for several texts in one Ollama request."""
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=texts,
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+        except Exception as e:
+            logger.warning(f"Ollama embedding failed: {e}. Returning empty vectors.")
+            return [[] for _ in texts]
@@ -1,7 +1,6 @@
 """OpenAI LLM provider implementation."""
 
 import hashlib
-import json
 import logging
 import time
 from typing import TypeVar, Type
@@ -10,6 +9,8 @@ from openai import OpenAI
 from pydantic import BaseModel, ValidationError
 
 from .base import LLMProvider
+from .http_client import get_http_client
+from app.ai.validators import is_invalid_json
 from app.config import get_settings
 from app.logging_config import sanitize_api_key, truncate_text
 
@@ -30,7 +31,7 @@ class OpenAIProvider(LLMProvider):
             model: Model name for chat completions
             embedding_model: Model name for embeddings
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=get_http_client())
         self.model = model
         self.embedding_model = embedding_model
         self._api_key = api_key  # Store for logging (will be sanitized)
@@ -91,23 +92,9 @@ class OpenAIProvider(LLMProvider):
                     "provider": self.provider_name,
                 }
 
-                # Parse JSON
+                # Parse JSON and validate against Pydantic model in one pass
                 try:
-                    data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"JSON parse error (attempt {attempt + 1}): {e}")
-                    if attempt < max_retries:
-                        messages.append({"role": "assistant", "content": content})
-                        messages.append({
-                            "role": "user",
-                            "content": f"Your response was not valid JSON. Error: {e}. Please fix and return valid JSON.",
-                        })
-                        continue
-                    raise ValueError(f"Failed to parse JSON after {max_retries + 1} attempts")
-
-                # Validate against Pydantic model
-                try:
-                    validated = response_model.model_validate(data)
+                    validated = response_model.model_validate_json(content)
 
                     duration = time.time() - start_time
                     input_tokens = metadata.get("input_tokens", 0)
@@ -123,6 +110,17 @@ class OpenAIProvider(LLMProvider):
                     )
                     return validated, metadata
                 except ValidationError as e:
+                    if is_invalid_json(e):
+                        logger.warning(f"JSON parse error (attempt {attempt + 1}): {e}")
+                        if attempt < max_retries:
+                            messages.append({"role": "assistant", "content": content})
+                            messages.append({
+                                "role": "user",
+                                "content": f"Your response was not valid JSON. Error: {e}. Please fix and return valid JSON.",
+                            })
+                            continue
+                        raise ValueError(f"Failed to parse JSON after {max_retries + 1} attempts")
+
                     logger.warning(f"Validation error (attempt {attempt + 1}): {e}")
                     if attempt < max_retries:
                         messages.append({"role": "assistant", "content": content})
@@ -153,3 +151,11 @@ class OpenAIProvider(LLMProvider):
             input=text,
         )
         return response.data[0].embedding
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embedding vectors for several texts in one OpenAI request."""
+        response = self.client.embeddings.create(
+            model=self.embedding_model,
+            input=texts,
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
@@ -1,10 +1,18 @@
-import json
 from typing import Type, TypeVar
 from pydantic import BaseModel, ValidationError
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def is_invalid_json(error: ValidationError) -> bool:
+    """Check if a model_validate_json error came from malformed JSON.
+
+    model_validate_json parses and validates in one pass; this tells a JSON
+    syntax error apart from a schema mismatch.
+    """
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
 def validate_json_response(
     content: str, model: Type[T], raise_on_error: bool = True
 ) -> T | None:
@@ -20,16 +28,13 @@ def validate_json_response(
         Validated model instance or None if validation fails and raise_on_error is False
     """
     try:
-        data = json.loads(content)
-        return model.model_validate(data)
-    except json.JSONDecodeError as e:
-        if raise_on_error:
-            raise ValueError(f"Invalid JSON: {e}")
-        return None
+        return model.model_validate_json(content)
     except ValidationError as e:
-        if raise_on_error:
-            raise ValueError(f"Schema validation failed: {e}")
-        return None
+        if not raise_on_error:
+            return None
+        if is_invalid_json(e):
+            raise ValueError(f"Invalid JSON: {e}")
+        raise ValueError(f"Schema validation failed: {e}")
 
 
 def extract_json_from_text(text: str) -> str | None:
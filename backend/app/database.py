@@ -1,3 +1,4 @@
+import json
 import os
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
@@ -5,9 +6,26 @@ from sqlalchemy.pool import StaticPool
 
 from app.config import get_settings
 
+# Optional C JSON encoder (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 settings = get_settings()
 
 
+if orjson is not None:
+    def json_serializer(value) -> str:
+        """Serialize a JSON column value with orjson."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    json_deserializer = orjson.loads
+else:
+    json_serializer = json.dumps
+    json_deserializer = json.loads
+
+
 def _create_engine():
     """Create database engine based on configuration."""
     db_url = settings.effective_database_url
@@ -22,6 +40,8 @@ def _create_engine():
         return create_async_engine(
             db_url,
             echo=False,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
             # SQLite requires special handling for async
             connect_args={"check_same_thread": False},
             # Use StaticPool for SQLite to avoid connection issues
@@ -32,7 +52,16 @@ def _create_engine():
         return create_async_engine(
             db_url,
             echo=False,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
             pool_pre_ping=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            # Reuse server-side prepared statements for repeated query shapes
+            connect_args={
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+                "statement_cache_size": settings.db_statement_cache_size,
+            },
         )
 
 
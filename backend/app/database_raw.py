@@ -0,0 +1,90 @@
+"""Raw asyncpg connection pool for hot read paths.
+
+SQLAlchemy's AsyncSession (unit of work, identity map, ORM row processing)
+is kept for writes. Simple read-only selects on hot endpoints can go straight
+to asyncpg instead. The pool only exists when running on PostgreSQL with
+asyncpg installed; callers must fall back to the ORM when it is None.
+"""
+
+import logging
+
+from app.config import get_settings
+from app.database import json_deserializer, json_serializer
+
+# Binary pgvector codec for asyncpg (optional, needs pgvector installed)
+try:
+    from pgvector.asyncpg import register_vector
+    VECTOR_CODEC_AVAILABLE = True
+except ImportError:
+    register_vector = None
+    VECTOR_CODEC_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_raw_pool = None
+
+
+def get_raw_db_url(async_url: str) -> str:
+    """Convert SQLAlchemy async database URL to a plain asyncpg DSN.
+
+    Converts postgresql+asyncpg:// to postgresql://
+    """
+    return async_url.replace("postgresql+asyncpg://", "postgresql://")
+
+
+async def _init_connection(conn) -> None:
+    """Set up per-connection type codecs.
+
+    JSON/JSONB columns are decoded to Python objects like the ORM does, and
+    pgvector values are sent and received in binary instead of as text
+    literals that the server has to parse.
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json_serializer,
+            decoder=json_deserializer,
+            schema="pg_catalog",
+        )
+    if VECTOR_CODEC_AVAILABLE and settings.use_vector_memory:
+        await register_vector(conn)
+
+
+async def init_raw_pool():
+    """Create the raw asyncpg pool (PostgreSQL only)."""
+    global _raw_pool
+
+    if settings.database_type == "sqlite" or _raw_pool is not None:
+        return _raw_pool
+
+    try:
+        import asyncpg
+    except ImportError:
+        logger.warning("asyncpg not installed, hot reads will use the ORM")
+        return None
+
+    # Opened on top of the SQLAlchemy pool; see the pool settings in config
+    _raw_pool = await asyncpg.create_pool(
+        get_raw_db_url(settings.effective_database_url),
+        min_size=settings.raw_pool_min_size,
+        max_size=settings.raw_pool_max_size,
+        max_queries=50000,
+        init=_init_connection,
+    )
+    return _raw_pool
+
+
+def get_raw_pool():
+    """Return the raw asyncpg pool, or None if hot reads should use the ORM."""
+    return _raw_pool
+
+
+async def close_raw_pool() -> None:
+    """Close the raw asyncpg pool (application shutdown)."""
+    global _raw_pool
+
+    if _raw_pool is not None:
+        await _raw_pool.close()
+        _raw_pool = None
@@ -40,6 +40,20 @@ class GuardrailChecker:
         (r"emotional\s+dump", "Emotional dumping early on"),
     ]
 
+    # Compiled once: (pattern, compiled, severity, description) in check order
+    _COMPILED_PATTERNS = [
+        (pattern, re.compile(pattern), "error", description)
+        for pattern, description in HARD_REJECT_PATTERNS
+    ] + [
+        (pattern, re.compile(pattern), "warning", description)
+        for pattern, description in WARNING_PATTERNS
+    ]
+
+    # Any pattern at all; most fields match nothing and need only this scan
+    _ANY_PATTERN = re.compile(
+        "|".join(f"(?:{pattern})" for pattern, _ in HARD_REJECT_PATTERNS + WARNING_PATTERNS)
+    )
+
     # Maximum words for scripts to prevent wall-of-text
     MAX_SCRIPT_WORDS = 75
 
@@ -89,26 +103,16 @@ class GuardrailChecker:
         """Check a text field against patterns."""
         violations = []
         text_lower = text.lower()
+        if not self._ANY_PATTERN.search(text_lower):
+            return violations
 
-        # Check hard reject patterns
-        for pattern, description in self.HARD_REJECT_PATTERNS:
-            if re.search(pattern, text_lower):
-                violations.append(
-                    GuardrailViolation(
-                        rule=pattern,
-                        severity="error",
-                        description=description,
-                        field=field,
-                    )
-                )
-
-        # Check warning patterns
-        for pattern, description in self.WARNING_PATTERNS:
-            if re.search(pattern, text_lower):
+        # Check hard reject patterns, then warning patterns
+        for pattern, compiled, severity, description in self._COMPILED_PATTERNS:
+            if compiled.search(text_lower):
                 violations.append(
                     GuardrailViolation(
                         rule=pattern,
-                        severity="warning",
+                        severity=severity,
                         description=description,
                         field=field,
                     )
@@ -121,6 +125,10 @@ class GuardrailChecker:
         return any(v.severity == "error" for v in violations)
 
 
+# The checker holds no per-call state, so one instance serves every call
+_checker = GuardrailChecker()
+
+
 def check_move_guardrails(
     move: Move, additional_guardrails: list[str] = None
 ) -> tuple[bool, list[GuardrailViolation]]:
@@ -130,7 +138,6 @@ def check_move_guardrails(
     Returns:
         Tuple of (is_valid, violations)
     """
-    checker = GuardrailChecker()
-    violations = checker.check_move(move, additional_guardrails)
-    is_valid = not checker.has_errors(violations)
+    violations = _checker.check_move(move, additional_guardrails)
+    is_valid = not _checker.has_errors(violations)
     return is_valid, violations
@@ -37,9 +37,23 @@ async def lifespan(app: FastAPI):
         await init_db()
         print("Database initialized")
 
+    # Raw asyncpg pool for hot read paths (PostgreSQL only)
+    from app.database_raw import close_raw_pool, init_raw_pool
+    if await init_raw_pool():
+        print("Raw read pool enabled")
+
+    # Batch decision event writes (PostgreSQL only)
+    from app.services.event_log_batcher import start_event_log_batcher, stop_event_log_batcher
+    if start_event_log_batcher():
+        print("Event log batching enabled")
+
     yield
     # Shutdown
     print("Shutting down Decision Canvas API")
+    await stop_event_log_batcher()
+    await close_raw_pool()
+    from app.ai.providers import close_http_client
+    close_http_client()
 
 
 app = FastAPI(
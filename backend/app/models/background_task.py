@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Text, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -72,3 +72,19 @@ class BackgroundTask(Base):
     # Relationships
     decision: Mapped["Decision"] = relationship("Decision")
     node: Mapped["DecisionNode"] = relationship("DecisionNode")
+
+
+# Only the few tasks still processing are checked by stale-task cleanup
+Index(
+    "ix_background_tasks_stale",
+    BackgroundTask.started_at,
+    postgresql_where=BackgroundTask.status == TaskStatus.PROCESSING.value,
+    sqlite_where=BackgroundTask.status == TaskStatus.PROCESSING.value,
+)
+
+# Per-node listings, newest first
+Index(
+    "ix_background_tasks_node_created",
+    BackgroundTask.node_id,
+    BackgroundTask.created_at.desc(),
+)
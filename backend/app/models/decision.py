@@ -2,11 +2,11 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.types import UUIDType
+from app.models.types import UUIDType, uuid7
 
 
 class DecisionStatus(str, Enum):
@@ -27,9 +27,11 @@ class Decision(Base):
     """Decision model - represents a user's decision-making session."""
 
     __tablename__ = "decisions"
+    # Fetch server-generated updated_at via RETURNING instead of expiring it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUIDType, primary_key=True, default=uuid.uuid4
+        UUIDType, primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUIDType, ForeignKey("users.id"), nullable=False
@@ -44,7 +46,7 @@ class Decision(Base):
         DateTime(timezone=True), default=datetime.utcnow
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
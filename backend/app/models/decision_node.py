@@ -6,7 +6,7 @@ from sqlalchemy import String, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.types import UUIDType, JSONType
+from app.models.types import UUIDType, JSONType, uuid7
 
 
 class NodePhase(str, Enum):
@@ -32,7 +32,7 @@ class DecisionNode(Base):
     __tablename__ = "decision_nodes"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUIDType, primary_key=True, default=uuid.uuid4
+        UUIDType, primary_key=True, default=uuid7
     )
     decision_id: Mapped[uuid.UUID] = mapped_column(
         UUIDType, ForeignKey("decisions.id", ondelete="CASCADE"), nullable=False
@@ -5,7 +5,7 @@ from sqlalchemy import String, Text, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.types import UUIDType, JSONType
+from app.models.types import UUIDType, JSONType, uuid7
 from app.config import get_settings
 
 # Conditionally import pgvector (only for PostgreSQL)
@@ -27,7 +27,7 @@ class Memory(Base):
     __tablename__ = "memories"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUIDType, primary_key=True, default=uuid.uuid4
+        UUIDType, primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUIDType, ForeignKey("users.id"), nullable=False
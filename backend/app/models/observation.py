@@ -5,11 +5,13 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from enum import Enum
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy import Computed, String, Text, DateTime, ForeignKey, Integer, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.config import get_settings
 from app.database import Base
-from app.models.types import UUIDType, JSONType
+from app.models.types import UUIDType, JSONType, uuid7
+from app.models.memory import Vector, VECTOR_AVAILABLE
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -43,7 +45,7 @@ class Observation(Base):
     __tablename__ = "user_observations"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUIDType, primary_key=True, default=uuid.uuid4
+        UUIDType, primary_key=True, default=uuid7
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUIDType, ForeignKey("users.id"), nullable=False
@@ -134,3 +136,27 @@ class Observation(Base):
         }
         prefix = prefix_map.get(self.observation_type, "I notice")
         return f"{prefix} {self.observation_text}"
+
+
+# Add embedding column if pgvector is available. Deferred: only the raw
+# similarity SQL reads it, so ORM selects skip the 1536-float vector.
+if VECTOR_AVAILABLE:
+    Observation.embedding = mapped_column(Vector(1536), nullable=True, deferred=True)
+
+# Full-text search over the observation and its theme/tags (PostgreSQL only).
+# The text is weighted above theme and tags for ts_rank_cd.
+FULL_TEXT_AVAILABLE = get_settings().database_type == "postgresql"
+
+if FULL_TEXT_AVAILABLE:
+    from sqlalchemy.dialects.postgresql import TSVECTOR
+
+    Observation.search_tsv = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', observation_text), 'A') || "
+            "setweight(to_tsvector('english', coalesce(related_theme, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(tags, '[]'::jsonb)), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
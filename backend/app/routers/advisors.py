@@ -172,7 +172,6 @@ async def create_advisor(
 
     db.add(advisor)
     await db.commit()
-    await db.refresh(advisor)
 
     # Add to the registry for immediate use
     registry = get_registry()
@@ -238,7 +237,6 @@ async def update_advisor(
         advisor.is_active = request.is_active
 
     await db.commit()
-    await db.refresh(advisor)
 
     # Update in registry
     registry = get_registry()
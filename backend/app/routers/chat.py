@@ -1,13 +1,13 @@
 """Chat router for Decision Canvas API."""
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 from typing import Optional
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
 from app.dependencies import get_openai_api_key
-from app.services.chat_service import ChatService
+from app.services.chat_service import ChatService, needs_history_compaction
 from app.services.decision_service import DecisionService
 from app.schemas.canvas import ChatRequest, ChatResponse, CanvasState, Option, CommitPlan, ChatMessage
 from app.schemas.decision import DecisionResponse, DecisionNodeResponse
@@ -15,6 +15,15 @@ from app.schemas.decision import DecisionResponse, DecisionNodeResponse
 router = APIRouter(prefix="/decisions", tags=["chat"])
 
 
+async def _compact_chat_history(node_id: uuid.UUID, api_key: str) -> None:
+    """Compact a node's chat history after the response has been sent.
+
+    Uses its own session: the request's session is closed by then.
+    """
+    async with AsyncSessionLocal() as db:
+        await ChatService(db, api_key).compact_chat_history(node_id)
+
+
 class StartDecisionRequest(BaseModel):
     """Request to start a new decision."""
     situation_text: str = Field(..., min_length=10, max_length=5000)
@@ -81,6 +90,7 @@ async def send_chat_message(
     decision_id: uuid.UUID,
     node_id: uuid.UUID,
     request: ChatRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(get_openai_api_key),
 ):
@@ -103,6 +113,8 @@ async def send_chat_message(
 
     # Process message
     response = await chat_service.send_message(node, request.message)
+    if needs_history_compaction(node.chat_messages_json):
+        background_tasks.add_task(_compact_chat_history, node.id, api_key)
 
     return response
 
@@ -193,6 +205,7 @@ async def submit_answers(
     decision_id: uuid.UUID,
     node_id: uuid.UUID,
     answers: dict,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     api_key: str = Depends(get_openai_api_key),
 ):
@@ -220,5 +233,7 @@ async def submit_answers(
         node,
         "I've answered the questions. Can you generate options for me?"
     )
+    if needs_history_compaction(node.chat_messages_json):
+        background_tasks.add_task(_compact_chat_history, node.id, api_key)
 
     return response
@@ -42,7 +42,7 @@ async def create_decision(
 
     # Get the decision
     decision_service = DecisionService(db)
-    decision = await decision_service.get_decision(node.decision_id)
+    decision = await decision_service.get_decision(node.decision_id, with_nodes=True)
 
     return Phase1APIResponse(
         decision=DecisionResponse.model_validate(decision),
@@ -63,7 +63,7 @@ async def list_decisions(
     user_id = uuid.UUID(settings.default_user_id)
 
     service = DecisionService(db)
-    decisions = await service.get_decisions_for_user(user_id)
+    decisions = await service.get_decisions_for_user_readonly(user_id)
 
     return [DecisionResponse.model_validate(d) for d in decisions]
 
@@ -75,7 +75,7 @@ async def get_decision(
 ):
     """Get a decision by ID with all nodes."""
     service = DecisionService(db)
-    decision = await service.get_decision(decision_id)
+    decision = await service.get_decision_readonly(decision_id)
 
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
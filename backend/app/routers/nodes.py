@@ -141,14 +141,8 @@ async def create_branch(
         mood_state=node.mood_state,
         metadata_json=node.metadata_json,
         policy_version=node.policy_version,
-    )
-
-    # Log event
-    await decision_service.log_event(
-        decision_id=decision_id,
-        node_id=branch_node.id,
         event_type="branched",
-        payload={"parent_node_id": str(node_id)},
+        event_payload={"parent_node_id": str(node_id)},
     )
 
     return DecisionNodeResponse.model_validate(branch_node)
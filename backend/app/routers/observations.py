@@ -193,7 +193,7 @@ async def generate_observations(
 
     # Get the decision and its chat messages
     decision_service = DecisionService(db)
-    decision = await decision_service.get_decision(decision_id)
+    decision = await decision_service.get_decision(decision_id, with_nodes=True)
 
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
@@ -114,7 +114,7 @@ async def update_profile(
     profile.context_summary_updated_at = None
 
     await db.commit()
-    await db.refresh(profile)
+    await service.invalidate_cached_summary(user_id)
 
     return ProfileResponse(
         id=str(profile.id),
@@ -64,3 +64,45 @@ class ExecutionPlanResponse(BaseModel):
     exact_message: str
     exit_line: str
     boundary_rule: str
+
+
+class ChatSummaryResponse(BaseModel):
+    """Expected response from AI when compacting older chat history."""
+
+    summary: str = Field(..., description="Condensed summary of the earlier conversation")
+
+
+class ClarifyChatResponse(BaseModel):
+    """Expected response from AI for the fallback clarify-phase chat prompt."""
+
+    response: str
+    question_reason: Optional[str] = Field(
+        None, description="Why this question matters (shown as tooltip)"
+    )
+    suggested_options: Optional[list[str]] = Field(
+        None, description="Quick reply options for the user"
+    )
+    canvas_state: Optional[dict] = None
+    ready_for_options: bool = False
+
+
+class OptionsChatResponse(BaseModel):
+    """Expected response from AI for options-phase chat."""
+
+    response: str
+    user_chose_option: Optional[str] = None
+    canvas_state_update: Optional[dict] = None
+
+
+class GeneralChatResponse(BaseModel):
+    """Expected response from AI for execute-phase (general) chat."""
+
+    response: str
+    canvas_state_update: Optional[dict] = None
+
+
+class CommitPlanResponse(BaseModel):
+    """Expected response from AI for commit plan generation."""
+
+    commit_plan: dict
+    canvas_state_update: Optional[dict] = None
@@ -86,6 +86,14 @@ class CanvasState(BaseModel):
     risks: list[Risk] = Field(default_factory=list, description="Identified risks")
     next_action: Optional[str] = Field(None, description="Next action to take")
 
+    @property
+    def has_hard_constraint(self) -> bool:
+        """Whether any constraint is hard.
+
+        Not cached: answers extend ``constraints`` in place.
+        """
+        return any(c.type == "hard" for c in self.constraints)
+
     class Config:
         json_schema_extra = {
             "example": {
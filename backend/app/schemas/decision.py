@@ -91,6 +91,7 @@ class DecisionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     nodes: list[DecisionNodeResponse] = []
+    node_count: Optional[int] = None  # Set on listings that omit nodes
 
     class Config:
         from_attributes = True
@@ -5,10 +5,30 @@ which transforms conversations from shallow "survey bot" questioning into
 genuine decision coaching with phases, thread tracking, and forced synthesis.
 """
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+def _extend_listing(
+    cached: tuple[Optional[list], int, str],
+    items: list,
+    format_item: Callable[[Any], str],
+) -> tuple[list, int, str]:
+    """Bring a cached newline-joined listing of an append-only list up to date.
+
+    cached is (the list, items already listed, text). A different list
+    object or a shorter list is listed again from scratch.
+    """
+    listed, count, text = cached
+    if listed is not items or len(items) < count:
+        count, text = 0, ""
+    if len(items) > count:
+        new_lines = "\n".join(format_item(item) for item in items[count:])
+        text = f"{text}\n{new_lines}" if text else new_lines
+    return items, len(items), text
 
 
 class ConversationPhase(str, Enum):
@@ -98,6 +118,18 @@ class Thread(BaseModel):
         description="AI's notes about what this thread reveals"
     )
 
+    # (topic, topic.lower()), recomputed only when topic is reassigned
+    _topic_lower: tuple = PrivateAttr(default=(None, ""))
+
+    @property
+    def topic_lower(self) -> str:
+        """Lowercased topic, used to de-duplicate threads."""
+        topic, lowered = self._topic_lower
+        if topic is not self.topic:
+            lowered = self.topic.lower()
+            self._topic_lower = (self.topic, lowered)
+        return lowered
+
     def compute_priority_score(self, current_exchange: int) -> float:
         """Compute thread priority score for selection.
 
@@ -168,6 +200,18 @@ class Observation(BaseModel):
         description="Did user agree with the observation?"
     )
 
+    # (text, text.lower()), recomputed only when text is reassigned
+    _text_lower: tuple = PrivateAttr(default=(None, ""))
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased text, used to de-duplicate observations."""
+        text, lowered = self._text_lower
+        if text is not self.text:
+            lowered = self.text.lower()
+            self._text_lower = (self.text, lowered)
+        return lowered
+
 
 class PsychologistConversationState(BaseModel):
     """Complete state for psychologist-style conversation.
@@ -261,6 +305,82 @@ class PsychologistConversationState(BaseModel):
         description="Why we're transitioning to options"
     )
 
+    # Significant-word counts over the user messages already analyzed, kept
+    # up to date by pattern detection so each turn only scans new messages
+    user_theme_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Counts of emotionally significant words in user messages"
+    )
+    user_theme_history_len: int = Field(
+        default=0,
+        description="Number of chat history entries included in user_theme_counts"
+    )
+
+    # Lowercased user messages seen by pattern detection (not persisted)
+    _user_messages_lower: list[str] = PrivateAttr(default_factory=list)
+    _user_history_len: int = PrivateAttr(default=0)
+
+    def user_history_lower(self, chat_history: list[dict]) -> list[str]:
+        """Return lowercased user messages from chat_history.
+
+        Only messages appended since the last call are processed, so the
+        returned list is shared and must not be modified by callers. A
+        shorter history than last time is treated as a new conversation.
+        """
+        # Private attributes go through pydantic's __getattr__, so read them once
+        messages, start = self._user_messages_lower, self._user_history_len
+        if len(chat_history) < start:
+            messages, start = [], 0
+            self._user_messages_lower = messages
+
+        messages.extend(
+            m["content"].lower() for m in chat_history[start:] if m.get("role") == "user"
+        )
+        self._user_history_len = len(chat_history)
+        return messages
+
+    # Prompt listings of threads and observations, as (list, items seen, text).
+    # Both lists are only ever appended to, so new items extend the text.
+    _known_threads_text: tuple = PrivateAttr(default=(None, 0, ""))
+    _known_observations_text: tuple = PrivateAttr(default=(None, 0, ""))
+
+    def known_threads_text(self) -> str:
+        """Return active threads as "- topic (type)" lines for prompts."""
+        self._known_threads_text = _extend_listing(
+            self._known_threads_text,
+            self.active_threads,
+            lambda t: f"- {t.topic} ({t.type.value})",
+        )
+        return self._known_threads_text[2]
+
+    def known_observations_text(self) -> str:
+        """Return observations as "- [type] text" lines for prompts."""
+        self._known_observations_text = _extend_listing(
+            self._known_observations_text,
+            self.observations,
+            lambda o: f"- [{o.type}] {o.text}",
+        )
+        return self._known_observations_text[2]
+
+    # Membership set for synthesis_points, as (list, items seen, set)
+    _synthesis_points_seen: tuple = PrivateAttr(default=(None, 0, None))
+
+    def add_synthesis_points(self, points: list[str]) -> None:
+        """Append points not already in synthesis_points, keeping their order.
+
+        The set is rebuilt whenever synthesis_points was replaced or changed
+        outside this method, e.g. after the state is loaded from storage.
+        """
+        listed, count, seen = self._synthesis_points_seen
+        items = self.synthesis_points
+        if listed is not items or len(items) != count:
+            seen = set(items)
+        for point in points:
+            if point not in seen:
+                seen.add(point)
+                items.append(point)
+        self._synthesis_points_seen = (items, len(items), seen)
+
     def needs_synthesis(self) -> bool:
         """Check if synthesis is required before next question.
 
@@ -334,7 +454,7 @@ class PsychologistConversationState(BaseModel):
                 "min_exchanges": 1,
                 "max_exchanges": 3,
                 "conditions": [
-                    ("insight_given", ResponseMove.INSIGHT in self.move_history[-3:] if len(self.move_history) >= 1 else False),
+                    ("insight_given", ResponseMove.INSIGHT in self.move_history[-3:]),
                 ]
             },
             ConversationPhase.CLOSING: {
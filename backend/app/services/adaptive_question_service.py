@@ -87,14 +87,15 @@ class AdaptiveQuestionService:
         question_pool.extend(heuristic_questions)
 
         # Calculate VoI scores for all questions
-        for question in question_pool:
-            question.voi_score = self.scorer.score_question(
-                question, initial_canvas, ConversationState(
-                    mode=mode,
-                    question_cap=5 if mode == QuestioningMode.QUICK else 15,
-                    canvas_state=initial_canvas.model_dump(),
-                )
+        scores = self.scorer.score_questions(
+            question_pool, initial_canvas, ConversationState(
+                mode=mode,
+                question_cap=5 if mode == QuestioningMode.QUICK else 15,
+                canvas_state=initial_canvas.model_dump(),
             )
+        )
+        for question, score in scores:
+            question.voi_score = score
 
         # Sort by VoI score (descending)
         question_pool.sort(key=lambda q: q.voi_score, reverse=True)
@@ -209,20 +210,19 @@ class AdaptiveQuestionService:
             if q.id not in [qa.question.id for qa in conversation_state.asked_questions]
         ]
 
-        for question in remaining_questions:
-            question.voi_score = self.scorer.score_question(
-                question, CanvasState(**updated_canvas), conversation_state
-            )
-
-        # Sort by VoI score
-        remaining_questions.sort(key=lambda q: q.voi_score, reverse=True)
+        scores = self.scorer.score_questions(
+            remaining_questions, CanvasState(**updated_canvas), conversation_state
+        )
+        for question, score in scores:
+            question.voi_score = score
 
-        # Select next question (highest VoI above threshold)
-        next_question = None
-        for q in remaining_questions:
-            if q.voi_score >= self.MIN_VOI_THRESHOLD:
-                next_question = q
-                break
+        # Select next question (highest VoI above threshold); ties go to the
+        # earliest candidate
+        next_question = max(
+            remaining_questions, key=lambda q: q.voi_score, default=None
+        )
+        if next_question and next_question.voi_score < self.MIN_VOI_THRESHOLD:
+            next_question = None
 
         if not next_question:
             # All remaining questions have low VoI - stop
@@ -86,7 +86,7 @@ class CalibrationService:
         decision = await self.decision_service.get_decision(node.decision_id)
         if decision:
             decision.status = DecisionStatus.RESOLVED.value
-            await self.db.commit()
+        await self.db.commit()
 
         # Log event
         await self.decision_service.log_event(
@@ -100,7 +100,6 @@ class CalibrationService:
             },
         )
 
-        await self.db.refresh(outcome)
         return outcome
 
     async def get_calibration_model(
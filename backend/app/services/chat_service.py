@@ -1,8 +1,10 @@
 """Chat service for Decision Canvas conversational flow."""
+import logging
 import uuid
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -17,6 +19,15 @@ from app.ai.advisors.registry import get_advisor, Advisor
 from app.ai.advisors.prompts.core_personality import build_enhanced_system_prompt
 from app.services.psychologist_engine import PsychologistEngine, create_initial_state
 from app.schemas.psychologist_state import PsychologistConversationState
+from app.schemas.ai_responses import (
+    Phase1Response,
+    Phase2Response,
+    ClarifyChatResponse,
+    OptionsChatResponse,
+    GeneralChatResponse,
+    CommitPlanResponse,
+    ChatSummaryResponse,
+)
 from app.schemas.canvas import (
     ChatMessage,
     CanvasState,
@@ -29,6 +40,18 @@ from app.services.decision_service import DecisionService
 from app.services.user_context_service import UserContextService
 from app.services.observation_service import ObservationService
 
+logger = logging.getLogger(__name__)
+
+# Once a node's transcript grows past this many messages, everything but the
+# most recent CHAT_HISTORY_KEEP_RECENT messages is folded into one summary entry.
+CHAT_HISTORY_COMPACT_THRESHOLD = 20
+CHAT_HISTORY_KEEP_RECENT = 10
+
+
+def needs_history_compaction(chat_messages: list[dict] | None) -> bool:
+    """Whether a transcript is long enough to be compacted after the turn."""
+    return len(chat_messages or []) > CHAT_HISTORY_COMPACT_THRESHOLD
+
 
 class ChatService:
     """Service for handling chat-based decision flow."""
@@ -42,6 +65,10 @@ class ChatService:
         self.user_context_service = UserContextService(db)
         self.observation_service = ObservationService(db, api_key)
         self.psychologist_engine = PsychologistEngine(self.ai)
+        self._phase_handlers = {
+            NodePhase.CLARIFY: self._handle_clarify_message,
+            NodePhase.MOVES: self._handle_options_message,
+        }
 
     async def start_decision(
         self,
@@ -53,13 +80,8 @@ class ChatService:
         Returns:
             Tuple of (decision, node, phase1_response)
         """
-        # Create decision
-        decision = await self.decision_service.create_decision(
-            user_id=user_id,
-            situation_text=situation_text,
-        )
-
-        # Get initial analysis from AI
+        # Get initial analysis from AI before touching the database, so the
+        # decision, its event and its first node are written in one commit
         phase1_response = await self._run_phase1(situation_text)
 
         # Create initial chat messages
@@ -78,9 +100,12 @@ class ChatService:
             },
         ]
 
-        # Create node with initial state
-        node = await self.decision_service.create_node(
-            decision_id=decision.id,
+        # Create decision (titled from the summary) with its initial node
+        decision, node = await self.decision_service.create_decision_with_node(
+            user_id=user_id,
+            situation_text=situation_text,
+            situation_type=phase1_response.get("decision_type", "other"),
+            title=phase1_response.get("summary", situation_text[:50]),
             phase=NodePhase.CLARIFY,
             state_json={
                 "summary": phase1_response.get("summary"),
@@ -91,11 +116,6 @@ class ChatService:
             canvas_state_json=phase1_response.get("canvas_state", {}),
         )
 
-        # Update decision with title from summary
-        decision.title = phase1_response.get("summary", situation_text[:50])
-        decision.situation_type = phase1_response.get("decision_type", "other")
-        await self.db.commit()
-
         return decision, node, phase1_response
 
     async def send_message(
@@ -131,35 +151,17 @@ class ChatService:
         chat_messages.append(user_msg)
 
         # Determine phase and get appropriate response using the selected advisor
+        # (EXECUTE and any unknown phase fall through to general conversation)
         phase = node.phase
-        response_data = {}
-
-        if phase == NodePhase.CLARIFY:
-            response_data = await self._handle_clarify_message(
-                node,
-                user_message,
-                chat_messages,
-                canvas_state,
-                questions,
-                advisor,
-                user_context,
-            )
-        elif phase == NodePhase.MOVES:
-            response_data = await self._handle_options_message(
-                chat_messages,
-                canvas_state,
-                options,
-                advisor,
-                user_context,
-            )
-        else:
-            # EXECUTE phase - general conversation
-            response_data = await self._handle_general_message(
-                chat_messages,
-                canvas_state,
-                advisor,
-                user_context,
-            )
+        handler = self._phase_handlers.get(phase, self._handle_general_message)
+        response_data = await handler(
+            node,
+            user_message,
+            chat_messages,
+            canvas_state,
+            advisor,
+            user_context,
+        )
 
         # Create assistant message with optional question metadata
         assistant_msg = {
@@ -249,19 +251,19 @@ class ChatService:
         try:
             parsed_canvas = CanvasState(**canvas_state) if canvas_state else CanvasState()
         except Exception as e:
-            print(f"[WARN] Failed to parse canvas_state: {e}, using empty")
+            logger.warning("Failed to parse canvas_state: %s, using empty", e)
             parsed_canvas = CanvasState()
 
         try:
             parsed_options = [Option(**o) for o in new_options] if new_options else None
         except Exception as e:
-            print(f"[WARN] Failed to parse options: {e}, using None")
+            logger.warning("Failed to parse options: %s, using None", e)
             parsed_options = None
 
         try:
             parsed_commit = CommitPlan(**commit_plan) if commit_plan else None
         except Exception as e:
-            print(f"[WARN] Failed to parse commit_plan: {e}, using None")
+            logger.warning("Failed to parse commit_plan: %s, using None", e)
             parsed_commit = None
 
         return ChatResponse(
@@ -344,19 +346,19 @@ class ChatService:
         try:
             parsed_canvas = CanvasState(**canvas_state) if canvas_state else CanvasState()
         except Exception as e:
-            print(f"[WARN] Failed to parse canvas_state: {e}, using empty")
+            logger.warning("Failed to parse canvas_state: %s, using empty", e)
             parsed_canvas = CanvasState()
 
         try:
             parsed_options = [Option(**o) for o in options] if options else None
         except Exception as e:
-            print(f"[WARN] Failed to parse options: {e}, using None")
+            logger.warning("Failed to parse options: %s, using None", e)
             parsed_options = None
 
         try:
             parsed_commit = CommitPlan(**commit_plan) if commit_plan else None
         except Exception as e:
-            print(f"[WARN] Failed to parse commit_plan: {e}, using None")
+            logger.warning("Failed to parse commit_plan: %s, using None", e)
             parsed_commit = None
 
         return ChatResponse(
@@ -374,8 +376,6 @@ class ChatService:
 
     async def _run_phase1(self, situation_text: str) -> dict:
         """Run Phase 1 analysis."""
-        from app.schemas.ai_responses import Phase1Response
-
         prompt = get_phase1_prompt(situation_text)
         response, _ = await self.ai.generate(
             system_prompt=CHAT_SYSTEM_PROMPT,
@@ -391,7 +391,6 @@ class ChatService:
         user_message: str,
         chat_messages: list[dict],
         canvas_state: dict,
-        questions: list[dict],
         advisor: Advisor,
         user_context: Optional[str] = None,
     ) -> dict:
@@ -404,9 +403,6 @@ class ChatService:
         - Pattern/contradiction detection
         - Response validation (no shallow "What kind of X?" questions)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Load or create psychologist conversation state
         psychologist_state = None
         if node.conversation_state_json:
@@ -415,7 +411,7 @@ class ChatService:
                     **node.conversation_state_json
                 )
             except Exception as e:
-                logger.warning(f"Failed to load psychologist state: {e}, creating new")
+                logger.warning("Failed to load psychologist state: %s, creating new", e)
                 psychologist_state = None
 
         if psychologist_state is None:
@@ -435,12 +431,15 @@ class ChatService:
             flag_modified(node, "conversation_state_json")
 
             # Log phase info for debugging
-            logger.info(
-                f"Psychologist: Phase={result.state.current_phase.value}, "
-                f"Move={result.response_move.value}, "
-                f"Threads={len(result.state.active_threads)}, "
-                f"Observations={len(result.state.observations)}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                state = result.state
+                logger.info(
+                    "Psychologist: Phase=%s, Move=%s, Threads=%d, Observations=%d",
+                    state.current_phase.value,
+                    result.response_move.value,
+                    len(state.active_threads),
+                    len(state.observations),
+                )
 
             # Build canvas state update from synthesis points
             canvas_update = {}
@@ -466,7 +465,7 @@ class ChatService:
 
         except Exception as e:
             # Fallback to original prompt-based approach if engine fails
-            logger.error(f"Psychologist engine failed: {e}, falling back to basic prompt")
+            logger.error("Psychologist engine failed: %s, falling back to basic prompt", e)
 
             prompt = get_chat_clarify_prompt(
                 node.decision.situation_text,
@@ -474,20 +473,6 @@ class ChatService:
                 canvas_state,
             )
 
-            from pydantic import BaseModel, Field
-            from typing import Optional as Opt
-
-            class ClarifyChatResponse(BaseModel):
-                response: str
-                question_reason: Opt[str] = Field(
-                    None, description="Why this question matters (shown as tooltip)"
-                )
-                suggested_options: Opt[list[str]] = Field(
-                    None, description="Quick reply options for the user"
-                )
-                canvas_state: Opt[dict] = None
-                ready_for_options: bool = False
-
             enhanced_prompt = build_enhanced_system_prompt(
                 advisor.system_prompt,
                 user_context=user_context,
@@ -504,23 +489,17 @@ class ChatService:
 
     async def _handle_options_message(
         self,
+        node: DecisionNode,
+        user_message: str,
         chat_messages: list[dict],
         canvas_state: dict,
-        options: list[dict],
         advisor: Advisor,
         user_context: Optional[str] = None,
     ) -> dict:
         """Handle a message during options phase using the selected advisor."""
+        options = (node.moves_json or {}).get("options", [])
         prompt = get_chat_options_prompt(chat_messages, canvas_state, options)
 
-        from pydantic import BaseModel
-        from typing import Optional as Opt
-
-        class OptionsChatResponse(BaseModel):
-            response: str
-            user_chose_option: Opt[str] = None
-            canvas_state_update: Opt[dict] = None
-
         # Build enhanced system prompt with user context and analytical personality
         enhanced_prompt = build_enhanced_system_prompt(
             advisor.system_prompt,
@@ -538,19 +517,14 @@ class ChatService:
 
     async def _handle_general_message(
         self,
+        node: DecisionNode,
+        user_message: str,
         chat_messages: list[dict],
         canvas_state: dict,
         advisor: Advisor,
         user_context: Optional[str] = None,
     ) -> dict:
         """Handle general conversation using the selected advisor."""
-        from pydantic import BaseModel
-        from typing import Optional as Opt
-
-        class GeneralChatResponse(BaseModel):
-            response: str
-            canvas_state_update: Opt[dict] = None
-
         # Format the conversation history for context
         history = "\n".join([
             f"{msg['role'].upper()}: {msg['content']}"
@@ -591,8 +565,6 @@ Respond with JSON: {{"response": "your response here"}}"""
         canvas_state: dict,
     ) -> dict:
         """Generate options for the decision."""
-        from app.schemas.ai_responses import Phase2Response
-
         # Format Q&A
         questions = (node.questions_json or {}).get("questions", [])
         answers = node.answers_json or {}
@@ -622,13 +594,6 @@ Respond with JSON: {{"response": "your response here"}}"""
         canvas_state: dict,
     ) -> dict:
         """Generate commit plan for chosen option."""
-        from pydantic import BaseModel
-        from typing import Optional
-
-        class CommitPlanResponse(BaseModel):
-            commit_plan: dict
-            canvas_state_update: Optional[dict] = None
-
         prompt = get_execution_plan_prompt(
             option_title=chosen_option.get("title", ""),
             option_details=chosen_option,
@@ -643,6 +608,94 @@ Respond with JSON: {{"response": "your response here"}}"""
         )
         return response.model_dump()
 
+    async def compact_chat_history(self, node_id: uuid.UUID) -> None:
+        """Fold a node's older chat messages into a rolling summary.
+
+        Meant to run off the request path (a FastAPI background task or a
+        Celery task) with a session of its own, once the turn has been sent.
+        """
+        result = await self.db.execute(
+            select(DecisionNode.chat_messages_json).where(DecisionNode.id == node_id)
+        )
+        chat_messages = result.scalar_one_or_none()
+        # End the read transaction rather than hold it open across the LLM call
+        await self.db.rollback()
+        if not needs_history_compaction(chat_messages):
+            return
+
+        await self._compact_chat_history(
+            node_id, chat_messages[:-CHAT_HISTORY_KEEP_RECENT]
+        )
+
+    async def _compact_chat_history(
+        self,
+        node_id: uuid.UUID,
+        older_messages: list[dict],
+    ) -> None:
+        """Replace older chat messages with a single rolling summary message.
+
+        Runs after the turn has been committed. The node is re-read under a row
+        lock and only rewritten if the summarized prefix is still unchanged, so
+        messages appended by a concurrent turn are kept (or the rewrite skipped).
+        Once compacted, the transcript is back under the threshold, so the next
+        summary is not attempted until another CHAT_HISTORY_KEEP_RECENT turns.
+        """
+        history = "\n".join([
+            f"{msg['role'].upper()}: {msg['content']}"
+            for msg in older_messages
+        ])
+
+        prompt = f"""Summarize the earlier part of this decision coaching conversation.
+
+## Conversation History:
+{history}
+
+## Instructions:
+- Keep the facts, constraints, feelings and options the user has shared
+- Keep any conclusions or commitments that were reached
+- Be concise: a short paragraph, no more than 200 words
+
+Respond with JSON: {{"summary": "your summary here"}}"""
+
+        try:
+            response, _ = await self.ai.generate(
+                system_prompt=CHAT_SYSTEM_PROMPT,
+                user_prompt=prompt,
+                response_model=ChatSummaryResponse,
+                call_location="chat_service.compact_chat_history",
+            )
+        except Exception as e:
+            logger.warning("Failed to summarize chat history for node %s: %s", node_id, e)
+            return
+
+        summary_msg = {
+            "id": f"msg_{uuid.uuid4().hex[:8]}",
+            "role": "system",
+            "content": f"Summary: {response.summary}",
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+        result = await self.db.execute(
+            select(DecisionNode)
+            .where(DecisionNode.id == node_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        node = result.scalar_one_or_none()
+        if not node:
+            return
+
+        current = node.chat_messages_json or []
+        prefix_ids = [m.get("id") for m in older_messages]
+        if [m.get("id") for m in current[:len(prefix_ids)]] != prefix_ids:
+            # History was rewritten concurrently; release the lock and leave it
+            await self.db.rollback()
+            return
+
+        node.chat_messages_json = [summary_msg] + current[len(prefix_ids):]
+        flag_modified(node, "chat_messages_json")
+        await self.db.commit()
+
     def _merge_canvas_state(self, current: dict, update: dict) -> dict:
         """Merge canvas state updates."""
         if not update:
@@ -1,12 +1,16 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, noload, selectinload
 
 from app.models import Decision, DecisionNode, DecisionEvent
 from app.models.decision import DecisionStatus
 from app.models.decision_node import NodePhase
+from app.services.event_log_batcher import get_event_log_batcher
+from app.database_raw import get_raw_pool
+
+_DECISION_COLUMNS = ", ".join(c.name for c in Decision.__table__.columns)
+_NODE_COLUMNS = ", ".join(c.name for c in DecisionNode.__table__.columns)
 
 
 class DecisionService:
@@ -30,28 +34,77 @@ class DecisionService:
             title=title or situation_text[:100],
             status=DecisionStatus.ACTIVE.value,
         )
-        self.db.add(decision)
-        await self.db.flush()
-
-        # Log event
+        # Linking through the relationship lets a single flush order both inserts
         event = DecisionEvent(
-            decision_id=decision.id,
+            decision=decision,
             event_type="created",
             payload_json={"situation_text": situation_text},
         )
-        self.db.add(event)
+        self.db.add_all([decision, event])
         await self.db.commit()
-        await self.db.refresh(decision)
         return decision
 
+    async def create_decision_with_node(
+        self,
+        user_id: uuid.UUID,
+        situation_text: str,
+        phase: NodePhase,
+        situation_type: str | None = None,
+        title: str | None = None,
+        event_type: str | None = None,
+        event_payload: dict | None = None,
+        **node_kwargs,
+    ) -> tuple[Decision, DecisionNode]:
+        """Create a decision, its "created" event and its root node in one transaction.
+
+        If event_type is given, a matching DecisionEvent for the node is
+        written in the same commit.
+        """
+        decision = Decision(
+            user_id=user_id,
+            situation_text=situation_text,
+            situation_type=situation_type,
+            title=title or situation_text[:100],
+            status=DecisionStatus.ACTIVE.value,
+        )
+        # Linking through the relationships lets a single flush order the inserts
+        event = DecisionEvent(
+            decision=decision,
+            event_type="created",
+            payload_json={"situation_text": situation_text},
+        )
+        node = DecisionNode(
+            decision=decision,
+            phase=phase.value,
+            **node_kwargs,
+        )
+        self.db.add_all([decision, event, node])
+        if event_type:
+            self.db.add(
+                DecisionEvent(
+                    decision=decision,
+                    node=node,
+                    event_type=event_type,
+                    payload_json=event_payload,
+                )
+            )
+        await self.db.commit()
+        return decision, node
+
     async def create_node(
         self,
         decision_id: uuid.UUID,
         phase: NodePhase,
         parent_node_id: uuid.UUID | None = None,
+        event_type: str | None = None,
+        event_payload: dict | None = None,
         **kwargs,
     ) -> DecisionNode:
-        """Create a new decision node."""
+        """Create a new decision node.
+
+        If event_type is given, the matching DecisionEvent is written in the
+        same commit as the node.
+        """
         node = DecisionNode(
             decision_id=decision_id,
             parent_node_id=parent_node_id,
@@ -59,27 +112,145 @@ class DecisionService:
             **kwargs,
         )
         self.db.add(node)
+        if event_type:
+            self.db.add(
+                DecisionEvent(
+                    decision_id=decision_id,
+                    node=node,
+                    event_type=event_type,
+                    payload_json=event_payload,
+                )
+            )
         await self.db.commit()
-        await self.db.refresh(node)
         return node
 
-    async def update_node(self, node: DecisionNode, **kwargs) -> DecisionNode:
-        """Update a decision node."""
+    async def update_node(
+        self,
+        node: DecisionNode,
+        events_to_log: list[tuple[str, dict | None]] | None = None,
+        **kwargs,
+    ) -> DecisionNode:
+        """Update a decision node.
+
+        events_to_log holds (event_type, payload) pairs for the node; they are
+        written in the same commit as the update.
+        """
         for key, value in kwargs.items():
             setattr(node, key, value)
+        if events_to_log:
+            self.db.add_all([
+                DecisionEvent(
+                    decision_id=node.decision_id,
+                    node_id=node.id,
+                    event_type=event_type,
+                    payload_json=payload,
+                )
+                for event_type, payload in events_to_log
+            ])
         await self.db.commit()
-        await self.db.refresh(node)
         return node
 
-    async def get_decision(self, decision_id: uuid.UUID) -> Decision | None:
-        """Get a decision by ID with nodes."""
-        result = await self.db.execute(
-            select(Decision)
-            .where(Decision.id == decision_id)
-            .options(selectinload(Decision.nodes))
-        )
+    async def get_decision(
+        self, decision_id: uuid.UUID, with_nodes: bool = False
+    ) -> Decision | None:
+        """Get a decision by ID.
+
+        Relationships are only loaded when with_nodes is True; otherwise the
+        decision's columns come back in a single SELECT and its collections
+        must not be accessed.
+        """
+        query = select(Decision).where(Decision.id == decision_id)
+        if with_nodes:
+            query = query.options(selectinload(Decision.nodes))
+        else:
+            query = query.options(lazyload("*"))
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_decision_readonly(self, decision_id: uuid.UUID) -> Decision | None:
+        """Get a decision with nodes for display only.
+
+        Uses the raw asyncpg pool when available, skipping the ORM session.
+        The returned objects are detached and must not be modified or added
+        to a session; use get_decision() for anything that writes.
+        """
+        pool = get_raw_pool()
+        if pool is None:
+            return await self.get_decision(decision_id, with_nodes=True)
+
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {_DECISION_COLUMNS} FROM decisions WHERE id = $1",
+                decision_id,
+            )
+            if row is None:
+                return None
+            node_rows = await conn.fetch(
+                f"SELECT {_NODE_COLUMNS} FROM decision_nodes "
+                "WHERE decision_id = $1 ORDER BY created_at",
+                decision_id,
+            )
+
+        decision = Decision(**dict(row))
+        decision.nodes = [DecisionNode(**dict(r)) for r in node_rows]
+        return decision
+
+    async def get_decisions_for_user_readonly(
+        self, user_id: uuid.UUID, limit: int = 20, include_nodes: bool = False
+    ) -> list[Decision]:
+        """Get recent decisions for a user for display only.
+
+        Raw asyncpg counterpart of get_decisions_for_user(); same caveats as
+        get_decision_readonly().
+        """
+        pool = get_raw_pool()
+        if pool is None:
+            return await self.get_decisions_for_user(user_id, limit, include_nodes)
+
+        if not include_nodes:
+            rows = await pool.fetch(
+                f"SELECT {_DECISION_COLUMNS}, "
+                "(SELECT count(*) FROM decision_nodes n WHERE n.decision_id = decisions.id) "
+                "AS node_count "
+                "FROM decisions WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2",
+                user_id,
+                limit,
+            )
+            decisions = []
+            for r in rows:
+                values = dict(r)
+                node_count = values.pop("node_count")
+                decision = Decision(**values)
+                decision.node_count = node_count
+                decisions.append(decision)
+            return decisions
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"SELECT {_DECISION_COLUMNS} FROM decisions "
+                "WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2",
+                user_id,
+                limit,
+            )
+            if not rows:
+                return []
+            node_rows = await conn.fetch(
+                f"SELECT {_NODE_COLUMNS} FROM decision_nodes "
+                "WHERE decision_id = ANY($1::uuid[]) ORDER BY created_at",
+                [r["id"] for r in rows],
+            )
+
+        nodes_by_decision: dict[uuid.UUID, list[DecisionNode]] = {}
+        for r in node_rows:
+            nodes_by_decision.setdefault(r["decision_id"], []).append(DecisionNode(**dict(r)))
+
+        decisions = []
+        for r in rows:
+            decision = Decision(**dict(r))
+            decision.nodes = nodes_by_decision.get(r["id"], [])
+            decisions.append(decision)
+        return decisions
+
     async def get_node(self, node_id: uuid.UUID) -> DecisionNode | None:
         """Get a node by ID."""
         result = await self.db.execute(
@@ -88,17 +259,38 @@ class DecisionService:
         return result.scalar_one_or_none()
 
     async def get_decisions_for_user(
-        self, user_id: uuid.UUID, limit: int = 20
+        self, user_id: uuid.UUID, limit: int = 20, include_nodes: bool = False
     ) -> list[Decision]:
-        """Get recent decisions for a user."""
-        result = await self.db.execute(
+        """Get recent decisions for a user.
+
+        Without include_nodes the decisions' collections are left empty and
+        each decision gets a node_count attribute instead, so listing costs a
+        single query.
+        """
+        query = (
             select(Decision)
             .where(Decision.user_id == user_id)
-            .options(selectinload(Decision.nodes))
             .order_by(Decision.created_at.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        if include_nodes:
+            result = await self.db.execute(query.options(selectinload(Decision.nodes)))
+            return list(result.scalars().all())
+
+        node_count = (
+            select(func.count(DecisionNode.id))
+            .where(DecisionNode.decision_id == Decision.id)
+            .correlate(Decision)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            query.add_columns(node_count.label("node_count")).options(noload("*"))
+        )
+        decisions = []
+        for decision, count in result.all():
+            decision.node_count = count
+            decisions.append(decision)
+        return decisions
 
     async def log_event(
         self,
@@ -106,17 +298,26 @@ class DecisionService:
         event_type: str,
         node_id: uuid.UUID | None = None,
         payload: dict | None = None,
-    ) -> DecisionEvent:
-        """Log a decision event."""
+    ) -> None:
+        """Log a decision event.
+
+        When the event log batcher is running the event is queued and written
+        with the next batch, so it may not be persisted yet when this returns;
+        otherwise it is committed on this session.
+        """
         event = DecisionEvent(
             decision_id=decision_id,
             node_id=node_id,
             event_type=event_type,
             payload_json=payload,
         )
+        batcher = get_event_log_batcher()
+        if batcher:
+            await batcher.enqueue(event)
+            return
+
         self.db.add(event)
         await self.db.commit()
-        return event
 
     async def update_decision_status(
         self, decision_id: uuid.UUID, status: DecisionStatus
@@ -125,17 +326,21 @@ class DecisionService:
         decision = await self.get_decision(decision_id)
         if decision:
             decision.status = status.value
-            decision.updated_at = datetime.utcnow()
             await self.db.commit()
-            await self.db.refresh(decision)
         return decision
 
     async def delete_decision(self, decision_id: uuid.UUID) -> bool:
         """Delete a decision and all related data."""
-        decision = await self.get_decision(decision_id)
+        decision = await self.get_decision(decision_id, with_nodes=True)
         if not decision:
             return False
 
+        # Write any still-queued events first, so they are deleted below rather
+        # than inserted after the decision is gone
+        batcher = get_event_log_batcher()
+        if batcher:
+            await batcher.flush()
+
         # Delete all related events
         from sqlalchemy import delete as sql_delete
         await self.db.execute(
@@ -0,0 +1,155 @@
+"""Batched writer for the append-only decision event log."""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import DecisionEvent
+
+logger = logging.getLogger(__name__)
+
+# Sentinel that tells the writer loop to flush what it has and stop
+_STOP = object()
+
+
+class EventLogBatcher:
+    """
+    Buffers DecisionEvent rows and writes them in batches.
+
+    Events are flushed in one transaction once batch_size rows are waiting
+    or batch_ms milliseconds have passed since the first buffered row,
+    whichever comes first. This turns N commits for N events into roughly
+    one commit per batch. If a batch fails, its rows are retried one by one
+    so a single bad event doesn't take the rest of the batch with it.
+    """
+
+    def __init__(self, batch_size: int = 64, batch_ms: int = 50):
+        self.batch_size = batch_size
+        self.batch_seconds = batch_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background writer on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def enqueue(self, event: DecisionEvent) -> None:
+        """Queue an event for the next batch."""
+        await self._queue.put(event)
+
+    async def flush(self) -> None:
+        """Wait until every event queued before this call has been written."""
+        if self._task is None:
+            return
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put(done)
+        await done
+
+    async def flush_on_shutdown(self) -> None:
+        """Write every queued event and stop the background writer."""
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            if isinstance(item, asyncio.Future):
+                # Flush marker with nothing buffered: earlier batches are written
+                item.set_result(None)
+                continue
+
+            batch = [item]
+            marker = None
+            deadline = loop.time() + self.batch_seconds
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP or isinstance(item, asyncio.Future):
+                    marker = item
+                    break
+                batch.append(item)
+
+            await self._write(batch)
+            if marker is _STOP:
+                return
+            if marker is not None:
+                marker.set_result(None)
+
+    async def _write(self, batch: list[DecisionEvent]) -> None:
+        try:
+            await self._insert(batch)
+            return
+        except Exception:
+            logger.warning(
+                "Failed to write %d decision events as a batch; retrying one by one",
+                len(batch),
+                exc_info=True,
+            )
+
+        for event in batch:
+            try:
+                await self._insert([event])
+            except Exception:
+                logger.exception(
+                    "Dropped %s event for decision %s", event.event_type, event.decision_id
+                )
+
+    async def _insert(self, events: list[DecisionEvent]) -> None:
+        """Write events in one transaction."""
+        async with AsyncSessionLocal() as session:
+            session.add_all(events)
+            await session.commit()
+
+
+_batcher: Optional[EventLogBatcher] = None
+
+
+def start_event_log_batcher() -> Optional[EventLogBatcher]:
+    """
+    Create and start the process-wide batcher.
+
+    Batching is only used with PostgreSQL. SQLite (desktop mode) shares a
+    single connection between sessions, so events there keep being written
+    on the caller's session.
+    """
+    global _batcher
+
+    settings = get_settings()
+    if settings.database_type == "sqlite":
+        return None
+
+    if _batcher is None:
+        _batcher = EventLogBatcher(
+            batch_size=settings.eventlog_batch_size,
+            batch_ms=settings.eventlog_batch_ms,
+        )
+        _batcher.start()
+    return _batcher
+
+
+def get_event_log_batcher() -> Optional[EventLogBatcher]:
+    """Return the running batcher, or None if events are written directly."""
+    return _batcher
+
+
+async def stop_event_log_batcher() -> None:
+    """Flush pending events and stop the batcher (application shutdown)."""
+    global _batcher
+
+    if _batcher is not None:
+        await _batcher.flush_on_shutdown()
+        _batcher = None
@@ -1,10 +1,19 @@
 import uuid
+from datetime import datetime
+
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ai.gateway import AIGateway
+from app.ai.embedding_batcher import get_embedding_batcher
 from app.config import get_settings
-from app.models import Memory, DecisionNode
+from app.database_raw import get_raw_pool, VECTOR_CODEC_AVAILABLE
+from app.models import Memory, Decision, DecisionNode
+from app.models.types import uuid7
+
+_MEMORY_COLUMNS = "id, user_id, node_id, memory_text, tags, created_at"
+
+# HNSW candidate list size for similarity search (pgvector default is 40)
+HNSW_EF_SEARCH = 40
 
 
 class MemoryService:
@@ -19,6 +28,12 @@ class MemoryService:
         """Check if vector memory is enabled."""
         return self.settings.use_vector_memory
 
+    def _vector_pool(self):
+        """Return the raw asyncpg pool if it has the binary vector codec."""
+        if VECTOR_CODEC_AVAILABLE:
+            return get_raw_pool()
+        return None
+
     async def create_memory(
         self,
         user_id: uuid.UUID,
@@ -43,9 +58,28 @@ class MemoryService:
         if not self.is_enabled:
             return None
 
-        # Create AI gateway with user's API key and generate embedding
-        ai = AIGateway(api_key)
-        embedding = await ai.get_embedding(memory_text)
+        # Generate embedding (coalesced with concurrent requests for this key)
+        embedding = await get_embedding_batcher(api_key).submit(memory_text)
+
+        # Fast path: insert through asyncpg with the embedding bound as a
+        # binary vector rather than a text literal
+        pool = self._vector_pool()
+        if pool is not None:
+            row = await pool.fetchrow(
+                f"""
+                INSERT INTO memories (id, user_id, node_id, memory_text, tags, embedding, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6, $7)
+                RETURNING {_MEMORY_COLUMNS}
+                """,
+                uuid7(),
+                user_id,
+                node_id,
+                memory_text,
+                tags,
+                embedding,
+                datetime.utcnow(),
+            )
+            return Memory(**dict(row))
 
         memory = Memory(
             user_id=user_id,
@@ -59,7 +93,6 @@ class MemoryService:
 
         self.db.add(memory)
         await self.db.commit()
-        await self.db.refresh(memory)
         return memory
 
     async def find_similar_memories(
@@ -84,15 +117,37 @@ class MemoryService:
         if not self.is_enabled:
             return []
 
-        # Create AI gateway with user's API key and generate embedding for query
-        ai = AIGateway(api_key)
-        query_embedding = await ai.get_embedding(query_text)
-
-        # Use raw SQL for vector similarity search
-        # pgvector uses <=> for cosine distance
+        # Generate embedding for query (coalesced with concurrent requests)
+        query_embedding = await get_embedding_batcher(api_key).submit(query_text)
+
+        # pgvector uses <=> for cosine distance; ORDER BY distance + LIMIT lets
+        # the planner use the HNSW index instead of sorting every user row.
+        # SET LOCAL scopes the search width to this transaction only.
+        pool = self._vector_pool()
+        if pool is not None:
+            # Bind the embedding as a typed binary vector parameter
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}")
+                    rows = await conn.fetch(
+                        f"""
+                        SELECT {_MEMORY_COLUMNS}
+                        FROM memories
+                        WHERE user_id = $1
+                        ORDER BY embedding <=> $2
+                        LIMIT $3
+                        """,
+                        user_id,
+                        query_embedding,
+                        limit,
+                    )
+            return [Memory(**dict(row)) for row in rows]
+
+        # Fallback: raw SQL through the session with a text vector literal
+        await self.db.execute(text(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}"))
         result = await self.db.execute(
-            text("""
-                SELECT id, user_id, node_id, memory_text, tags, created_at
+            text(f"""
+                SELECT {_MEMORY_COLUMNS}
                 FROM memories
                 WHERE user_id = :user_id
                 ORDER BY embedding <=> :query_embedding
@@ -104,22 +159,9 @@ class MemoryService:
                 "limit": limit,
             },
         )
-        rows = result.fetchall()
 
         # Convert to Memory objects
-        memories = []
-        for row in rows:
-            memory = Memory(
-                id=row.id,
-                user_id=row.user_id,
-                node_id=row.node_id,
-                memory_text=row.memory_text,
-                tags=row.tags,
-                created_at=row.created_at,
-            )
-            memories.append(memory)
-
-        return memories
+        return [Memory(**row._mapping) for row in result.fetchall()]
 
     async def create_memory_from_node(
         self, node: DecisionNode, api_key: str
@@ -150,10 +192,13 @@ class MemoryService:
         if chosen_move:
             memory_text += f"\nChose: {chosen_move.get('title', 'Unknown')}"
 
-        # Get decision for user_id and situation_type
-        from app.services.decision_service import DecisionService
-        decision_service = DecisionService(self.db)
-        decision = await decision_service.get_decision(node.decision_id)
+        # Only user_id and situation_type are needed; skip loading the node tree
+        result = await self.db.execute(
+            select(Decision.user_id, Decision.situation_type).where(
+                Decision.id == node.decision_id
+            )
+        )
+        decision = result.one_or_none()
         if not decision:
             return None
 
@@ -1,15 +1,30 @@
 """Observation Service - Generates and manages AI observations about users."""
 
+import asyncio
+import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
 from pydantic import BaseModel
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_, func, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.observation import Observation, ObservationType, ObservationFeedback
+from app.ai.embedding_batcher import get_embedding_batcher
 from app.ai.gateway import AIGateway
+from app.config import get_settings
+from app.database_raw import get_raw_pool, VECTOR_CODEC_AVAILABLE
+from app.services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Nearest existing observations passed to the LLM for de-duplication
+SIMILAR_OBSERVATION_LIMIT = 10
+
+# Recent observation texts per user for the non-vector de-duplication path
+_existing_observations_cache: TTLCache[uuid.UUID, list[str]] = TTLCache(maxsize=1024, ttl=60)
 
 
 class GeneratedObservation(BaseModel):
@@ -35,8 +50,61 @@ class ObservationService:
 
     def __init__(self, db: AsyncSession, api_key: Optional[str] = None):
         self.db = db
+        self.api_key = api_key
         self.ai = AIGateway(api_key) if api_key else None
 
+    @property
+    def embeddings_enabled(self) -> bool:
+        """Check if observations are stored with vector embeddings."""
+        return get_settings().use_vector_memory and hasattr(Observation, "embedding")
+
+    async def _embed(self, texts: list[str]) -> list[list[float]] | None:
+        """Embed texts through the shared batcher, or None if unavailable."""
+        if not self.embeddings_enabled or not self.api_key:
+            return None
+        batcher = get_embedding_batcher(self.api_key)
+        try:
+            return list(await asyncio.gather(*(batcher.submit(t) for t in texts)))
+        except Exception as e:
+            logger.warning("Failed to embed observations: %s", e)
+            return None
+
+    async def _find_similar_observation_texts(
+        self, user_id: uuid.UUID, embedding: list[float]
+    ) -> list[str]:
+        """Return texts of the user's observations nearest to an embedding."""
+        pool = get_raw_pool() if VECTOR_CODEC_AVAILABLE else None
+        if pool is not None:
+            rows = await pool.fetch(
+                """
+                SELECT observation_text
+                FROM user_observations
+                WHERE user_id = $1
+                ORDER BY embedding <=> $2
+                LIMIT $3
+                """,
+                user_id,
+                embedding,
+                SIMILAR_OBSERVATION_LIMIT,
+            )
+            return [row["observation_text"] for row in rows]
+
+        result = await self.db.execute(
+            text("""
+                SELECT observation_text
+                FROM user_observations
+                WHERE user_id = :user_id
+                ORDER BY embedding <=> :embedding
+                LIMIT :limit
+            """),
+            {
+                "user_id": str(user_id),
+                "embedding": str(embedding),
+                "limit": SIMILAR_OBSERVATION_LIMIT,
+            },
+        )
+        return [row[0] for row in result.fetchall()]
+
     async def generate_observations_from_conversation(
         self,
         user_id: uuid.UUID,
@@ -72,15 +140,25 @@ class ObservationService:
             for msg in chat_messages[-20:]  # Last 20 messages
         ])
 
-        # Get existing observations to avoid duplicates
+        # Get existing observations to avoid duplicates. With embeddings, only
+        # the nearest neighbours of this conversation go into the prompt.
         existing = existing_observations or []
         if not existing:
-            result = await self.db.execute(
-                select(Observation.observation_text)
-                .where(Observation.user_id == user_id)
-                .limit(50)
-            )
-            existing = [row[0] for row in result.fetchall()]
+            embeddings = await self._embed([conversation_text])
+            if embeddings:
+                existing = await self._find_similar_observation_texts(
+                    user_id, embeddings[0]
+                )
+            else:
+                existing = _existing_observations_cache.get(user_id)
+                if existing is None:
+                    result = await self.db.execute(
+                        select(Observation.observation_text)
+                        .where(Observation.user_id == user_id)
+                        .limit(50)
+                    )
+                    existing = [row[0] for row in result.fetchall()]
+                    _existing_observations_cache.set(user_id, existing)
 
         existing_text = "\n".join([f"- {obs}" for obs in existing]) if existing else "None"
 
@@ -117,27 +195,38 @@ Respond with JSON: {{"observations": [...]}}"""
                 call_location="observation_service.generate",
             )
 
-            # Create observations
-            created = []
-            for obs_data in response.observations:
-                # Skip if confidence too low
-                if obs_data.confidence < 0.5:
-                    continue
-
-                observation = Observation(
-                    user_id=user_id,
-                    decision_id=decision_id,
-                    observation_text=obs_data.observation_text,
-                    observation_type=obs_data.observation_type,
-                    confidence=obs_data.confidence,
-                    related_theme=obs_data.related_theme,
-                    tags=obs_data.tags,
-                    source="conversation",
-                )
-                self.db.add(observation)
-                created.append(observation)
-
+            # Skip observations with too little confidence
+            kept = [o for o in response.observations if o.confidence >= 0.5]
+            if not kept:
+                return []
+
+            rows = [
+                {
+                    "user_id": user_id,
+                    "decision_id": decision_id,
+                    "observation_text": obs_data.observation_text,
+                    "observation_type": obs_data.observation_type,
+                    "confidence": obs_data.confidence,
+                    "related_theme": obs_data.related_theme,
+                    "tags": obs_data.tags,
+                    "source": "conversation",
+                }
+                for obs_data in kept
+            ]
+
+            # Store embeddings so later runs can find these as neighbours
+            embeddings = await self._embed([row["observation_text"] for row in rows])
+            if embeddings:
+                for row, embedding in zip(rows, embeddings):
+                    row["embedding"] = embedding
+
+            # One multi-row INSERT ... RETURNING instead of a statement per row
+            result = await self.db.execute(
+                insert(Observation).returning(Observation), rows
+            )
+            created = list(result.scalars().all())
             await self.db.commit()
+            _existing_observations_cache.pop(user_id)
             return created
 
         except Exception as e:
@@ -154,7 +243,10 @@ Respond with JSON: {{"observations": [...]}}"""
         Returns an observation formatted for natural insertion in conversation.
         Returns None if no suitable observation is available.
         """
-        # Get observations that should be surfaced
+        # Same rule as Observation.should_surface(), applied in SQL so only the
+        # chosen row is fetched. SKIP LOCKED keeps concurrent chats from
+        # surfacing the same observation twice.
+        resurface_cutoff = datetime.utcnow() - timedelta(hours=24)
         result = await self.db.execute(
             select(Observation)
             .where(
@@ -162,21 +254,25 @@ Respond with JSON: {{"observations": [...]}}"""
                     Observation.user_id == user_id,
                     Observation.user_feedback != ObservationFeedback.INCORRECT.value,
                     Observation.confidence >= 0.6,
+                    or_(
+                        Observation.last_surfaced_at.is_(None),
+                        Observation.last_surfaced_at <= resurface_cutoff,
+                        Observation.surfaced_count == 0,
+                    ),
                 )
             )
             .order_by(Observation.surfaced_count.asc(), Observation.confidence.desc())
-            .limit(10)
+            .limit(1)
+            .with_for_update(skip_locked=True)
         )
-        observations = result.scalars().all()
-
-        for obs in observations:
-            if obs.should_surface():
-                # Mark as surfaced
-                obs.mark_surfaced()
-                await self.db.commit()
-                return obs.to_inline_text()
+        obs = result.scalar_one_or_none()
+        if obs is None:
+            return None
 
-        return None
+        # Mark as surfaced
+        obs.mark_surfaced()
+        await self.db.commit()
+        return obs.to_inline_text()
 
     async def get_observations_for_display(
         self,
@@ -211,10 +307,13 @@ Respond with JSON: {{"observations": [...]}}"""
         return list(result.scalars().all())
 
     async def get_observations_grouped(
-        self, user_id: uuid.UUID
+        self, user_id: uuid.UUID, per_type: int = 10
     ) -> dict[str, list[Observation]]:
         """Get observations grouped by type for display.
 
+        Fetches the top `per_type` observations of each type in one query,
+        so rare types are not crowded out by common ones.
+
         Returns a dict like:
         {
             "patterns": [...],
@@ -224,7 +323,32 @@ Respond with JSON: {{"observations": [...]}}"""
             "insights": [...]
         }
         """
-        observations = await self.get_observations_for_display(user_id, limit=50)
+        ranked = (
+            select(
+                Observation,
+                func.row_number()
+                .over(
+                    partition_by=Observation.observation_type,
+                    order_by=(
+                        Observation.confidence.desc(),
+                        Observation.created_at.desc(),
+                    ),
+                )
+                .label("rn"),
+            )
+            .where(
+                Observation.user_id == user_id,
+                Observation.user_feedback != ObservationFeedback.INCORRECT.value,
+            )
+            .subquery()
+        )
+        ranked_observation = aliased(Observation, ranked)
+        result = await self.db.execute(
+            select(ranked_observation)
+            .where(ranked.c.rn <= per_type)
+            .order_by(ranked.c.observation_type, ranked.c.rn)
+        )
+        observations = result.scalars().all()
 
         grouped: dict[str, list[Observation]] = {
             ObservationType.PATTERN.value: [],
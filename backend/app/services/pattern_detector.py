@@ -7,13 +7,18 @@ This service handles:
 - Updating thread exploration depth
 """
 
+import asyncio
+import hashlib
 import re
 import uuid
+from collections import Counter
+from itertools import product
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 from app.ai.gateway import AIGateway
+from app.services.ttl_cache import TTLCache
 from app.schemas.psychologist_state import (
     Thread,
     ThreadType,
@@ -22,6 +27,42 @@ from app.schemas.psychologist_state import (
     PsychologistConversationState,
 )
 
+# Optional C Aho-Corasick implementation (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# AI analyses keyed by a digest of their prompt
+_ai_analysis_cache: "TTLCache[str, PatternAnalysisResult]" = TTLCache(maxsize=512, ttl=3600)
+
+
+def _build_automaton(values: dict[str, object]):
+    """Compile keyword -> value pairs into one automaton (None if unavailable)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, value in values.items():
+        automaton.add_word(keyword, value)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_trigger_regex(literals: dict[str, str]) -> re.Pattern[str]:
+    """Compile literal -> name pairs into one alternation, a named group per name.
+
+    Wrapped in a lookahead so overlapping literals are all reported; the
+    fallback when pyahocorasick is unavailable.
+    """
+    by_name: dict[str, list[str]] = {}
+    for literal, name in literals.items():
+        by_name.setdefault(name, []).append(re.escape(literal))
+    return re.compile(
+        "(?=(?:"
+        + "|".join(f"(?P<{name}>{'|'.join(alts)})" for name, alts in by_name.items())
+        + "))"
+    )
+
 
 class DetectedThread(BaseModel):
     """A newly detected thread from message analysis."""
@@ -68,12 +109,79 @@ class PatternDetector:
         ],
     }
 
+    # Emotion label for each intensity marker that implies one
+    EMOTION_BY_MARKER = {
+        "terrified": "anxious",
+        "desperate": "anxious",
+        "hate": "frustrated",
+        "love": "excited",
+        "meaningless": "sad",
+        "pointless": "sad",
+        "hopeless": "sad",
+        "frustrated": "frustrated",
+        "angry": "frustrated",
+        "anxious": "anxious",
+        "scared": "anxious",
+        "worried": "anxious",
+        "stuck": "frustrated",
+        "trapped": "frustrated",
+        "lost": "confused",
+        "confused": "confused",
+        "overwhelmed": "anxious",
+    }
+
+    # Every marker keyed to its scan order: (tier, position in tier, marker, intensity)
+    _MARKER_ORDER = {
+        marker: (tier, position, marker, intensity)
+        for tier, (intensity, markers) in enumerate(INTENSITY_MARKERS.items())
+        for position, marker in enumerate(markers)
+    }
+    _MARKER_AUTOMATON = _build_automaton(_MARKER_ORDER)
+
+    # Fallback without pyahocorasick: every marker in one alternation. The
+    # lookahead reports overlapping markers too (no marker prefixes another).
+    _MARKER_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, _MARKER_ORDER)) + "))"
+    )
+
+    # Emotionally significant words whose repetition marks a recurring theme
+    SIGNIFICANT_WORDS = [
+        "stuck", "pointless", "meaningless", "connection", "alone",
+        "lost", "confused", "frustrated", "want", "need", "afraid",
+        "scared", "worried", "happy", "excited", "hope",
+    ]
+
+    # Whole-token occurrences of the significant words. A token is a maximal
+    # run of [a-z'] (keeping contractions like "don't" whole), so only the
+    # words we report on are materialized instead of every token.
+    _SIGNIFICANT_WORD_RE = re.compile(
+        rf"(?<![a-z'])({'|'.join(SIGNIFICANT_WORDS)})(?![a-z'])"
+    )
+
     # Patterns that might indicate contradiction
     CONTRADICTION_SIGNALS = [
-        (r"want.*but", "wants X but Y"),
-        (r"should.*but", "feels they should but"),
-        (r"i know.*but", "knows X but does Y"),
-        (r"on one hand.*other", "internal conflict"),
+        (re.compile(r"want.*but"), "wants X but Y"),
+        (re.compile(r"should.*but"), "feels they should but"),
+        (re.compile(r"i know.*but"), "knows X but does Y"),
+        (re.compile(r"on one hand.*other"), "internal conflict"),
+    ]
+
+    # "<negation> <affirmation>" pairs that can contradict earlier statements.
+    # One alternation finds every pair present; the pair list keeps the
+    # negation-major order in which observations are reported.
+    NEGATIONS = ("don't", "doesn't", "not", "never", "no longer")
+    AFFIRMATIONS = ("want", "need", "like", "enjoy", "love")
+    _NEGATED_AFFIRMATION_PAIRS = list(product(NEGATIONS, AFFIRMATIONS))
+    _NEGATED_AFFIRMATION_RE = re.compile(
+        f"({'|'.join(map(re.escape, NEGATIONS))}) ({'|'.join(AFFIRMATIONS)})"
+    )
+
+    # Explicit emotional statements and the thread kind they open
+    EMOTIONAL_PATTERNS = [
+        (re.compile(r"i feel (like |that )?([\w\s]+)"), "feeling"),
+        (re.compile(r"it feels (like |that )?([\w\s]+)"), "feeling"),
+        (re.compile(r"i('m| am) ([\w\s]+)"), "state"),
+        (re.compile(r"i('ve| have) been ([\w\s]+)"), "pattern"),
     ]
 
     # Value-indicating words
@@ -82,6 +190,25 @@ class PatternDetector:
         "need", "must", "have to", "want", "wish",
     ]
 
+    # What follows each value indicator, compiled once per indicator
+    _VALUE_PATTERNS = [
+        (f"value_{i}", re.compile(rf"{re.escape(indicator)}s? (?:to |about |is )?([\w\s]+)"))
+        for i, indicator in enumerate(VALUE_INDICATORS)
+    ]
+
+    # Literals that every pattern of a rule requires -> name of the rule.
+    # A single pass over the message for these names which rules can fire.
+    _RULE_TRIGGER_LITERALS = {
+        **dict.fromkeys(
+            ["i feel ", "it feels ", "i'm ", "i am ", "i've been ", "i have been "],
+            "emotional",
+        ),
+        **dict.fromkeys(["but", "on one hand"], "contradiction"),
+        **{ind: f"value_{i}" for i, ind in enumerate(VALUE_INDICATORS)},
+    }
+    _RULE_TRIGGER_AUTOMATON = _build_automaton(_RULE_TRIGGER_LITERALS)
+    _RULE_TRIGGERS = _build_trigger_regex(_RULE_TRIGGER_LITERALS)
+
     def __init__(self, ai_gateway: Optional[AIGateway] = None):
         """Initialize the pattern detector.
 
@@ -90,6 +217,9 @@ class PatternDetector:
                        If None, uses rule-based detection only.
         """
         self.ai = ai_gateway
+        # Topic-word automaton for the last seen set of active threads
+        self._topic_key: Optional[tuple[tuple[str, str], ...]] = None
+        self._topic_automaton = None
 
     async def analyze_message(
         self,
@@ -103,32 +233,42 @@ class PatternDetector:
         for more nuanced pattern detection.
         """
         result = PatternAnalysisResult()
+        message_lower = message.lower()
 
-        # Rule-based analysis (always runs)
-        rule_result = self._rule_based_analysis(message, chat_history, state)
+        # AI-based analysis (if gateway available and useful) is started
+        # first so the rule-based pass runs while the request is in flight
+        ai_call = (
+            self._ai_analysis(message, chat_history, state)
+            if self.ai and len(chat_history) >= 2
+            else asyncio.sleep(0)
+        )
+
+        # Rule-based analysis (always runs) in a worker thread
+        rule_result, ai_result = await asyncio.gather(
+            asyncio.to_thread(
+                self._rule_based_analysis, message, chat_history, state, message_lower
+            ),
+            ai_call,
+            return_exceptions=True,
+        )
+        if isinstance(rule_result, BaseException):
+            raise rule_result
         result.new_threads.extend(rule_result.new_threads)
         result.new_observations.extend(rule_result.new_observations)
         result.dominant_emotion = rule_result.dominant_emotion
 
         # Update thread depths for mentioned threads
         result.updated_thread_depths = self._update_thread_depths(
-            message, state.active_threads
+            message_lower, state.active_threads
         )
 
-        # AI-based analysis (if gateway available and useful)
-        if self.ai and len(chat_history) >= 2:
-            try:
-                ai_result = await self._ai_analysis(message, chat_history, state)
-                # Merge AI results, avoiding duplicates
-                for thread in ai_result.new_threads:
-                    if not self._is_duplicate_thread(thread, result.new_threads):
-                        result.new_threads.append(thread)
-                for obs in ai_result.new_observations:
-                    if not self._is_duplicate_observation(obs, result.new_observations):
-                        result.new_observations.append(obs)
-            except Exception:
-                # AI analysis failed, continue with rule-based results
-                pass
+        # Merge AI results, avoiding duplicates. If AI analysis failed,
+        # continue with rule-based results.
+        if isinstance(ai_result, PatternAnalysisResult):
+            self._merge_threads(result.new_threads, ai_result.new_threads)
+            self._merge_observations(
+                result.new_observations, ai_result.new_observations
+            )
 
         return result
 
@@ -137,10 +277,17 @@ class PatternDetector:
         message: str,
         chat_history: list[dict],
         state: PsychologistConversationState,
+        message_lower: Optional[str] = None,
     ) -> PatternAnalysisResult:
-        """Perform rule-based pattern analysis."""
+        """Perform rule-based pattern analysis.
+
+        message_lower may be passed by callers that already lowercased the
+        message.
+        """
         result = PatternAnalysisResult()
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
+        triggers = self._scan_rule_triggers(message_lower)
 
         # Detect emotional intensity and emotion
         intensity, emotion = self._detect_emotion(message_lower)
@@ -148,89 +295,78 @@ class PatternDetector:
 
         # Look for emotional threads (repeated words, strong language)
         emotional_threads = self._detect_emotional_threads(
-            message, message_lower, intensity
+            message, message_lower, intensity, triggers
         )
         result.new_threads.extend(emotional_threads)
 
+        user_messages = state.user_history_lower(chat_history)
+        user_theme_counts = self._update_theme_counts(state, chat_history)
+
         # Look for contradictions with previous statements
         if chat_history:
             contradictions = self._detect_contradictions(
-                message_lower, chat_history
+                message_lower, user_messages, triggers
             )
             result.new_observations.extend(contradictions)
 
         # Look for value statements
-        value_threads = self._detect_value_statements(message, message_lower)
+        value_threads = self._detect_value_statements(message, message_lower, triggers)
         result.new_threads.extend(value_threads)
 
         # Look for repeated themes across history
         if len(chat_history) >= 4:
-            patterns = self._detect_repeated_themes(message_lower, chat_history)
+            patterns = self._detect_repeated_themes(message_lower, user_theme_counts)
             result.new_observations.extend(patterns)
 
         return result
 
+    def _scan_rule_triggers(self, message_lower: str) -> set[str]:
+        """Return the names of the rules whose trigger literals occur in a message."""
+        if self._RULE_TRIGGER_AUTOMATON is not None:
+            return {rule for _, rule in self._RULE_TRIGGER_AUTOMATON.iter(message_lower)}
+        return {m.lastgroup for m in self._RULE_TRIGGERS.finditer(message_lower)}
+
     def _detect_emotion(self, message_lower: str) -> tuple[EmotionalIntensity, Optional[str]]:
-        """Detect emotional intensity and dominant emotion from message."""
-        # Check for critical intensity markers first
-        for intensity, markers in self.INTENSITY_MARKERS.items():
-            for marker in markers:
-                if marker in message_lower:
-                    # Map marker to emotion
-                    emotion = self._marker_to_emotion(marker)
-                    return intensity, emotion
-
-        # Default to medium/neutral
-        return EmotionalIntensity.MEDIUM, "neutral"
+        """Detect emotional intensity and dominant emotion from message.
+
+        Critical markers win over high ones, high over medium, and within a
+        tier the earliest listed marker wins. Both scans below find every
+        marker in one pass and keep the one that comes first in that order.
+        """
+        if self._MARKER_AUTOMATON is not None:
+            hits = (value for _, value in self._MARKER_AUTOMATON.iter(message_lower))
+        else:
+            hits = (self._MARKER_ORDER[m] for m in self._MARKER_RE.findall(message_lower))
+
+        found = min(hits, default=None)
+        if found is None:
+            # Default to medium/neutral
+            return EmotionalIntensity.MEDIUM, "neutral"
+
+        _, _, marker, intensity = found
+        return intensity, self._marker_to_emotion(marker)
 
     def _marker_to_emotion(self, marker: str) -> str:
         """Map an intensity marker to an emotion label."""
-        emotion_map = {
-            "terrified": "anxious",
-            "desperate": "anxious",
-            "hate": "frustrated",
-            "love": "excited",
-            "meaningless": "sad",
-            "pointless": "sad",
-            "hopeless": "sad",
-            "frustrated": "frustrated",
-            "angry": "frustrated",
-            "anxious": "anxious",
-            "scared": "anxious",
-            "worried": "anxious",
-            "stuck": "frustrated",
-            "trapped": "frustrated",
-            "lost": "confused",
-            "confused": "confused",
-            "overwhelmed": "anxious",
-        }
-        return emotion_map.get(marker, "neutral")
+        return self.EMOTION_BY_MARKER.get(marker, "neutral")
 
     def _detect_emotional_threads(
         self,
         message: str,
         message_lower: str,
         intensity: EmotionalIntensity,
+        triggers: Optional[set[str]] = None,
     ) -> list[DetectedThread]:
         """Detect threads with emotional charge."""
         threads = []
+        if triggers is not None and "emotional" not in triggers:
+            return threads
 
         # Check for explicit emotional statements
-        emotional_patterns = [
-            (r"i feel (like |that )?([\w\s]+)", "feeling"),
-            (r"it feels (like |that )?([\w\s]+)", "feeling"),
-            (r"i('m| am) ([\w\s]+)", "state"),
-            (r"i('ve| have) been ([\w\s]+)", "pattern"),
-        ]
-
-        for pattern, thread_type in emotional_patterns:
-            matches = re.findall(pattern, message_lower)
-            for match in matches:
-                # Extract the relevant part
-                if isinstance(match, tuple):
-                    topic = match[-1].strip()[:50]  # Last group, limited length
-                else:
-                    topic = match.strip()[:50]
+        for pattern, thread_type in self.EMOTIONAL_PATTERNS:
+            for match in pattern.finditer(message_lower):
+                # Extract the relevant part: last group, limited length
+                topic, start, end = self._topic_span(match, pattern.groups, 50)
 
                 if len(topic) > 3:  # Avoid tiny matches
                     threads.append(DetectedThread(
@@ -238,7 +374,7 @@ class PatternDetector:
                         type=ThreadType.EMOTIONAL,
                         emotional_intensity=intensity,
                         relevance_score=0.7,
-                        quote=self._extract_quote(message, topic),
+                        quote=self._extract_quote(message, start, end),
                     ))
 
         return threads[:3]  # Limit to top 3
@@ -246,24 +382,29 @@ class PatternDetector:
     def _detect_contradictions(
         self,
         message_lower: str,
-        chat_history: list[dict],
+        user_messages: list[str],
+        triggers: Optional[set[str]] = None,
     ) -> list[DetectedObservation]:
-        """Detect contradictions between current message and history."""
-        observations = []
+        """Detect contradictions between current message and history.
 
-        # Get previous user messages
-        user_messages = [
-            m["content"].lower()
-            for m in chat_history
-            if m.get("role") == "user"
-        ]
+        Args:
+            message_lower: Lowercased current message
+            user_messages: Lowercased previous user messages
+            triggers: Result of _scan_rule_triggers, if already computed
+        """
+        observations = []
 
         if not user_messages:
             return observations
 
         # Check for internal contradictions in current message
-        for pattern, label in self.CONTRADICTION_SIGNALS:
-            if re.search(pattern, message_lower):
+        signals = (
+            self.CONTRADICTION_SIGNALS
+            if triggers is None or "contradiction" in triggers
+            else ()
+        )
+        for pattern, label in signals:
+            if pattern.search(message_lower):
                 observations.append(DetectedObservation(
                     type="contradiction",
                     text=f"User shows internal conflict: {label}",
@@ -273,13 +414,11 @@ class PatternDetector:
 
         # Check for contradictions with previous statements
         # Simple approach: look for negations of previously stated things
-        negation_patterns = ["don't", "doesn't", "not", "never", "no longer"]
-        affirmation_patterns = ["want", "need", "like", "enjoy", "love"]
+        negated = {m.groups() for m in self._NEGATED_AFFIRMATION_RE.finditer(message_lower)}
 
-        for neg in negation_patterns:
-            for aff in affirmation_patterns:
-                current_neg = f"{neg} {aff}" in message_lower
-                if current_neg:
+        if negated:
+            for neg, aff in self._NEGATED_AFFIRMATION_PAIRS:
+                if (neg, aff) in negated:
                     # Check if they previously affirmed this
                     for prev in user_messages:
                         if aff in prev and neg not in prev:
@@ -300,52 +439,75 @@ class PatternDetector:
         self,
         message: str,
         message_lower: str,
+        triggers: Optional[set[str]] = None,
     ) -> list[DetectedThread]:
         """Detect statements that reveal user values."""
         threads = []
+        if triggers is None:
+            triggers = self._scan_rule_triggers(message_lower)
 
-        for indicator in self.VALUE_INDICATORS:
-            if indicator in message_lower:
+        for group, pattern in self._VALUE_PATTERNS:
+            if group in triggers:
                 # Extract what they value
-                pattern = rf"{indicator}s? (?:to |about |is )?([\w\s]+)"
-                matches = re.findall(pattern, message_lower)
-                for match in matches:
-                    value = match.strip()[:40]
+                for match in pattern.finditer(message_lower):
+                    value, start, end = self._topic_span(match, 1, 40)
                     if len(value) > 3:
                         threads.append(DetectedThread(
                             topic=f"values {value}",
                             type=ThreadType.VALUE,
                             emotional_intensity=EmotionalIntensity.MEDIUM,
                             relevance_score=0.8,
-                            quote=self._extract_quote(message, value),
+                            quote=self._extract_quote(message, start, end),
                         ))
 
         return threads[:2]
 
+    def _update_theme_counts(
+        self,
+        state: PsychologistConversationState,
+        chat_history: list[dict],
+    ) -> dict[str, int]:
+        """Add significant-word counts of user messages new since the last turn.
+
+        The counts and the history length they cover are persisted on the
+        state, so a reloaded state only scans messages it has not seen. A
+        shorter history than last time (e.g. after compaction) is recounted.
+        """
+        counts = state.user_theme_counts
+        start = state.user_theme_history_len
+        if len(chat_history) < start:
+            counts, start = {}, 0
+
+        for m in chat_history[start:]:
+            if m.get("role") == "user":
+                for word in self._SIGNIFICANT_WORD_RE.findall(m["content"].lower()):
+                    counts[word] = counts.get(word, 0) + 1
+
+        state.user_theme_counts = counts
+        state.user_theme_history_len = len(chat_history)
+        return counts
+
     def _detect_repeated_themes(
         self,
         message_lower: str,
-        chat_history: list[dict],
+        user_theme_counts: dict[str, int],
     ) -> list[DetectedObservation]:
-        """Detect themes that repeat across conversation."""
+        """Detect themes that repeat across conversation.
+
+        Args:
+            message_lower: Lowercased current message
+            user_theme_counts: Significant-word counts of the previous user messages
+        """
         observations = []
 
-        # Count word frequency across user messages
-        user_text = " ".join(
-            m["content"].lower()
-            for m in chat_history
-            if m.get("role") == "user"
-        ) + " " + message_lower
-
-        # Look for emotionally significant words that repeat
-        significant_words = [
-            "stuck", "pointless", "meaningless", "connection", "alone",
-            "lost", "confused", "frustrated", "want", "need", "afraid",
-            "scared", "worried", "happy", "excited", "hope",
-        ]
-
-        for word in significant_words:
-            count = user_text.count(word)
+        # Look for emotionally significant words that repeat across user
+        # messages. Counting whole tokens means "wanted" does not count as
+        # "want". History counts are maintained incrementally on the state,
+        # so only the current message is scanned here.
+        message_counts = Counter(self._SIGNIFICANT_WORD_RE.findall(message_lower))
+
+        for word in self.SIGNIFICANT_WORDS:
+            count = user_theme_counts.get(word, 0) + message_counts[word]
             if count >= 3:
                 observations.append(DetectedObservation(
                     type="pattern",
@@ -358,12 +520,23 @@ class PatternDetector:
 
     def _update_thread_depths(
         self,
-        message: str,
+        message_lower: str,
         active_threads: list[Thread],
     ) -> dict[str, int]:
-        """Update exploration depth for threads mentioned in message."""
+        """Update exploration depth for threads mentioned in a lowercased message."""
         updates = {}
-        message_lower = message.lower()
+
+        automaton = self._get_topic_automaton(active_threads)
+        if automaton is not None:
+            # One pass over the message finds every touched thread
+            touched: set[str] = set()
+            for _, thread_ids in automaton.iter(message_lower):
+                touched |= thread_ids
+            return {
+                thread.id: min(thread.exploration_depth + 1, 3)
+                for thread in active_threads
+                if thread.id in touched
+            }
 
         for thread in active_threads:
             # Check if thread topic is mentioned in message
@@ -374,43 +547,85 @@ class PatternDetector:
 
         return updates
 
-    def _extract_quote(self, message: str, keyword: str) -> str:
-        """Extract a relevant quote around a keyword."""
-        message_lower = message.lower()
-        idx = message_lower.find(keyword.lower())
-        if idx == -1:
-            return message[:100]
+    def _get_topic_automaton(self, active_threads: list[Thread]):
+        """Return an automaton of topic words (len > 3) -> thread ids.
 
-        start = max(0, idx - 20)
-        end = min(len(message), idx + len(keyword) + 50)
-        return message[start:end].strip()
+        Rebuilt only when the active threads' ids or topics change; None if
+        pyahocorasick is unavailable or no topic has a long enough word.
+        """
+        if ahocorasick is None:
+            return None
+
+        key = tuple((thread.id, thread.topic) for thread in active_threads)
+        if key != self._topic_key:
+            thread_ids_by_word: dict[str, set[str]] = {}
+            for thread_id, topic in key:
+                for word in topic.lower().split():
+                    if len(word) > 3:
+                        thread_ids_by_word.setdefault(word, set()).add(thread_id)
+            self._topic_automaton = (
+                _build_automaton(
+                    {word: frozenset(ids) for word, ids in thread_ids_by_word.items()}
+                )
+                if thread_ids_by_word
+                else None
+            )
+            self._topic_key = key
+        return self._topic_automaton
+
+    @staticmethod
+    def _topic_span(match: re.Match, group: int, limit: int) -> tuple[str, int, int]:
+        """Return a match group stripped and truncated, with its span."""
+        raw = match.group(group)
+        topic = raw.strip()[:limit]
+        start = match.start(group) + len(raw) - len(raw.lstrip())
+        return topic, start, start + len(topic)
+
+    def _extract_quote(self, message: str, start: int, end: int) -> str:
+        """Extract a relevant quote around the span message[start:end].
+
+        The span comes from the regex match on the lowercased message, so
+        the message is not lowercased and searched again.
+        """
+        return message[max(0, start - 20):min(len(message), end + 50)].strip()
 
-    def _is_duplicate_thread(
+    def _merge_threads(
         self,
-        thread: DetectedThread,
         existing: list[DetectedThread],
-    ) -> bool:
-        """Check if a thread is a duplicate."""
-        for e in existing:
-            if thread.topic.lower() == e.topic.lower():
-                return True
-            # Check for significant overlap
-            t_words = set(thread.topic.lower().split())
-            e_words = set(e.topic.lower().split())
-            if len(t_words & e_words) > len(t_words) * 0.5:
-                return True
-        return False
-
-    def _is_duplicate_observation(
+        candidates: list[DetectedThread],
+    ) -> None:
+        """Append candidates to existing unless they duplicate a thread already there.
+
+        A thread is a duplicate if its topic matches one already present, or
+        more than half of its topic words appear in such a topic.
+        """
+        seen_topics = {t.topic.lower() for t in existing}
+        seen_words = [set(topic.split()) for topic in seen_topics]
+
+        for thread in candidates:
+            topic = thread.topic.lower()
+            if topic in seen_topics:
+                continue
+            words = set(topic.split())
+            if any(len(words & w) > len(words) * 0.5 for w in seen_words):
+                continue
+            existing.append(thread)
+            seen_topics.add(topic)
+            seen_words.append(words)
+
+    def _merge_observations(
         self,
-        obs: DetectedObservation,
         existing: list[DetectedObservation],
-    ) -> bool:
-        """Check if an observation is a duplicate."""
-        for e in existing:
-            if obs.type == e.type and obs.text.lower() == e.text.lower():
-                return True
-        return False
+        candidates: list[DetectedObservation],
+    ) -> None:
+        """Append candidates to existing unless the same type and text is already there."""
+        seen = {(o.type, o.text.lower()) for o in existing}
+
+        for obs in candidates:
+            key = (obs.type, obs.text.lower())
+            if key not in seen:
+                existing.append(obs)
+                seen.add(key)
 
     async def _ai_analysis(
         self,
@@ -425,15 +640,8 @@ class PatternDetector:
             for m in chat_history[-6:]
         )
 
-        known_threads = "\n".join(
-            f"- {t.topic} ({t.type.value})"
-            for t in state.active_threads
-        ) or "None yet"
-
-        known_observations = "\n".join(
-            f"- [{o.type}] {o.text}"
-            for o in state.observations
-        ) or "None yet"
+        known_threads = state.known_threads_text() or "None yet"
+        known_observations = state.known_observations_text() or "None yet"
 
         prompt = f"""Analyze this user message for patterns:
 
@@ -456,12 +664,20 @@ Return JSON:
     "dominant_emotion": "neutral|anxious|frustrated|excited|confused|sad|hopeful"
 }}"""
 
+        # Identical prompts (retries, reprocessing) reuse the earlier analysis.
+        # Copies go in and out because callers merge into the returned lists.
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = _ai_analysis_cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         response, _ = await self.ai.generate(
             system_prompt="You are an expert at analyzing conversational patterns. Be concise.",
             user_prompt=prompt,
             response_model=PatternAnalysisResult,
         )
 
+        _ai_analysis_cache.set(key, response.model_copy(deep=True))
         return response
 
 
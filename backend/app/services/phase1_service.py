@@ -50,20 +50,15 @@ class Phase1Service:
         # Get template for additional context
         template = get_template(response.situation_type)
 
-        # Create decision
-        decision = await self.decision_service.create_decision(
+        # Create decision and its node with Phase 1 results in one commit
+        _, node = await self.decision_service.create_decision_with_node(
             user_id=user_id,
             situation_text=situation_text,
             situation_type=response.situation_type,
-        )
-
-        # Create node with Phase 1 results
-        node = await self.decision_service.create_node(
-            decision_id=decision.id,
             phase=NodePhase.CLARIFY,
             state_json={"summary": response.summary},
             questions_json={
-                "questions": [q.model_dump() for q in response.questions]
+                "questions": response.model_dump(include={"questions"})["questions"]
             },
             mood_state=response.mood_detected,
             metadata_json={
@@ -72,14 +67,8 @@ class Phase1Service:
             policy_version=self.settings.policy_version,
             prompt_hash=metadata.get("prompt_hash"),
             model_version=metadata.get("model_version"),
-        )
-
-        # Log event
-        await self.decision_service.log_event(
-            decision_id=decision.id,
-            node_id=node.id,
             event_type="phase1_completed",
-            payload={
+            event_payload={
                 "question_count": len(response.questions),
                 "situation_type": response.situation_type,
                 "mood_detected": response.mood_detected,
@@ -1,4 +1,5 @@
 import uuid
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.gateway import AIGateway
@@ -13,6 +14,9 @@ from app.schemas.move import ExecutionPlan
 from app.services.decision_service import DecisionService
 from app.templates import get_template
 
+# Serializes a whole answer list in one pydantic-core call
+_ANSWER_LIST = TypeAdapter(list[Answer])
+
 
 class Phase2Service:
     """Service for Phase 2 (Moves) operations."""
@@ -70,32 +74,40 @@ class Phase2Service:
         )
 
         # Validate moves against guardrails
+        events_to_log = []
         for move in response.moves:
             is_valid, violations = check_move_guardrails(
                 move, template.guardrail_additions
             )
             if not is_valid:
                 # Log violation but don't block - AI should have followed guidelines
-                await self.decision_service.log_event(
-                    decision_id=node.decision_id,
-                    node_id=node.id,
-                    event_type="guardrail_warning",
-                    payload={
+                events_to_log.append((
+                    "guardrail_warning",
+                    {
                         "move_id": move.move_id,
                         "violations": [
                             {"rule": v.rule, "description": v.description}
                             for v in violations
                         ],
                     },
-                )
+                ))
 
-        # Update node
+        events_to_log.append((
+            "phase2_completed",
+            {
+                "move_count": len(response.moves),
+                "cooldown_recommended": response.cooldown_recommended,
+            },
+        ))
+
+        # Update node and log events in one commit
         updated_node = await self.decision_service.update_node(
             node,
+            events_to_log=events_to_log,
             phase=NodePhase.MOVES.value,
-            answers_json={"answers": [a.model_dump() for a in answers]},
+            answers_json={"answers": _ANSWER_LIST.dump_python(answers)},
             moves_json={
-                "moves": [m.model_dump() for m in response.moves],
+                "moves": response.model_dump(include={"moves"})["moves"],
                 "cooldown_recommended": response.cooldown_recommended,
                 "cooldown_reason": response.cooldown_reason,
             },
@@ -103,17 +115,6 @@ class Phase2Service:
             model_version=metadata.get("model_version"),
         )
 
-        # Log event
-        await self.decision_service.log_event(
-            decision_id=node.decision_id,
-            node_id=node.id,
-            event_type="phase2_completed",
-            payload={
-                "move_count": len(response.moves),
-                "cooldown_recommended": response.cooldown_recommended,
-            },
-        )
-
         return updated_node, response
 
     async def generate_execution_plan(
@@ -161,25 +162,21 @@ class Phase2Service:
             boundary_rule=response.boundary_rule,
         )
 
-        # Update node
+        # Update node and log event in one commit
         updated_node = await self.decision_service.update_node(
             node,
+            events_to_log=[(
+                "move_chosen",
+                {
+                    "move_id": move_id,
+                    "move_title": chosen_move["title"],
+                },
+            )],
             phase=NodePhase.EXECUTE.value,
             chosen_move_id=move_id,
             execution_plan_json=execution_plan.model_dump(),
         )
 
-        # Log event
-        await self.decision_service.log_event(
-            decision_id=node.decision_id,
-            node_id=node.id,
-            event_type="move_chosen",
-            payload={
-                "move_id": move_id,
-                "move_title": chosen_move["title"],
-            },
-        )
-
         return updated_node, execution_plan
 
     def _format_qa(self, questions: list[dict], answers: list[Answer]) -> str:
@@ -8,14 +8,18 @@ This service orchestrates the Psychologist's Algorithm:
 5. Returns structured responses with state updates
 """
 
+import asyncio
 import re
 import logging
+from functools import lru_cache
+from dataclasses import dataclass, field
 from typing import Optional
 from pydantic import BaseModel, Field
 
 from app.ai.gateway import AIGateway
 from app.ai.prompts.psychologist_prompts import (
     build_psychologist_system_prompt,
+    format_recent_history,
     RESPONSE_FORMAT,
 )
 from app.schemas.psychologist_state import (
@@ -34,21 +38,114 @@ from app.services.pattern_detector import (
 
 logger = logging.getLogger(__name__)
 
+# Banned question patterns, compiled once. Most responses match none of them,
+# which the combined alternation settles in a single scan.
+_BANNED_PATTERNS = [(p, re.compile(p, re.IGNORECASE)) for p in STATE_BANNED_PATTERNS]
+_ANY_BANNED_RE = re.compile(
+    "|".join(f"(?:{p})" for p in STATE_BANNED_PATTERNS), re.IGNORECASE
+)
+
+# Phrases that count as a synthesis statement, found with one scan
+SYNTHESIS_INDICATORS = (
+    "so far",
+    "understanding that",
+    "i'm hearing",
+    "let me check",
+    "what i'm getting",
+    "to summarize",
+)
+_SYNTHESIS_RE = re.compile("|".join(map(re.escape, SYNTHESIS_INDICATORS)))
+
+# Response moves allowed in each conversation phase
+ALLOWED_MOVES_BY_PHASE: dict[ConversationPhase, frozenset[ResponseMove]] = {
+    ConversationPhase.OPENING: frozenset({
+        ResponseMove.REFLECTION,
+        ResponseMove.DEEPENING_QUESTION,
+    }),
+    ConversationPhase.EXPLORATION: frozenset({
+        ResponseMove.REFLECTION,
+        ResponseMove.DEEPENING_QUESTION,
+        ResponseMove.OBSERVATION,
+    }),
+    ConversationPhase.DEEPENING: frozenset({
+        ResponseMove.REFLECTION,
+        ResponseMove.OBSERVATION,
+        ResponseMove.CHALLENGE,
+        ResponseMove.SYNTHESIS,
+        ResponseMove.DEEPENING_QUESTION,
+    }),
+    ConversationPhase.INSIGHT: frozenset({
+        ResponseMove.SYNTHESIS,
+        ResponseMove.INSIGHT,
+        ResponseMove.REFLECTION,
+    }),
+    ConversationPhase.CLOSING: frozenset({
+        ResponseMove.SYNTHESIS,
+        ResponseMove.TRANSITION,
+        ResponseMove.INSIGHT,
+    }),
+}
+
+# Correction instructions by validation issue kind
+CORRECTIONS = {
+    "opener": "DO NOT start with 'Understood' or 'Got it' - be more natural",
+    "banned": (
+        "DO NOT ask 'What type/kind of X?' - ask deeper questions like "
+        "'What would that look like?' or 'Tell me about a time when...'"
+    ),
+    "questions": "Ask only ONE question per response. Choose the most important one.",
+    "synthesis": (
+        "You MUST include a synthesis statement. Start with something like "
+        "'So far I'm understanding that...' before asking anything new."
+    ),
+    "move": "Use a different response move that's appropriate for the current phase.",
+}
+
+# Robotic openers and the punctuation after them, stripped by _apply_fixes
+_OPENER_RE = re.compile(
+    r"^(?:\s*(?:understood|got it)\b[\s.,:;\-]*)+", re.IGNORECASE
+)
+
+# Sentence boundaries used when trimming extra questions
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!])\s+")
+
+
+# Response moves by value
+_MOVE_BY_NAME = {move.value: move for move in ResponseMove}
+
+
+@lru_cache(maxsize=128)
+def _parse_move(move_str: str) -> ResponseMove:
+    """Parse a move string into ResponseMove enum.
+
+    The model only ever produces a handful of spellings, so results are cached.
+    Unknown moves default to a deepening question.
+    """
+    return _MOVE_BY_NAME.get(
+        move_str.upper().replace("-", "_").lower(), ResponseMove.DEEPENING_QUESTION
+    )
+
+
+@dataclass(slots=True)
+class PsychologistResponse:
+    """Structured response from the psychologist engine.
 
-class PsychologistResponse(BaseModel):
-    """Structured response from the psychologist engine."""
-    response: str = Field(..., description="The actual response text")
-    response_move: ResponseMove = Field(..., description="Type of move made")
-    question_reason: Optional[str] = Field(None, description="Why this question/statement")
-    suggested_options: Optional[list[str]] = Field(None, description="Quick reply options")
+    Internal return value only, built from already-validated data, so it
+    is a plain dataclass rather than a validated model.
+    """
+    response: str  # The actual response text
+    response_move: ResponseMove  # Type of move made
 
     # State updates
-    state: PsychologistConversationState = Field(..., description="Updated conversation state")
+    state: PsychologistConversationState  # Updated conversation state
+
+    question_reason: Optional[str] = None  # Why this question/statement
+    suggested_options: Optional[list[str]] = None  # Quick reply options
 
     # For canvas updates
-    synthesis_points: list[str] = Field(default_factory=list)
-    core_issue: Optional[str] = Field(None)
-    ready_for_options: bool = Field(default=False)
+    synthesis_points: list[str] = field(default_factory=list)
+    core_issue: Optional[str] = None
+    ready_for_options: bool = False
 
 
 class AIResponseModel(BaseModel):
@@ -121,9 +218,11 @@ class PsychologistEngine:
         state.total_exchange_count += 1
         state.phase_exchange_count += 1
 
-        # Step 1: Detect patterns in the new message
-        pattern_result = await self.pattern_detector.analyze_message(
-            user_message, chat_history, state
+        # Step 1: Detect patterns in the new message, formatting the recent
+        # history for the prompt while the analysis is in flight
+        pattern_result, recent_history = await asyncio.gather(
+            self.pattern_detector.analyze_message(user_message, chat_history, state),
+            asyncio.to_thread(format_recent_history, chat_history),
         )
 
         # Update state with detected patterns
@@ -137,7 +236,7 @@ class PsychologistEngine:
 
         # Step 3: Build prompt and generate response
         system_prompt = build_psychologist_system_prompt(
-            state, situation_text, chat_history
+            state, situation_text, chat_history, recent_history
         )
 
         # Generate response with validation loop
@@ -151,7 +250,7 @@ class PsychologistEngine:
         # Build final response
         return PsychologistResponse(
             response=response.response,
-            response_move=self._parse_move(response.response_move),
+            response_move=state.last_move,
             question_reason=response.question_reason,
             suggested_options=response.suggested_options,
             state=state,
@@ -166,35 +265,37 @@ class PsychologistEngine:
         pattern_result,
     ) -> None:
         """Update state with detected patterns from message analysis."""
-        from app.services.pattern_detector import (
-            create_thread_from_detected,
-            create_observation_from_detected,
-        )
-
-        # Add new threads
-        for detected in pattern_result.new_threads:
-            # Check for duplicates
-            existing_topics = [t.topic.lower() for t in state.active_threads]
-            if detected.topic.lower() not in existing_topics:
-                thread = create_thread_from_detected(
-                    detected, state.total_exchange_count
-                )
-                state.active_threads.append(thread)
-
-        # Update thread depths
-        for thread_id, new_depth in pattern_result.updated_thread_depths.items():
+        # Add new threads, skipping topics already tracked
+        if pattern_result.new_threads:
+            existing_topics = {t.topic_lower for t in state.active_threads}
+            for detected in pattern_result.new_threads:
+                topic_lower = detected.topic.lower()
+                if topic_lower not in existing_topics:
+                    existing_topics.add(topic_lower)
+                    thread = create_thread_from_detected(
+                        detected, state.total_exchange_count
+                    )
+                    state.active_threads.append(thread)
+
+        # Update thread depths in one pass over the threads, looking each
+        # thread's id up in the updates
+        depths = pattern_result.updated_thread_depths
+        if depths:
             for thread in state.active_threads:
-                if thread.id == thread_id:
+                new_depth = depths.get(thread.id)
+                if new_depth is not None:
                     thread.exploration_depth = new_depth
                     thread.last_touched_exchange = state.total_exchange_count
 
-        # Add new observations
-        for detected in pattern_result.new_observations:
-            # Check for duplicates
-            existing_texts = [o.text.lower() for o in state.observations]
-            if detected.text.lower() not in existing_texts:
-                obs = create_observation_from_detected(detected)
-                state.observations.append(obs)
+        # Add new observations, skipping texts already recorded
+        if pattern_result.new_observations:
+            existing_texts = {o.text_lower for o in state.observations}
+            for detected in pattern_result.new_observations:
+                text_lower = detected.text.lower()
+                if text_lower not in existing_texts:
+                    existing_texts.add(text_lower)
+                    obs = create_observation_from_detected(detected)
+                    state.observations.append(obs)
 
         # Update dominant emotion
         if pattern_result.dominant_emotion:
@@ -223,14 +324,17 @@ class PsychologistEngine:
 
             if attempt < self.MAX_REGEN_ATTEMPTS:
                 logger.warning(
-                    f"Response validation failed (attempt {attempt + 1}): {issues}"
+                    f"Response validation failed (attempt {attempt + 1}): "
+                    f"{[issue for _, issue in issues]}"
                 )
                 # Add correction to prompt
                 correction = self._build_correction_prompt(issues)
                 system_prompt = system_prompt + "\n\n" + correction
             else:
                 # Final attempt failed, fix the response ourselves
-                logger.warning(f"Max attempts reached, applying fixes: {issues}")
+                logger.warning(
+                    f"Max attempts reached, applying fixes: {[issue for _, issue in issues]}"
+                )
                 response = self._apply_fixes(response, issues, state)
                 return response
 
@@ -240,123 +344,88 @@ class PsychologistEngine:
         self,
         response: AIResponseModel,
         state: PsychologistConversationState,
-    ) -> list[str]:
+    ) -> list[tuple[str, str]]:
         """Validate a response against the algorithm rules.
 
-        Returns list of issues (empty if valid).
+        Returns list of (kind, description) issues (empty if valid). The kind
+        selects the instruction from CORRECTIONS.
         """
         issues = []
         text = response.response.lower()
 
+        # Cheap string and lookup checks first, regex scans last
+
         # Check for banned openers
         if text.startswith("understood"):
-            issues.append("Starts with 'Understood' (robotic)")
-        if text.startswith("got it"):
-            issues.append("Starts with 'Got it' (robotic)")
-
-        # Check for banned question patterns
-        for pattern in STATE_BANNED_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                issues.append(f"Contains banned pattern: {pattern}")
+            issues.append(("opener", "Starts with 'Understood' (robotic)"))
+        elif text.startswith("got it"):
+            issues.append(("opener", "Starts with 'Got it' (robotic)"))
 
         # Check multiple questions
         question_count = text.count("?")
         if question_count > 1:
-            issues.append(f"Contains {question_count} questions (max 1)")
-
-        # Check synthesis requirement
-        if state.needs_synthesis():
-            synthesis_indicators = [
-                "so far",
-                "understanding that",
-                "i'm hearing",
-                "let me check",
-                "what i'm getting",
-                "to summarize",
-            ]
-            has_synthesis = any(ind in text for ind in synthesis_indicators)
-            if not has_synthesis:
-                issues.append(
-                    f"Missing synthesis (required every 3 exchanges, "
-                    f"last was {state.total_exchange_count - state.last_synthesis_exchange} ago)"
-                )
+            issues.append(("questions", f"Contains {question_count} questions (max 1)"))
 
         # Check move is appropriate for phase
         move = self._parse_move(response.response_move)
         if not self._is_move_allowed_in_phase(move, state.current_phase):
-            issues.append(
-                f"Move {move.value} not appropriate for phase {state.current_phase.value}"
-            )
+            issues.append((
+                "move",
+                f"Move {move.value} not appropriate for phase {state.current_phase.value}",
+            ))
 
         # Check for consecutive questions without reflection
-        if move == ResponseMove.DEEPENING_QUESTION:
-            recent_moves = state.move_history[-2:] if len(state.move_history) >= 2 else []
-            if len(recent_moves) >= 2 and all(
-                m == ResponseMove.DEEPENING_QUESTION for m in recent_moves
-            ):
-                issues.append(
-                    "Asked 2+ questions in a row without reflection/synthesis"
-                )
+        history = state.move_history
+        if (
+            move is ResponseMove.DEEPENING_QUESTION
+            and len(history) >= 2
+            and history[-1] is ResponseMove.DEEPENING_QUESTION
+            and history[-2] is ResponseMove.DEEPENING_QUESTION
+        ):
+            issues.append((
+                "questions",
+                "Asked 2+ questions in a row without reflection/synthesis",
+            ))
 
-        return issues
+        # Check for banned question patterns
+        if _ANY_BANNED_RE.search(text):
+            for pattern, compiled in _BANNED_PATTERNS:
+                if compiled.search(text):
+                    issues.append(("banned", f"Contains banned pattern: {pattern}"))
 
-    def _build_correction_prompt(self, issues: list[str]) -> str:
-        """Build a correction prompt based on validation issues."""
-        corrections = []
+        # Check synthesis requirement
+        if state.needs_synthesis() and _SYNTHESIS_RE.search(text) is None:
+            issues.append((
+                "synthesis",
+                f"Missing synthesis (required every 3 exchanges, "
+                f"last was {state.total_exchange_count - state.last_synthesis_exchange} ago)",
+            ))
 
-        for issue in issues:
-            if "Understood" in issue or "Got it" in issue:
-                corrections.append(
-                    "DO NOT start with 'Understood' or 'Got it' - be more natural"
-                )
-            elif "banned pattern" in issue:
-                corrections.append(
-                    "DO NOT ask 'What type/kind of X?' - ask deeper questions like "
-                    "'What would that look like?' or 'Tell me about a time when...'"
-                )
-            elif "questions" in issue:
-                corrections.append(
-                    "Ask only ONE question per response. Choose the most important one."
-                )
-            elif "synthesis" in issue:
-                corrections.append(
-                    "You MUST include a synthesis statement. Start with something like "
-                    "'So far I'm understanding that...' before asking anything new."
-                )
-            elif "Move" in issue:
-                corrections.append(
-                    "Use a different response move that's appropriate for the current phase."
-                )
+        return issues
 
-        return "## CORRECTIONS REQUIRED\n" + "\n".join(f"- {c}" for c in corrections)
+    def _build_correction_prompt(self, issues: list[tuple[str, str]]) -> str:
+        """Build a correction prompt based on validation issues."""
+        return "## CORRECTIONS REQUIRED\n" + "\n".join(
+            f"- {CORRECTIONS[kind]}" for kind, _ in issues
+        )
 
     def _apply_fixes(
         self,
         response: AIResponseModel,
-        issues: list[str],
+        issues: list[tuple[str, str]],
         state: PsychologistConversationState,
     ) -> AIResponseModel:
         """Apply fixes to a response that failed validation."""
         text = response.response
 
         # Fix banned openers
-        if text.lower().startswith("understood"):
-            text = text[10:].strip()
-            if text.startswith("."):
-                text = text[1:].strip()
-            if text.startswith(","):
-                text = text[1:].strip()
-
-        if text.lower().startswith("got it"):
-            text = text[6:].strip()
-            if text.startswith("."):
-                text = text[1:].strip()
+        text = _OPENER_RE.sub("", text, count=1)
 
         # Fix multiple questions - keep only the last one
         if text.count("?") > 1:
-            sentences = re.split(r"(?<=[.?!])\s+", text)
-            questions = [s for s in sentences if "?" in s]
-            non_questions = [s for s in sentences if "?" not in s]
+            questions, non_questions = [], []
+            for sentence in _SENTENCE_SPLIT_RE.split(text):
+                (questions if "?" in sentence else non_questions).append(sentence)
             if questions and non_questions:
                 text = " ".join(non_questions) + " " + questions[-1]
 
@@ -371,12 +440,7 @@ class PsychologistEngine:
 
     def _parse_move(self, move_str: str) -> ResponseMove:
         """Parse a move string into ResponseMove enum."""
-        move_str = move_str.upper().replace("-", "_")
-        try:
-            return ResponseMove(move_str.lower())
-        except ValueError:
-            # Default to deepening question
-            return ResponseMove.DEEPENING_QUESTION
+        return _parse_move(move_str)
 
     def _is_move_allowed_in_phase(
         self,
@@ -384,36 +448,7 @@ class PsychologistEngine:
         phase: ConversationPhase,
     ) -> bool:
         """Check if a move is allowed in the given phase."""
-        allowed_moves = {
-            ConversationPhase.OPENING: [
-                ResponseMove.REFLECTION,
-                ResponseMove.DEEPENING_QUESTION,
-            ],
-            ConversationPhase.EXPLORATION: [
-                ResponseMove.REFLECTION,
-                ResponseMove.DEEPENING_QUESTION,
-                ResponseMove.OBSERVATION,
-            ],
-            ConversationPhase.DEEPENING: [
-                ResponseMove.REFLECTION,
-                ResponseMove.OBSERVATION,
-                ResponseMove.CHALLENGE,
-                ResponseMove.SYNTHESIS,
-                ResponseMove.DEEPENING_QUESTION,
-            ],
-            ConversationPhase.INSIGHT: [
-                ResponseMove.SYNTHESIS,
-                ResponseMove.INSIGHT,
-                ResponseMove.REFLECTION,
-            ],
-            ConversationPhase.CLOSING: [
-                ResponseMove.SYNTHESIS,
-                ResponseMove.TRANSITION,
-                ResponseMove.INSIGHT,
-            ],
-        }
-
-        return move in allowed_moves.get(phase, [])
+        return move in ALLOWED_MOVES_BY_PHASE.get(phase, frozenset())
 
     def _update_state_from_response(
         self,
@@ -432,9 +467,7 @@ class PsychologistEngine:
 
         # Add synthesis points
         if response.synthesis_points:
-            for point in response.synthesis_points:
-                if point not in state.synthesis_points:
-                    state.synthesis_points.append(point)
+            state.add_synthesis_points(response.synthesis_points)
 
         # Update core issue
         if response.core_issue:
@@ -442,35 +475,41 @@ class PsychologistEngine:
             state.core_issue_statement = response.core_issue
 
         # Add threads from response
-        for thread_data in response.threads_detected:
-            existing_topics = [t.topic.lower() for t in state.active_threads]
-            topic = thread_data.get("topic", "")
-            if topic.lower() not in existing_topics:
-                state.active_threads.append(Thread(
-                    id=f"t{len(state.active_threads) + 1}",
-                    topic=topic,
-                    type=thread_data.get("type", "mentioned"),
-                    emotional_intensity=thread_data.get("emotional_intensity", "medium"),
-                    relevance_score=thread_data.get("relevance_score", 0.5),
-                    exploration_depth=0,
-                    first_mentioned_exchange=state.total_exchange_count,
-                    last_touched_exchange=state.total_exchange_count,
-                    related_quotes=[thread_data.get("supporting_quote", "")],
-                ))
+        if response.threads_detected:
+            existing_topics = {t.topic_lower for t in state.active_threads}
+            for thread_data in response.threads_detected:
+                topic = thread_data.get("topic", "")
+                topic_lower = topic.lower()
+                if topic_lower not in existing_topics:
+                    existing_topics.add(topic_lower)
+                    state.active_threads.append(Thread(
+                        id=f"t{len(state.active_threads) + 1}",
+                        topic=topic,
+                        type=thread_data.get("type", "mentioned"),
+                        emotional_intensity=thread_data.get("emotional_intensity", "medium"),
+                        relevance_score=thread_data.get("relevance_score", 0.5),
+                        exploration_depth=0,
+                        first_mentioned_exchange=state.total_exchange_count,
+                        last_touched_exchange=state.total_exchange_count,
+                        related_quotes=[thread_data.get("supporting_quote", "")],
+                    ))
 
         # Add observations from response
-        for obs_data in response.observations_detected:
-            existing_texts = [o.text.lower() for o in state.observations]
-            obs_text = obs_data.get("text", "")
-            if obs_text.lower() not in existing_texts:
-                state.observations.append(Observation(
-                    id=f"o{len(state.observations) + 1}",
-                    type=obs_data.get("type", "pattern"),
-                    text=obs_text,
-                    confidence=obs_data.get("confidence", 0.7),
-                    supporting_quotes=obs_data.get("supporting_quotes", []),
-                    surfaced=False,
-                ))
+        if response.observations_detected:
+            existing_texts = {o.text_lower for o in state.observations}
+            for obs_data in response.observations_detected:
+                obs_text = obs_data.get("text", "")
+                text_lower = obs_text.lower()
+                if text_lower not in existing_texts:
+                    existing_texts.add(text_lower)
+                    state.observations.append(Observation(
+                        id=f"o{len(state.observations) + 1}",
+                        type=obs_data.get("type", "pattern"),
+                        text=obs_text,
+                        confidence=obs_data.get("confidence", 0.7),
+                        supporting_quotes=obs_data.get("supporting_quotes", []),
+                        surfaced=False,
+                    ))
 
         # Mark observation as surfaced if it was an observation move
         if move == ResponseMove.OBSERVATION:
@@ -1,8 +1,72 @@
 """Question Value Scorer - Calculates Value of Information (VoI) for questions."""
 
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable
+
 from app.schemas.question import CandidateQuestion, ConversationState
 from app.schemas.canvas import CanvasState
 
+# Wording that suggests a question is asking about a hard constraint
+_HARD_CONSTRAINT_RE = re.compile("must|required", re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
+class _CanvasFeatures:
+    """The parts of a canvas that question scores depend on."""
+
+    has_statement: bool
+    n_criteria: int
+    n_constraints: int
+    has_hard_constraint: bool
+
+    @classmethod
+    def from_canvas(cls, canvas: CanvasState) -> "_CanvasFeatures":
+        return cls(
+            has_statement=bool(canvas.statement),
+            n_criteria=len(canvas.criteria),
+            n_constraints=len(canvas.constraints),
+            has_hard_constraint=canvas.has_hard_constraint,
+        )
+
+
+def _constraints_critical_score(canvas: _CanvasFeatures) -> float:
+    """Critical score for constraint questions; hard constraints matter most."""
+    if canvas.n_constraints == 0:
+        return 90.0
+    elif not canvas.has_hard_constraint:
+        return 50.0
+    else:
+        return 20.0
+
+
+def _constraints_impact_score(question: CandidateQuestion, canvas: _CanvasFeatures) -> float:
+    """Impact score for constraint questions, which can eliminate options."""
+    # Check if this might be a hard constraint
+    if _HARD_CONSTRAINT_RE.search(question.question):
+        return 85.0
+    else:
+        return 60.0
+
+
+def _criteria_impact_score(question: CandidateQuestion, canvas: _CanvasFeatures) -> float:
+    """Impact score for criteria questions; the first few criteria matter most."""
+    num_criteria = canvas.n_criteria
+    if num_criteria == 0:
+        return 90.0
+    elif num_criteria < 3:
+        return 70.0
+    else:
+        return 40.0
+
+
+def _asked_field_counts(conversation_state: ConversationState) -> Counter[str]:
+    """Count the questions already asked about each canvas field."""
+    return Counter(
+        qa.question.targets_canvas_field for qa in conversation_state.asked_questions
+    )
+
 
 class QuestionValueScorer:
     """
@@ -26,6 +90,42 @@ class QuestionValueScorer:
     # Diminishing returns threshold
     DIMINISHING_RETURNS_THRESHOLD = 0.10  # 10% average reduction
 
+    # Per-field scoring rules; fields without a rule get the method's default
+    _CRITICAL_RULES: dict[str, Callable[[_CanvasFeatures], float]] = {
+        "statement": lambda canvas: 100.0 if not canvas.has_statement else 20.0,
+        "criteria": lambda canvas: 100.0 if canvas.n_criteria == 0 else 30.0,
+        "constraints": _constraints_critical_score,
+        # Important metadata fields
+        "reversibility": lambda canvas: 70.0,
+        "timeline": lambda canvas: 70.0,
+        "stakes": lambda canvas: 70.0,
+        # Context is helpful but not critical
+        "context": lambda canvas: 40.0,
+    }
+    _UNCERTAINTY_RULES: dict[str, Callable[[_CanvasFeatures], float]] = {
+        # Questions that define what matters are more valuable while few exist
+        "criteria": lambda canvas: 85.0 if canvas.n_criteria < 2 else 50.0,
+        # Constraints can eliminate options
+        "constraints": lambda canvas: 90.0 if canvas.n_constraints < 1 else 50.0,
+        # Statement definition is critical for framing
+        "statement": lambda canvas: 100.0 if not canvas.has_statement else 30.0,
+        # Metadata fields help with heuristics
+        "reversibility": lambda canvas: 70.0,
+        "stakes": lambda canvas: 70.0,
+        "timeline": lambda canvas: 70.0,
+        # Context is helpful but less impactful
+        "context": lambda canvas: 40.0,
+    }
+    _IMPACT_RULES: dict[str, Callable[[CandidateQuestion, _CanvasFeatures], float]] = {
+        "constraints": _constraints_impact_score,
+        "criteria": _criteria_impact_score,
+        # Statement frames everything
+        "statement": lambda question, canvas: 95.0 if not canvas.has_statement else 20.0,
+        # Metadata impacts heuristics
+        "reversibility": lambda question, canvas: 65.0,
+        "stakes": lambda question, canvas: 65.0,
+    }
+
     def score_question(
         self,
         question: CandidateQuestion,
@@ -43,10 +143,50 @@ class QuestionValueScorer:
         Returns:
             VoI score between 0 and 100
         """
-        critical_score = self._calculate_critical_score(question, current_canvas)
-        uncertainty_score = self._calculate_uncertainty_reduction(question, current_canvas)
-        impact_score = self._calculate_impact_score(question, current_canvas)
-        redundancy_penalty = self._calculate_redundancy(question, conversation_state)
+        return self._score(
+            question,
+            _CanvasFeatures.from_canvas(current_canvas),
+            _asked_field_counts(conversation_state),
+        )
+
+    def score_questions(
+        self,
+        questions: list[CandidateQuestion],
+        current_canvas: CanvasState,
+        conversation_state: ConversationState,
+    ) -> list[tuple[CandidateQuestion, float]]:
+        """
+        Calculate VoI scores (0-100) for several questions against one canvas.
+
+        The canvas and the questions already asked are summarized once
+        rather than once per question.
+
+        Args:
+            questions: The candidate questions to score
+            current_canvas: Current state of the decision canvas
+            conversation_state: Current conversation state
+
+        Returns:
+            (question, VoI score) pairs, in the order given
+        """
+        features = _CanvasFeatures.from_canvas(current_canvas)
+        asked_counts = _asked_field_counts(conversation_state)
+        return [
+            (question, self._score(question, features, asked_counts))
+            for question in questions
+        ]
+
+    def _score(
+        self,
+        question: CandidateQuestion,
+        canvas: _CanvasFeatures,
+        asked_counts: Counter[str],
+    ) -> float:
+        """Calculate the clamped VoI score for a question."""
+        critical_score = self._calculate_critical_score(question, canvas)
+        uncertainty_score = self._calculate_uncertainty_reduction(question, canvas)
+        impact_score = self._calculate_impact_score(question, canvas)
+        redundancy_penalty = self._calculate_redundancy(question, asked_counts)
 
         voi = (
             self.CRITICAL_WEIGHT * critical_score
@@ -59,7 +199,7 @@ class QuestionValueScorer:
         return max(0.0, min(100.0, voi))
 
     def _calculate_critical_score(
-        self, question: CandidateQuestion, canvas: CanvasState
+        self, question: CandidateQuestion, canvas: _CanvasFeatures
     ) -> float:
         """
         Score based on whether question fills critical missing field.
@@ -76,39 +216,12 @@ class QuestionValueScorer:
         if question.critical_variable:
             return 100.0
 
-        field = question.targets_canvas_field
-
-        # Check if field is critical and missing
-        if field == "statement":
-            return 100.0 if not canvas.statement else 20.0
-
-        elif field == "criteria":
-            return 100.0 if len(canvas.criteria) == 0 else 30.0
-
-        elif field == "constraints":
-            # Hard constraints are more critical
-            has_hard = any(c.type == "hard" for c in canvas.constraints)
-            if len(canvas.constraints) == 0:
-                return 90.0
-            elif not has_hard:
-                return 50.0
-            else:
-                return 20.0
-
-        elif field in ["reversibility", "timeline", "stakes"]:
-            # These are important metadata fields
-            return 70.0
-
-        elif field == "context":
-            # Context is helpful but not critical
-            return 40.0
-
-        else:
-            # Other fields are less critical
-            return 20.0
+        rule = self._CRITICAL_RULES.get(question.targets_canvas_field)
+        # Other fields are less critical
+        return rule(canvas) if rule else 20.0
 
     def _calculate_uncertainty_reduction(
-        self, question: CandidateQuestion, canvas: CanvasState
+        self, question: CandidateQuestion, canvas: _CanvasFeatures
     ) -> float:
         """
         Estimate how much this question reduces decision uncertainty.
@@ -120,35 +233,11 @@ class QuestionValueScorer:
 
         Returns: 0-100
         """
-        field = question.targets_canvas_field
-
-        # Questions that define what matters are high value
-        if field in ["criteria", "constraints"]:
-            # If we have few criteria/constraints, more valuable
-            if field == "criteria" and len(canvas.criteria) < 2:
-                return 85.0
-            elif field == "constraints" and len(canvas.constraints) < 1:
-                return 90.0  # Constraints can eliminate options
-            else:
-                return 50.0  # Still useful but lower priority
-
-        # Statement definition is critical for framing
-        elif field == "statement":
-            return 100.0 if not canvas.statement else 30.0
-
-        # Metadata fields help with heuristics
-        elif field in ["reversibility", "stakes", "timeline"]:
-            return 70.0
-
-        # Context is helpful but less impactful
-        elif field == "context":
-            return 40.0
-
-        else:
-            return 30.0
+        rule = self._UNCERTAINTY_RULES.get(question.targets_canvas_field)
+        return rule(canvas) if rule else 30.0
 
     def _calculate_impact_score(
-        self, question: CandidateQuestion, canvas: CanvasState
+        self, question: CandidateQuestion, canvas: _CanvasFeatures
     ) -> float:
         """
         Score based on expected impact on option generation/ranking.
@@ -164,40 +253,11 @@ class QuestionValueScorer:
 
         Returns: 0-100
         """
-        field = question.targets_canvas_field
-
-        # Hard constraints can eliminate options
-        if field == "constraints":
-            # Check if this might be a hard constraint
-            if "must" in question.question.lower() or "required" in question.question.lower():
-                return 85.0
-            else:
-                return 60.0
-
-        # Criteria affect option scoring
-        elif field == "criteria":
-            # First few criteria are most impactful
-            num_criteria = len(canvas.criteria)
-            if num_criteria == 0:
-                return 90.0
-            elif num_criteria < 3:
-                return 70.0
-            else:
-                return 40.0
-
-        # Statement frames everything
-        elif field == "statement":
-            return 95.0 if not canvas.statement else 20.0
-
-        # Metadata impacts heuristics
-        elif field in ["reversibility", "stakes"]:
-            return 65.0
-
-        else:
-            return 35.0
+        rule = self._IMPACT_RULES.get(question.targets_canvas_field)
+        return rule(question, canvas) if rule else 35.0
 
     def _calculate_redundancy(
-        self, question: CandidateQuestion, conversation_state: ConversationState
+        self, question: CandidateQuestion, asked_counts: Counter[str]
     ) -> float:
         """
         Calculate redundancy penalty (0-100).
@@ -209,14 +269,8 @@ class QuestionValueScorer:
 
         Returns: 0-100 (higher = more redundant)
         """
-        field = question.targets_canvas_field
-
         # Check how many questions already asked about this field
-        questions_on_field = sum(
-            1
-            for qa in conversation_state.asked_questions
-            if qa.question.targets_canvas_field == field
-        )
+        questions_on_field = asked_counts[question.targets_canvas_field]
 
         if questions_on_field == 0:
             return 0.0  # No redundancy
@@ -1,12 +1,22 @@
 """Service for managing background tasks."""
 
 import uuid
-from datetime import datetime
-from sqlalchemy import select
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from itertools import groupby
+from sqlalchemy import func, insert, select, update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.background_task import BackgroundTask, TaskStatus, TaskType
 
+# Task listings only need the summary columns; the JSON payloads can be large,
+# so they are left unloaded and raise if accessed
+_WITHOUT_PAYLOADS = (
+    defer(BackgroundTask.input_data, raiseload=True),
+    defer(BackgroundTask.result_data, raiseload=True),
+)
+
 
 class TaskService:
     """Service for managing background tasks."""
@@ -22,16 +32,20 @@ class TaskService:
         input_data: dict | None = None,
     ) -> BackgroundTask:
         """Create a new background task."""
-        task = BackgroundTask(
-            task_type=task_type.value,
-            decision_id=decision_id,
-            node_id=node_id,
-            input_data=input_data or {},
-            status=TaskStatus.PENDING.value,
+        # INSERT ... RETURNING hands back the row, so no refresh is needed
+        result = await self.db.execute(
+            insert(BackgroundTask)
+            .values(
+                task_type=task_type.value,
+                decision_id=decision_id,
+                node_id=node_id,
+                input_data=input_data or {},
+                status=TaskStatus.PENDING.value,
+            )
+            .returning(BackgroundTask)
         )
-        self.db.add(task)
+        task = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(task)
         return task
 
     async def get_task(self, task_id: uuid.UUID) -> BackgroundTask | None:
@@ -52,12 +66,7 @@ class TaskService:
         self, task_id: uuid.UUID, celery_task_id: str
     ) -> BackgroundTask | None:
         """Update task with Celery task ID."""
-        task = await self.get_task(task_id)
-        if task:
-            task.celery_task_id = celery_task_id
-            await self.db.commit()
-            await self.db.refresh(task)
-        return task
+        return await self._update_task(task_id, celery_task_id=celery_task_id)
 
     async def update_task_status(
         self,
@@ -67,58 +76,81 @@ class TaskService:
         error_message: str | None = None,
     ) -> BackgroundTask | None:
         """Update task status and optionally result/error."""
-        task = await self.get_task(task_id)
-        if not task:
-            return None
-
-        task.status = status.value
+        values = {"status": status.value}
 
+        # Stamped by the database so every worker shares one clock
         if status == TaskStatus.PROCESSING:
-            task.started_at = datetime.utcnow()
+            values["started_at"] = func.now()
         elif status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-            task.completed_at = datetime.utcnow()
+            values["completed_at"] = func.now()
 
         if result_data is not None:
-            task.result_data = result_data
+            values["result_data"] = result_data
         if error_message is not None:
-            task.error_message = error_message
+            values["error_message"] = error_message
+
+        return await self._update_task(task_id, **values)
 
+    async def _update_task(self, task_id: uuid.UUID, **values) -> BackgroundTask | None:
+        """Update a task in one UPDATE ... RETURNING; None if it doesn't exist."""
+        result = await self.db.execute(
+            sql_update(BackgroundTask)
+            .where(BackgroundTask.id == task_id)
+            .values(**values)
+            .returning(BackgroundTask)
+        )
+        task = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(task)
         return task
 
     async def increment_retry_count(self, task_id: uuid.UUID) -> BackgroundTask | None:
         """Increment retry count for a task."""
-        task = await self.get_task(task_id)
-        if task:
-            task.retry_count += 1
-            await self.db.commit()
-            await self.db.refresh(task)
-        return task
+        # Incremented in SQL so concurrent workers don't lose retries
+        return await self._update_task(
+            task_id, retry_count=BackgroundTask.retry_count + 1
+        )
 
     async def get_pending_tasks_for_node(
         self, node_id: uuid.UUID
     ) -> list[BackgroundTask]:
-        """Get all pending/processing tasks for a node."""
+        """Get all pending/processing tasks for a node, without their payloads."""
+        return (await self.get_pending_tasks_for_nodes([node_id]))[node_id]
+
+    async def get_pending_tasks_for_nodes(
+        self, node_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, list[BackgroundTask]]:
+        """Get pending/processing tasks for several nodes in one query.
+
+        Every requested node gets an entry, newest task first; nodes with
+        nothing pending map to an empty list.
+        """
+        tasks_by_node = {node_id: [] for node_id in node_ids}
+        if not tasks_by_node:
+            return tasks_by_node
+
         result = await self.db.execute(
             select(BackgroundTask)
-            .where(BackgroundTask.node_id == node_id)
+            .options(*_WITHOUT_PAYLOADS)
+            .where(BackgroundTask.node_id.in_(tasks_by_node))
             .where(
                 BackgroundTask.status.in_([
                     TaskStatus.PENDING.value,
                     TaskStatus.PROCESSING.value,
                 ])
             )
-            .order_by(BackgroundTask.created_at.desc())
+            .order_by(BackgroundTask.node_id, BackgroundTask.created_at.desc())
         )
-        return list(result.scalars().all())
+        for node_id, tasks in groupby(result.scalars(), key=lambda t: t.node_id):
+            tasks_by_node[node_id] = list(tasks)
+        return tasks_by_node
 
     async def get_recent_tasks_for_node(
         self, node_id: uuid.UUID, limit: int = 10
     ) -> list[BackgroundTask]:
-        """Get recent tasks for a node (all statuses)."""
+        """Get recent tasks for a node (all statuses), without their payloads."""
         result = await self.db.execute(
             select(BackgroundTask)
+            .options(*_WITHOUT_PAYLOADS)
             .where(BackgroundTask.node_id == node_id)
             .order_by(BackgroundTask.created_at.desc())
             .limit(limit)
@@ -129,11 +161,9 @@ class TaskService:
         self, older_than_minutes: int = 30
     ) -> int:
         """Mark stuck processing tasks as failed."""
-        from sqlalchemy import update as sql_update
-
-        cutoff = datetime.utcnow()
-        from datetime import timedelta
-        cutoff = cutoff - timedelta(minutes=older_than_minutes)
+        # started_at is stamped by the database; the cutoff uses this host's
+        # clock because interval arithmetic on now() isn't portable to SQLite
+        cutoff = datetime.utcnow() - timedelta(minutes=older_than_minutes)
 
         result = await self.db.execute(
             sql_update(BackgroundTask)
@@ -142,7 +172,7 @@ class TaskService:
             .values(
                 status=TaskStatus.FAILED.value,
                 error_message="Task timed out",
-                completed_at=datetime.utcnow(),
+                completed_at=func.now(),
             )
         )
         await self.db.commit()
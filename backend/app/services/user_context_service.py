@@ -1,17 +1,130 @@
 """User Context Service - Builds compact user context for AI prompt injection."""
 
+import asyncio
+import logging
+import re
 import uuid
+import weakref
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.models.user import User
 from app.models.user_profile import UserProfile
-from app.models.observation import Observation, ObservationType
+from app.models.observation import FULL_TEXT_AVAILABLE, Observation, ObservationType
 from app.models.decision import Decision
 
+# Optional C Aho-Corasick implementation (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional Redis client (installed with the celery extra)
+try:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+except ImportError:
+    Redis = None
+    RedisError = Exception
+
+# Cache failures degrade to a miss. RuntimeError/OSError cover connections
+# that are unusable on the current event loop or unreachable.
+_CACHE_ERRORS = (RedisError, RuntimeError, OSError)
+
+logger = logging.getLogger(__name__)
+
+# How long a refreshed context summary is served before being rebuilt
+CONTEXT_SUMMARY_TTL = timedelta(hours=24)
+
+
+# Redis clients per event loop. Their connection pools are bound to the loop
+# they were created on, and Celery runs each task on a fresh loop; loops are
+# weakly referenced so a closed loop's client is dropped with it.
+_context_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_context_cache() -> "Redis | None":
+    """Redis client for context summaries on the running loop, or None when disabled."""
+    settings = get_settings()
+    if Redis is None or not settings.use_redis_context_cache:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    client = _context_caches.get(loop)
+    if client is None:
+        client = Redis.from_url(settings.redis_url, decode_responses=True)
+        _context_caches[loop] = client
+    return client
+
+
+# Common decision-related keywords (substring match on lowercased text)
+KEYWORD_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "career": ("job", "career", "work", "promotion", "salary", "boss", "colleague"),
+    "startup": ("startup", "business", "founder", "invest", "equity", "product"),
+    "relationship": ("relationship", "dating", "partner", "marriage", "love"),
+    "health": ("health", "fitness", "diet", "exercise", "weight", "gym"),
+    "finance": ("money", "invest", "save", "budget", "debt", "financial"),
+    "education": ("school", "degree", "study", "course", "learn", "university"),
+}
+
+
+def _build_keyword_automaton():
+    """Compile every keyword into one automaton mapping it to its categories."""
+    if ahocorasick is None:
+        return None
+
+    categories_by_keyword: dict[str, set[str]] = {}
+    for category, keywords in KEYWORD_CATEGORIES.items():
+        for keyword in keywords:
+            categories_by_keyword.setdefault(keyword, set()).add(category)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in categories_by_keyword.items():
+        automaton.add_word(keyword, frozenset(categories))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Fallback without pyahocorasick: one alternation per category
+_KEYWORD_PATTERNS: dict[str, re.Pattern[str]] = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in KEYWORD_CATEGORIES.items()
+}
+
+
+@lru_cache(maxsize=2048)
+def _extract_keyword_categories(text: str) -> tuple[str, ...]:
+    """Return the categories whose keywords occur in the text.
+
+    Cached because the same situation text is matched on every prompt build
+    for a decision; the keyword table never changes, so entries never go stale.
+    """
+    text_lower = text.lower()
+
+    if _KEYWORD_AUTOMATON is not None:
+        found: set[str] = set()
+        for _, categories in _KEYWORD_AUTOMATON.iter(text_lower):
+            found |= categories
+        return tuple(found)
+
+    return tuple(
+        category
+        for category, pattern in _KEYWORD_PATTERNS.items()
+        if pattern.search(text_lower) is not None
+    )
+
 
 class UserContextService:
     """Service for building and managing user context for AI personalization.
@@ -23,8 +136,14 @@ class UserContextService:
 
     TOKEN_BUDGET = 400  # Approximate token limit for context
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: "Redis | None" = None):
         self.db = db
+        self._cache = cache
+
+    @property
+    def cache(self) -> "Redis | None":
+        """The injected Redis client, or the shared one for the running loop."""
+        return self._cache if self._cache is not None else get_context_cache()
 
     async def get_or_create_profile(self, user_id: uuid.UUID) -> UserProfile:
         """Get existing profile or create a new one for the user."""
@@ -37,7 +156,6 @@ class UserContextService:
             profile = UserProfile(user_id=user_id)
             self.db.add(profile)
             await self.db.commit()
-            await self.db.refresh(profile)
 
         return profile
 
@@ -64,12 +182,20 @@ class UserContextService:
             Recent: Made decision about job offer (chose to stay), working on delegation
             ---
         """
+        # A fresh summary mirrored in Redis saves the profile lookup
+        cached = await self._get_cached_summary(user_id)
+        if cached is not None:
+            return cached
+
         profile = await self.get_or_create_profile(user_id)
 
         # If we have a cached summary and it's recent, use it
         if profile.context_summary and profile.context_summary_updated_at:
             age = datetime.now(timezone.utc) - profile.context_summary_updated_at
-            if age < timedelta(hours=24):
+            if age < CONTEXT_SUMMARY_TTL:
+                await self._cache_summary(
+                    user_id, profile.context_summary, CONTEXT_SUMMARY_TTL - age
+                )
                 return profile.context_summary
 
         # Build fresh context
@@ -166,6 +292,32 @@ class UserContextService:
         if not keywords:
             return ""
 
+        if not FULL_TEXT_AVAILABLE:
+            return await self._score_relevant_observations(user_id, keywords, limit)
+
+        # Match and rank in PostgreSQL so only the top rows come back.
+        # Keywords are fixed category names, so they can be OR-ed directly.
+        query = func.to_tsquery("english", " | ".join(keywords))
+        result = await self.db.execute(
+            select(Observation.observation_text)
+            .where(
+                Observation.user_id == user_id,
+                Observation.user_feedback != "incorrect",
+                Observation.confidence >= 0.6,
+                Observation.search_tsv.op("@@")(query),
+            )
+            .order_by(
+                func.ts_rank_cd(Observation.search_tsv, query).desc(),
+                Observation.confidence.desc(),
+            )
+            .limit(limit)
+        )
+        return "; ".join(result.scalars().all())
+
+    async def _score_relevant_observations(
+        self, user_id: uuid.UUID, keywords: list[str], limit: int
+    ) -> str:
+        """Keyword-score observations in Python, for databases without full-text search."""
         # Find observations with matching tags or themes
         result = await self.db.execute(
             select(Observation)
@@ -206,28 +358,10 @@ class UserContextService:
     def _extract_keywords(self, text: str) -> list[str]:
         """Extract potential keywords from text for matching.
 
-        Simple approach - in production, consider using NLP.
+        Simple approach - in production, consider using NLP. Returns the
+        categories whose keywords occur in the text.
         """
-        # Common decision-related keywords
-        keyword_categories = {
-            "career": ["job", "career", "work", "promotion", "salary", "boss", "colleague"],
-            "startup": ["startup", "business", "founder", "invest", "equity", "product"],
-            "relationship": ["relationship", "dating", "partner", "marriage", "love"],
-            "health": ["health", "fitness", "diet", "exercise", "weight", "gym"],
-            "finance": ["money", "invest", "save", "budget", "debt", "financial"],
-            "education": ["school", "degree", "study", "course", "learn", "university"],
-        }
-
-        text_lower = text.lower()
-        found = []
-
-        for category, words in keyword_categories.items():
-            for word in words:
-                if word in text_lower:
-                    found.append(category)
-                    break
-
-        return list(set(found))
+        return list(_extract_keyword_categories(text))
 
     async def refresh_context_summary(self, user_id: uuid.UUID) -> str:
         """Refresh and cache the user's context summary.
@@ -238,6 +372,7 @@ class UserContextService:
         - Profile update
         """
         profile = await self.get_or_create_profile(user_id)
+        await self.invalidate_cached_summary(user_id)
 
         # Build fresh context
         context = await self.build_user_context(
@@ -249,9 +384,47 @@ class UserContextService:
         profile.context_summary = context
         profile.context_summary_updated_at = datetime.now(timezone.utc)
         await self.db.commit()
+        if context:
+            await self._cache_summary(user_id, context, CONTEXT_SUMMARY_TTL)
 
         return context
 
+    async def _get_cached_summary(self, user_id: uuid.UUID) -> str | None:
+        """Get the context summary mirrored in Redis, if any."""
+        cache = self.cache
+        if cache is None:
+            return None
+        try:
+            return await cache.get(f"uctx:{user_id}")
+        except _CACHE_ERRORS as e:
+            logger.warning("Context cache read failed: %s", e)
+            return None
+
+    async def _cache_summary(
+        self, user_id: uuid.UUID, context: str, ttl: timedelta
+    ) -> None:
+        """Mirror a context summary in Redis until it would go stale."""
+        cache = self.cache
+        if cache is None:
+            return
+        try:
+            await cache.set(f"uctx:{user_id}", context, ex=ttl)
+        except _CACHE_ERRORS as e:
+            logger.warning("Context cache write failed: %s", e)
+
+    async def invalidate_cached_summary(self, user_id: uuid.UUID) -> None:
+        """Drop the Redis copy of a user's context summary.
+
+        Call this wherever ``context_summary_updated_at`` is reset.
+        """
+        cache = self.cache
+        if cache is None:
+            return
+        try:
+            await cache.delete(f"uctx:{user_id}")
+        except _CACHE_ERRORS as e:
+            logger.warning("Context cache invalidation failed: %s", e)
+
     async def update_profile_from_conversation(
         self,
         user_id: uuid.UUID,
@@ -289,3 +462,4 @@ class UserContextService:
         profile.context_summary_updated_at = None
 
         await self.db.commit()
+        await self.invalidate_cached_summary(user_id)
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any
 
 from celery import Task
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from app.celery_app import celery_app
 from app.database_sync import get_sync_db
@@ -42,7 +42,7 @@ async def _process_chat_message_async(
     from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
     from app.config import get_settings
-    from app.services.chat_service import ChatService
+    from app.services.chat_service import ChatService, needs_history_compaction
 
     settings = get_settings()
 
@@ -64,6 +64,10 @@ async def _process_chat_message_async(
         chat_service = ChatService(db, api_key)
         response = await chat_service.send_message(node, user_message)
 
+        # Summarize older messages in a task of its own, not this one
+        if needs_history_compaction(node.chat_messages_json):
+            compact_chat_history_task.delay(node_id=node_id, api_key=api_key)
+
         # Convert response to dict for serialization
         return response.model_dump(mode="json")
 
@@ -105,7 +109,7 @@ def process_chat_message_task(
 
         if task:
             task.status = TaskStatus.PROCESSING.value
-            task.started_at = datetime.utcnow()
+            task.started_at = func.now()
             task.celery_task_id = self.request.id
             db.commit()
 
@@ -123,7 +127,7 @@ def process_chat_message_task(
 
             if task:
                 task.status = TaskStatus.COMPLETED.value
-                task.completed_at = datetime.utcnow()
+                task.completed_at = func.now()
                 task.result_data = result
                 db.commit()
 
@@ -145,7 +149,7 @@ def process_chat_message_task(
                     task.error_message = f"Retry {self.request.retries + 1}: {str(e)}"
                 else:
                     task.status = TaskStatus.FAILED.value
-                    task.completed_at = datetime.utcnow()
+                    task.completed_at = func.now()
                     task.error_message = str(e)
 
                 db.commit()
@@ -180,7 +184,7 @@ def process_start_decision_task(
 
         if task:
             task.status = TaskStatus.PROCESSING.value
-            task.started_at = datetime.utcnow()
+            task.started_at = func.now()
             task.celery_task_id = self.request.id
             db.commit()
 
@@ -198,7 +202,7 @@ def process_start_decision_task(
 
             if task:
                 task.status = TaskStatus.COMPLETED.value
-                task.completed_at = datetime.utcnow()
+                task.completed_at = func.now()
                 task.result_data = result
                 db.commit()
 
@@ -219,7 +223,7 @@ def process_start_decision_task(
                     task.error_message = f"Retry {self.request.retries + 1}: {str(e)}"
                 else:
                     task.status = TaskStatus.FAILED.value
-                    task.completed_at = datetime.utcnow()
+                    task.completed_at = func.now()
                     task.error_message = str(e)
 
                 db.commit()
@@ -275,3 +279,36 @@ async def _process_start_decision_async(
 
     await engine.dispose()
     return result
+
+
+async def _compact_chat_history_async(node_id: str, api_key: str) -> None:
+    """Async implementation of chat history compaction."""
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+    from app.config import get_settings
+    from app.services.chat_service import ChatService
+
+    settings = get_settings()
+
+    engine = create_async_engine(settings.database_url, echo=False)
+    AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with AsyncSessionLocal() as db:
+        await ChatService(db, api_key).compact_chat_history(uuid.UUID(node_id))
+
+    await engine.dispose()
+
+
+@celery_app.task(
+    base=ChatTask,
+    name="app.tasks.chat_tasks.compact_chat_history",
+    max_retries=1,
+)
+def compact_chat_history_task(node_id: str, api_key: str) -> None:
+    """Fold a node's older chat messages into a summary.
+
+    Queued after a chat turn whose transcript passed the compaction
+    threshold. Safe to run alongside new turns: the node is rewritten under
+    a row lock and only if the summarized messages are still its prefix.
+    """
+    run_async(_compact_chat_history_async(node_id, api_key))
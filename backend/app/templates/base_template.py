@@ -30,8 +30,15 @@ class BaseTemplate(ABC):
     script_style_direct: str = "Confident and clear"
     script_style_softer: str = "Warm and approachable"
 
+    # Prompt context, built on first use. Registered templates are shared
+    # singletons whose attributes never change, so it is built once each.
+    _context: Optional[str] = None
+
     def get_template_context(self) -> str:
         """Get template-specific context for prompts."""
+        if self._context is not None:
+            return self._context
+
         context = f"""
 ## Template: {self.name}
 {self.description}
@@ -49,6 +56,7 @@ class BaseTemplate(ABC):
 - Direct: {self.script_style_direct}
 - Softer: {self.script_style_softer}
 """
+        self._context = context
         return context
 
     def _format_scoring_emphasis(self) -> str:
@@ -100,9 +108,10 @@ def register_template(template: BaseTemplate) -> None:
 
 
 def get_template(situation_type: str) -> BaseTemplate:
-    """Get a template by situation type."""
-    return _templates.get(situation_type, GenericTemplate())
+    """Get a template by situation type, falling back to the generic one."""
+    return _templates.get(situation_type, _GENERIC_TEMPLATE)
 
 
-# Register generic template
-register_template(GenericTemplate())
+# Register generic template; also the shared fallback for unknown types
+_GENERIC_TEMPLATE = GenericTemplate()
+register_template(_GENERIC_TEMPLATE)
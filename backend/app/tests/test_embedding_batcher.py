@@ -0,0 +1,102 @@
+"""Tests for embedding request coalescing."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.ai import embedding_batcher
+from app.ai.embedding_batcher import EmbeddingBatcher
+
+
+class FakeGateway:
+    """Gateway stub that records each batched embedding call."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Tests for batching concurrent embedding requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Test that requests within the wait window are embedded together."""
+        ai = FakeGateway()
+        batcher = EmbeddingBatcher(ai, max_batch=16, max_wait_ms=10)
+
+        results = await asyncio.gather(*(batcher.submit("x" * n) for n in range(1, 4)))
+
+        assert ai.calls == [["x", "xx", "xxx"]]
+        assert results == [[1.0], [2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """Test that reaching max_batch sends a call without waiting."""
+        ai = FakeGateway()
+        batcher = EmbeddingBatcher(ai, max_batch=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(t) for t in ["a", "bb", "ccc", "dddd"])),
+            timeout=1,
+        )
+
+        assert ai.calls == [["a", "bb"], ["ccc", "dddd"]]
+        assert results == [[1.0], [2.0], [3.0], [4.0]]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self):
+        """Test that a failed batch raises for each waiting request."""
+        batcher = EmbeddingBatcher(FakeGateway(fail=True), max_wait_ms=1)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_new_event_loop_discards_stale_timer(self):
+        """Test that a batch left pending by a closed loop doesn't block the next loop."""
+        ai = FakeGateway()
+        batcher = EmbeddingBatcher(ai, max_batch=16, max_wait_ms=10_000)
+
+        async def abandon():
+            asyncio.ensure_future(batcher.submit("stale"))
+            await asyncio.sleep(0)
+
+        asyncio.run(abandon())
+        assert batcher._timer is not None
+
+        batcher.max_wait = 0.001
+        assert asyncio.run(batcher.submit("fresh")) == [5.0]
+        assert ai.calls == [["fresh"]]
+
+
+class TestGetEmbeddingBatcher:
+    """Tests for the shared batcher registry."""
+
+    def test_batchers_are_per_loop_and_bounded(self):
+        """Test that loops get their own batchers and old keys are evicted."""
+
+        async def get(key):
+            return embedding_batcher.get_embedding_batcher(key)
+
+        async def same_loop():
+            return await get("k1"), await get("k1"), await get("k2"), await get("k1")
+
+        with patch.object(embedding_batcher, "_BATCHERS_PER_LOOP", 1), patch.object(
+            embedding_batcher, "AIGateway"
+        ):
+            first, again, _, evicted = asyncio.run(same_loop())
+            other_loop = asyncio.run(get("k1"))
+
+        assert first is again
+        assert evicted is not first
+        assert other_loop is not first
@@ -0,0 +1,96 @@
+"""Tests for the batched decision event writer."""
+
+import uuid
+
+import pytest
+
+from app.models import DecisionEvent
+from app.services.event_log_batcher import EventLogBatcher
+
+
+def _event() -> DecisionEvent:
+    return DecisionEvent(decision_id=uuid.uuid4(), event_type="test")
+
+
+class RecordingBatcher(EventLogBatcher):
+    """Batcher that records batches instead of writing them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches: list[list[DecisionEvent]] = []
+
+    async def _write(self, batch):
+        self.batches.append(batch)
+
+
+class TestEventLogBatcher:
+    """Tests for size/time based flushing."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self):
+        """Test that a full batch is written without waiting for the timer."""
+        batcher = RecordingBatcher(batch_size=3, batch_ms=10_000)
+        batcher.start()
+        for _ in range(7):
+            await batcher.enqueue(_event())
+        await batcher.flush_on_shutdown()
+
+        assert [len(b) for b in batcher.batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_writes_pending_events(self):
+        """Test that shutdown drains events queued before it."""
+        batcher = RecordingBatcher(batch_size=64, batch_ms=10_000)
+        batcher.start()
+        events = [_event(), _event()]
+        for event in events:
+            await batcher.enqueue(event)
+        await batcher.flush_on_shutdown()
+
+        assert batcher.batches == [events]
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_queued_events(self):
+        """Test that flush returns only after earlier events are written."""
+        batcher = RecordingBatcher(batch_size=64, batch_ms=10_000)
+        batcher.start()
+        events = [_event(), _event()]
+        for event in events:
+            await batcher.enqueue(event)
+
+        await batcher.flush()
+        assert batcher.batches == [events]
+
+        await batcher.flush()
+        assert batcher.batches == [events]
+        await batcher.flush_on_shutdown()
+
+
+class FailingRowBatcher(EventLogBatcher):
+    """Batcher whose inserts fail whenever one given event is included."""
+
+    def __init__(self, bad: DecisionEvent, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bad = bad
+        self.written: list[DecisionEvent] = []
+
+    async def _insert(self, events):
+        if self.bad in events:
+            raise RuntimeError("foreign key violation")
+        self.written.extend(events)
+
+
+class TestFailedBatches:
+    """Tests for recovering from a batch that fails to write."""
+
+    @pytest.mark.asyncio
+    async def test_bad_row_only_drops_itself(self):
+        """Test that the other events of a failed batch are still written."""
+        good, bad, other = _event(), _event(), _event()
+        batcher = FailingRowBatcher(bad, batch_size=3, batch_ms=10_000)
+        batcher.start()
+        for event in (good, bad, other):
+            await batcher.enqueue(event)
+        await batcher.flush_on_shutdown()
+
+        assert batcher.written == [good, other]
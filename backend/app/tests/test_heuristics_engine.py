@@ -0,0 +1,69 @@
+"""Tests for decision heuristic triggers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.schemas.canvas import CanvasState
+from app.services import heuristics_engine
+from app.services.heuristics_engine import HeuristicsEngine, match_triggers
+
+
+class TestMatchTriggers:
+    """Tests for single-pass keyword trigger matching."""
+
+    def test_keyword_in_several_trigger_sets(self):
+        """Test that a shared keyword fires every trigger that lists it."""
+        assert match_triggers("my relationship is on the line") == {"major_life", "emotional"}
+
+    def test_substring_and_phrase_matches(self):
+        """Test that keywords match inside words and across spaces."""
+        assert match_triggers("i worry it might not work out") == {"emotional", "prediction"}
+
+    def test_no_match(self):
+        """Test that unrelated text fires nothing."""
+        assert match_triggers("what colour to paint the shed") == set()
+
+    def test_fallback_matches_automaton(self):
+        """Test that the regex fallback agrees with the automaton."""
+        text = "quit my job? family says it will probably fail"
+        expected = match_triggers(text)
+        with patch.object(heuristics_engine, "_TRIGGER_AUTOMATON", None):
+            assert match_triggers(text) == expected
+
+
+class TestHeuristicsEngine:
+    """Tests for heuristic question selection."""
+
+    def test_only_clarify_phase(self):
+        """Test that no heuristics are injected outside clarify."""
+        canvas = CanvasState(statement="Should I quit my job?")
+        assert HeuristicsEngine().get_applicable_heuristics(canvas, "moves") == []
+
+    @pytest.mark.parametrize(
+        "statement,expected",
+        [
+            ("Should I quit my job?", ["reversibility_check", "regret_minimization"]),
+            ("I feel it will be fine", ["reversibility_check", "10_10_10", "base_rate_check"]),
+        ],
+    )
+    def test_selected_heuristics(self, statement, expected):
+        """Test which heuristics fire for a statement."""
+        canvas = CanvasState(statement=statement)
+        questions = HeuristicsEngine().get_applicable_heuristics(canvas, "clarify")
+        assert [q.heuristic_trigger for q in questions] == expected
+
+    def test_reversibility_skipped_when_known(self):
+        """Test that reversibility isn't asked once the context covers it."""
+        canvas = CanvasState(statement="Paint the shed", context_bullets=["Easily Reversible"])
+        assert HeuristicsEngine().get_applicable_heuristics(canvas, "clarify") == []
+
+    def test_questions_are_not_shared(self):
+        """Test that scoring one returned question doesn't touch the template."""
+        canvas = CanvasState(statement="Should I quit my job?")
+        first = HeuristicsEngine().get_applicable_heuristics(canvas, "clarify")[0]
+        first.voi_score = 99.0
+
+        second = HeuristicsEngine().get_applicable_heuristics(canvas, "clarify")[0]
+        assert second.voi_score == 0.0
+        assert heuristics_engine.REVERSIBILITY_QUESTION.voi_score == 0.0
@@ -0,0 +1,204 @@
+"""Tests for rule-based pattern detection."""
+
+from collections import Counter
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.schemas.psychologist_state import (
+    EmotionalIntensity,
+    PsychologistConversationState,
+    Thread,
+    ThreadType,
+)
+from app.services.pattern_detector import (
+    DetectedThread,
+    PatternAnalysisResult,
+    PatternDetector,
+    _ai_analysis_cache,
+)
+
+
+def _user(content: str) -> dict:
+    return {"role": "user", "content": content}
+
+
+class TestRuleBasedAnalysis:
+    """Tests for the regex and keyword rules run on every message."""
+
+    def test_emotion_and_feeling_threads(self):
+        """Test that the strongest marker sets intensity and feelings become threads."""
+        detector = PatternDetector()
+        message = "I feel really stuck in this job"
+        result = detector._rule_based_analysis(message, [], PsychologistConversationState())
+
+        assert result.dominant_emotion == "neutral"  # "really" is the first HIGH marker
+        assert [t.topic for t in result.new_threads] == ["feeling really stuck in this job"]
+        assert result.new_threads[0].emotional_intensity == EmotionalIntensity.HIGH
+
+    def test_critical_marker_wins(self):
+        """Test that critical markers are checked before high ones."""
+        intensity, emotion = PatternDetector()._detect_emotion("i'm really desperate")
+        assert intensity == EmotionalIntensity.CRITICAL
+        assert emotion == "anxious"
+
+    def test_fallback_matches_automaton(self):
+        """Test that the regex marker scan agrees with the automaton."""
+        detector = PatternDetector()
+        messages = ["so stuck, really lost and terrified", "i wonder, maybe", "calm"]
+        expected = [detector._detect_emotion(m) for m in messages]
+        with patch.object(PatternDetector, "_MARKER_AUTOMATON", None):
+            assert [detector._detect_emotion(m) for m in messages] == expected
+
+    def test_rule_trigger_fallback_matches_automaton(self):
+        """Test that the regex trigger scan agrees with the automaton."""
+        detector = PatternDetector()
+        message = "i feel i need it but on one hand it's important to me"
+        expected = detector._scan_rule_triggers(message)
+        assert {"emotional", "contradiction"} <= expected
+        with patch.object(PatternDetector, "_RULE_TRIGGER_AUTOMATON", None):
+            assert detector._scan_rule_triggers(message) == expected
+
+    def test_value_statements(self):
+        """Test that value indicators capture what follows them."""
+        threads = PatternDetector()._detect_value_statements(
+            "I care about my family", "i care about my family"
+        )
+        assert [t.topic for t in threads] == ["values my family"]
+        assert threads[0].type == ThreadType.VALUE
+
+    def test_quote_uses_match_position(self):
+        """Test that the quote is cut around the match, not an earlier mention."""
+        message = "My family is loud. " + "x" * 40 + " I care about my family"
+        threads = PatternDetector()._detect_value_statements(message, message.lower())
+        assert threads[0].quote.endswith("I care about my family")
+        assert not threads[0].quote.startswith("My family")
+
+    def test_contradictions(self):
+        """Test internal conflict and reversal against earlier messages."""
+        observations = PatternDetector()._detect_contradictions(
+            "i want to leave but i don't want to let them down",
+            ["i want stability"],
+        )
+        assert [o.text for o in observations] == [
+            "User shows internal conflict: wants X but Y",
+            "Previously expressed 'want' positively, now negatively",
+        ]
+
+    def test_repeated_themes(self):
+        """Test that words used three or more times are reported."""
+        observations = PatternDetector()._detect_repeated_themes(
+            "so stuck", Counter("i feel stuck still stuck ok ok".split())
+        )
+        assert [o.text for o in observations] == ["'stuck' mentioned 3 times - recurring theme"]
+
+    def test_repeated_themes_count_whole_words(self):
+        """Test that longer words containing a theme word are not counted."""
+        observations = PatternDetector()._detect_repeated_themes(
+            "i wanted it", Counter(["i", "want", "it", "they", "wanted", "it"])
+        )
+        assert observations == []
+
+    def test_user_history_is_extended_incrementally(self):
+        """Test that the state's lowercased user history only grows by new messages."""
+        state = PsychologistConversationState()
+        history = [_user("I Want"), {"role": "assistant", "content": "Why?"}]
+        assert state.user_history_lower(history) == ["i want"]
+
+        history.append(_user("I NEED, I don't"))
+        assert state.user_history_lower(history) == ["i want", "i need, i don't"]
+        assert state.user_history_lower([_user("New")]) == ["new"]
+
+    def test_theme_counts_persist_across_reloads(self):
+        """Test that a reloaded state only counts messages it has not seen."""
+        detector = PatternDetector()
+        history = [_user("Stuck and lost"), {"role": "assistant", "content": "stuck?"}]
+        state = PsychologistConversationState()
+        assert detector._update_theme_counts(state, history) == {"stuck": 1, "lost": 1}
+
+        state = PsychologistConversationState.model_validate(state.model_dump(mode="json"))
+        history.append(_user("still STUCK, wanted out"))
+        with patch.object(PatternDetector, "_SIGNIFICANT_WORD_RE", wraps=detector._SIGNIFICANT_WORD_RE) as regex:
+            counts = detector._update_theme_counts(state, history)
+        assert counts == {"stuck": 2, "lost": 1}
+        assert regex.findall.call_count == 1
+        assert state.user_theme_history_len == 3
+
+        assert detector._update_theme_counts(state, [_user("lost")]) == {"lost": 1}
+
+    def test_known_threads_text_follows_appends(self):
+        """Test that the cached thread listing picks up appended and replaced threads."""
+        state = PsychologistConversationState()
+        assert state.known_threads_text() == ""
+
+        state.active_threads.append(Thread(id="t1", topic="career", type=ThreadType.VALUE))
+        assert state.known_threads_text() == "- career (value)"
+
+        state.active_threads.append(Thread(id="t2", topic="money"))
+        assert state.known_threads_text() == "- career (value)\n- money (mentioned)"
+
+        state.active_threads = [Thread(id="t3", topic="family")]
+        assert state.known_threads_text() == "- family (mentioned)"
+
+    def test_thread_depths(self):
+        """Test that touching a thread's topic words deepens it, capped at 3."""
+        threads = [
+            Thread(id="t1", topic="career change", exploration_depth=1),
+            Thread(id="t2", topic="family", exploration_depth=3),
+            Thread(id="t3", topic="money"),
+        ]
+        updates = PatternDetector()._update_thread_depths(
+            "my career and my family", threads
+        )
+        assert updates == {"t1": 2, "t2": 3}
+
+
+class TestMergeAIResults:
+    """Tests for de-duplicating AI-detected threads and observations."""
+
+    def _thread(self, topic: str) -> DetectedThread:
+        return DetectedThread(
+            topic=topic,
+            type=ThreadType.EMOTIONAL,
+            emotional_intensity=EmotionalIntensity.MEDIUM,
+            relevance_score=0.5,
+            quote="",
+        )
+
+    def test_merge_threads_skips_overlapping_topics(self):
+        """Test that same or mostly-overlapping topics are dropped, including among candidates."""
+        existing = [self._thread("feeling stuck at work")]
+        PatternDetector()._merge_threads(
+            existing,
+            [
+                self._thread("Feeling Stuck At Work"),
+                self._thread("stuck work"),
+                self._thread("fear of failure"),
+                self._thread("failure fear"),
+            ],
+        )
+        assert [t.topic for t in existing] == ["feeling stuck at work", "fear of failure"]
+
+
+class TestAIAnalysisCache:
+    """Tests for reusing AI analyses of identical prompts."""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompt_calls_ai_once(self):
+        """Test that a repeated analysis is served from the cache as a fresh copy."""
+        _ai_analysis_cache.clear()
+        detector = PatternDetector()
+        detector.ai = AsyncMock()
+        detector.ai.generate.return_value = (
+            PatternAnalysisResult(dominant_emotion="anxious"), {}
+        )
+        history = [_user("hello"), _user("I keep going back and forth")]
+        state = PsychologistConversationState()
+
+        first = await detector._ai_analysis("what should I do", history, state)
+        first.new_threads.append(TestMergeAIResults()._thread("mutated"))
+        second = await detector._ai_analysis("what should I do", history, state)
+
+        assert detector.ai.generate.await_count == 1
+        assert second.dominant_emotion == "anxious"
+        assert second.new_threads == []
@@ -0,0 +1,241 @@
+"""Tests for psychologist engine response validation and fixes."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.schemas.psychologist_state import (
+    ConversationPhase,
+    PsychologistConversationState,
+    ResponseMove,
+    Thread,
+)
+from app.services.pattern_detector import PatternAnalysisResult
+from app.services.psychologist_engine import (
+    CORRECTIONS,
+    AIResponseModel,
+    PsychologistEngine,
+)
+
+
+def _engine() -> PsychologistEngine:
+    return PsychologistEngine(MagicMock())
+
+
+def _response(text: str, move: str = "reflection") -> AIResponseModel:
+    return AIResponseModel(response=text, response_move=move)
+
+
+class TestValidateResponse:
+    """Tests for the rules a generated response is checked against."""
+
+    def test_clean_response_has_no_issues(self):
+        """Test that a natural single-question reflection passes."""
+        issues = _engine()._validate_response(
+            _response("That sounds heavy. What makes that feel so hard?"),
+            PsychologistConversationState(),
+        )
+        assert issues == []
+
+    def test_every_banned_pattern_is_reported(self):
+        """Test that each matching banned pattern gets its own issue."""
+        issues = _engine()._validate_response(
+            _response("Which of these options, and what kind of job?"),
+            PsychologistConversationState(),
+        )
+        assert issues == [
+            ("banned", "Contains banned pattern: what (kind|type|category) of"),
+            ("banned", "Contains banned pattern: which of these"),
+        ]
+
+    def test_synthesis_required_every_third_exchange(self):
+        """Test that a due synthesis is only satisfied by a synthesis phrase."""
+        state = PsychologistConversationState(total_exchange_count=3)
+        engine = _engine()
+
+        missing = engine._validate_response(_response("What changed?"), state)
+        present = engine._validate_response(
+            _response("So far I'm hearing that timing matters. What changed?"), state
+        )
+
+        assert "synthesis" in [kind for kind, _ in missing]
+        assert "synthesis" not in [kind for kind, _ in present]
+
+    def test_third_deepening_question_in_a_row_is_flagged(self):
+        """Test that a deepening question after two others is reported, also after reload."""
+        state = PsychologistConversationState(
+            current_phase=ConversationPhase.EXPLORATION,
+            move_history=["reflection", "deepening_question", "deepening_question"],
+        )
+        engine = _engine()
+        streak = ("questions", "Asked 2+ questions in a row without reflection/synthesis")
+
+        assert streak in engine._validate_response(
+            _response("What else?", move="deepening_question"), state
+        )
+        assert streak not in engine._validate_response(_response("I hear you."), state)
+        state.move_history.pop()
+        assert streak not in engine._validate_response(
+            _response("What else?", move="deepening_question"), state
+        )
+
+    def test_correction_prompt_has_one_instruction_per_issue(self):
+        """Test that corrections are picked by issue kind, in issue order."""
+        prompt = _engine()._build_correction_prompt(
+            [("move", "Move challenge not appropriate"), ("opener", "Starts with 'Got it'")]
+        )
+        assert prompt.splitlines() == [
+            "## CORRECTIONS REQUIRED",
+            f"- {CORRECTIONS['move']}",
+            f"- {CORRECTIONS['opener']}",
+        ]
+
+
+class TestApplyFixes:
+    """Tests for mechanical fixes applied after regeneration fails."""
+
+    def test_keeps_only_last_question(self):
+        """Test that extra questions are dropped, keeping statements and the last question."""
+        fixed = _engine()._apply_fixes(
+            _response("I hear you. Why now? What changed?"),
+            [],
+            PsychologistConversationState(),
+        )
+        assert fixed.response == "I hear you. What changed?"
+
+    def test_strips_robotic_openers(self):
+        """Test that leading 'Understood'/'Got it' and their punctuation are removed."""
+        engine = _engine()
+        state = PsychologistConversationState()
+        fixed = [
+            engine._apply_fixes(_response(text), [], state).response
+            for text in (
+                "Understood, that sounds hard.",
+                "Understood. Got it. What changed?",
+                "got it - what changed?",
+                "Understanding that takes time.",
+            )
+        ]
+        assert fixed == [
+            "that sounds hard.",
+            "What changed?",
+            "what changed?",
+            "Understanding that takes time.",
+        ]
+
+
+class TestUpdateStateFromResponse:
+    """Tests for folding a generated response back into the state."""
+
+    def test_threads_and_observations_deduplicated_case_insensitively(self):
+        """Test that repeated topics and texts, including within one response, are added once."""
+        state = PsychologistConversationState()
+        response = _response("Tell me more.", move="deepening_question")
+        response.threads_detected = [
+            {"topic": "Career change"},
+            {"topic": "career CHANGE"},
+            {"topic": "money"},
+        ]
+        response.observations_detected = [{"text": "Avoids conflict"}, {"text": "avoids conflict"}]
+
+        _engine()._update_state_from_response(state, response)
+        _engine()._update_state_from_response(state, response)
+
+        assert [t.topic for t in state.active_threads] == ["Career change", "money"]
+        assert [t.id for t in state.active_threads] == ["t1", "t2"]
+        assert [o.text for o in state.observations] == ["Avoids conflict"]
+
+    def test_lowercased_keys_follow_reassignment(self):
+        """Test that the dedupe keys track the current topic/text and are not serialized."""
+        thread = Thread(id="t1", topic="Career")
+        assert thread.topic_lower == "career"
+        thread.topic = "MONEY"
+        assert thread.topic_lower == "money"
+        assert "topic_lower" not in thread.model_dump()
+
+        state = PsychologistConversationState(active_threads=[thread])
+        response = _response("Tell me more.")
+        response.threads_detected = [{"topic": "money"}]
+        _engine()._update_state_from_response(state, response)
+        assert [t.topic for t in state.active_threads] == ["MONEY"]
+
+    def test_synthesis_points_deduplicated_across_reloads(self):
+        """Test that repeated points are added once, also after the state is reloaded."""
+        engine = _engine()
+        state = PsychologistConversationState()
+        response = _response("So far I'm hearing two things.", move="synthesis")
+        response.synthesis_points = ["timing matters", "money is secondary", "timing matters"]
+
+        engine._update_state_from_response(state, response)
+        state = PsychologistConversationState.model_validate(state.model_dump())
+        response.synthesis_points = ["money is secondary", "family comes first"]
+        engine._update_state_from_response(state, response)
+
+        assert state.synthesis_points == [
+            "timing matters",
+            "money is secondary",
+            "family comes first",
+        ]
+
+
+class TestUpdateStateWithPatterns:
+    """Tests for folding pattern detection results into the state."""
+
+    def test_thread_depths_applied_by_id(self):
+        """Test that depth updates touch only the named threads."""
+        state = PsychologistConversationState(
+            total_exchange_count=4,
+            active_threads=[Thread(id="t1", topic="career"), Thread(id="t2", topic="money")],
+        )
+        _engine()._update_state_with_patterns(
+            state, PatternAnalysisResult(updated_thread_depths={"t2": 2, "t9": 1})
+        )
+
+        assert [(t.exploration_depth, t.last_touched_exchange) for t in state.active_threads] == [
+            (0, 0),
+            (2, 4),
+        ]
+
+
+class TestMoveRules:
+    """Tests for which response moves each phase allows."""
+
+    def test_moves_allowed_by_phase(self):
+        """Test that opening only allows reflecting and asking deeper."""
+        engine = _engine()
+        assert engine._is_move_allowed_in_phase(ResponseMove.REFLECTION, ConversationPhase.OPENING)
+        assert not engine._is_move_allowed_in_phase(ResponseMove.CHALLENGE, ConversationPhase.OPENING)
+        assert engine._is_move_allowed_in_phase(ResponseMove.TRANSITION, ConversationPhase.CLOSING)
+
+    def test_parse_move_normalises_and_defaults(self):
+        """Test that hyphenated or upper-case moves parse and unknown ones fall back."""
+        engine = _engine()
+        assert engine._parse_move("Deepening-Question") == ResponseMove.DEEPENING_QUESTION
+        assert engine._parse_move("SYNTHESIS") == ResponseMove.SYNTHESIS
+        assert engine._parse_move("bogus") == ResponseMove.DEEPENING_QUESTION
+
+
+class TestProcessMessage:
+    """Tests for the full message pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_includes_recent_history(self):
+        """Test that the history formatted alongside pattern detection reaches the prompt."""
+        ai = AsyncMock()
+        ai.generate.side_effect = lambda **kwargs: (
+            kwargs["response_model"](response="What feels hardest?", response_move="reflection")
+            if kwargs["response_model"] is AIResponseModel
+            else PatternAnalysisResult(),
+            {},
+        )
+        engine = PsychologistEngine(ai)
+        history = [
+            {"role": "user", "content": "I might quit"},
+            {"role": "assistant", "content": "Tell me more."},
+        ]
+
+        result = await engine.process_message("I'm torn", "Job offer", history)
+
+        prompt = ai.generate.await_args.kwargs["system_prompt"]
+        assert "USER: I might quit\nASSISTANT: Tell me more." in prompt
+        assert result.response_move == ResponseMove.REFLECTION
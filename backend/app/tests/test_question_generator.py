@@ -0,0 +1,34 @@
+"""Tests for template-based question pool generation."""
+
+from app.schemas.canvas import CanvasState, Constraint, Criterion
+from app.services.question_generator import QuestionGenerator
+
+
+class TestQuestionPool:
+    """Tests for the initial candidate question pool."""
+
+    def test_unknown_type_falls_back_to_personal(self):
+        """Test that decision types without templates get the personal questions."""
+        canvas = CanvasState(
+            statement="Where should I move?",
+            criteria=[Criterion(id="c1", name="cost")],
+            constraints=[Constraint(id="k1", text="visa", type="hard")],
+        )
+        pool = QuestionGenerator().generate_initial_question_pool("", "travel", canvas)
+        assert [q.id for q in pool] == [
+            "personal_impact",
+            "personal_values",
+            "universal_context",
+            "universal_urgency",
+        ]
+
+    def test_pools_do_not_share_questions(self):
+        """Test that scoring one pool in place leaves the next pool untouched."""
+        generator = QuestionGenerator()
+        canvas = CanvasState()
+        first = generator.generate_initial_question_pool("", "career", canvas)
+        for question in first:
+            question.voi_score = 99.0
+
+        second = generator.generate_initial_question_pool("", "career", canvas)
+        assert [q.voi_score for q in second] == [0.0] * len(second)
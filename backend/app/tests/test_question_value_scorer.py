@@ -0,0 +1,100 @@
+"""Tests for Value of Information question scoring."""
+
+from app.schemas.canvas import CanvasState, Constraint
+from app.schemas.question import (
+    Answer,
+    CandidateQuestion,
+    ConversationState,
+    QuestioningMode,
+    QuestionWithAnswer,
+)
+from app.services.question_value_scorer import QuestionValueScorer, _CanvasFeatures
+
+
+def _question(field: str, text: str = "Tell me more", critical: bool = False) -> CandidateQuestion:
+    return CandidateQuestion(
+        id=f"q_{field}",
+        question=text,
+        answer_type="text",
+        why_this_question="why",
+        what_it_changes="what",
+        priority=50,
+        targets_canvas_field=field,
+        critical_variable=critical,
+    )
+
+
+class TestFieldScores:
+    """Tests for the per-field critical, uncertainty and impact rules."""
+
+    def test_constraint_scores_follow_canvas(self):
+        """Test that constraint questions lose value once a hard constraint exists."""
+        scorer = QuestionValueScorer()
+        question = _question("constraints", "What must be true?")
+        empty = _CanvasFeatures.from_canvas(CanvasState())
+        soft = _CanvasFeatures.from_canvas(
+            CanvasState(constraints=[Constraint(id="k1", text="near family", type="soft")])
+        )
+        hard = _CanvasFeatures.from_canvas(
+            CanvasState(constraints=[Constraint(id="k1", text="near family", type="hard")])
+        )
+
+        assert scorer._calculate_critical_score(question, empty) == 90.0
+        assert scorer._calculate_critical_score(question, soft) == 50.0
+        assert scorer._calculate_critical_score(question, hard) == 20.0
+        assert scorer._calculate_uncertainty_reduction(question, hard) == 50.0
+        assert scorer._calculate_impact_score(question, hard) == 85.0
+        assert scorer._calculate_impact_score(_question("constraints", "Anything REQUIRED?"), hard) == 85.0
+        assert scorer._calculate_impact_score(_question("constraints", "Any limits?"), hard) == 60.0
+
+    def test_hard_constraint_follows_in_place_changes(self):
+        """Test that the canvas flag tracks constraints added after it was read."""
+        canvas = CanvasState(constraints=[Constraint(id="k1", text="near family", type="soft")])
+        assert not canvas.has_hard_constraint
+
+        canvas.constraints.extend([Constraint(id="k2", text="keep visa", type="hard")])
+        assert canvas.has_hard_constraint
+        assert _CanvasFeatures.from_canvas(canvas).has_hard_constraint
+
+    def test_unknown_field_gets_defaults(self):
+        """Test that fields without a rule fall back to the low default scores."""
+        scorer = QuestionValueScorer()
+        canvas = _CanvasFeatures.from_canvas(CanvasState())
+        question = _question("risks")
+
+        assert scorer._calculate_critical_score(question, canvas) == 20.0
+        assert scorer._calculate_uncertainty_reduction(question, canvas) == 30.0
+        assert scorer._calculate_impact_score(question, canvas) == 35.0
+        assert scorer._calculate_critical_score(_question("risks", critical=True), canvas) == 100.0
+
+
+class TestScoreQuestions:
+    """Tests for scoring a pool of questions against one canvas."""
+
+    def test_batch_matches_single_scores(self):
+        """Test that batched scores equal scoring each question on its own."""
+        scorer = QuestionValueScorer()
+        canvas = CanvasState(statement="Should I move?")
+        state = ConversationState(mode=QuestioningMode.QUICK, question_cap=5)
+        questions = [_question(f) for f in ("statement", "criteria", "constraints", "context")]
+
+        assert scorer.score_questions(questions, canvas, state) == [
+            (q, scorer.score_question(q, canvas, state)) for q in questions
+        ]
+
+    def test_redundancy_counts_asked_questions_per_field(self):
+        """Test that each earlier question on a field lowers that field's score."""
+        scorer = QuestionValueScorer()
+        canvas = CanvasState()
+        asked = [
+            QuestionWithAnswer(question=_question("criteria"), answer=Answer(question_id="q", value="x"))
+            for _ in range(2)
+        ]
+        fresh = ConversationState(mode=QuestioningMode.QUICK, question_cap=5)
+        repeated = ConversationState(mode=QuestioningMode.QUICK, question_cap=5, asked_questions=asked)
+        questions = [_question("criteria"), _question("context")]
+
+        before = [score for _, score in scorer.score_questions(questions, canvas, fresh)]
+        after = [score for _, score in scorer.score_questions(questions, canvas, repeated)]
+
+        assert after == [before[0] - scorer.REDUNDANCY_WEIGHT * 50.0, before[1]]
@@ -5,7 +5,12 @@ from pydantic import ValidationError
 
 from app.schemas.question import Question
 from app.schemas.move import Move, CriteriaScores, Scripts, Branches, BranchResponse
-from app.schemas.ai_responses import Phase1Response, Phase2Response
+from app.schemas.ai_responses import (
+    Phase1Response,
+    Phase2Response,
+    ClarifyChatResponse,
+    CommitPlanResponse,
+)
 
 
 class TestQuestionSchema:
@@ -225,3 +230,19 @@ class TestPhase1Response:
                     ),
                 ],  # Only 1 question, minimum is 5
             )
+
+
+class TestChatResponses:
+    """Tests for chat-phase AI response schemas."""
+
+    def test_clarify_chat_response_defaults(self):
+        """Test optional clarify fields default to empty values."""
+        response = ClarifyChatResponse.model_validate({"response": "Tell me more."})
+        assert response.question_reason is None
+        assert response.suggested_options is None
+        assert response.ready_for_options is False
+
+    def test_commit_plan_response_requires_plan(self):
+        """Test that commit plan responses must include the plan."""
+        with pytest.raises(ValidationError):
+            CommitPlanResponse.model_validate({"canvas_state_update": {}})
@@ -0,0 +1,30 @@
+"""Tests for the process-local TTL cache."""
+
+from unittest.mock import patch
+
+from app.services.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for expiry and LRU eviction."""
+
+    def test_entries_expire(self):
+        """Test that a value is gone once its TTL has passed."""
+        cache = TTLCache(ttl=60)
+        with patch("app.services.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            assert cache.get("a") == 1
+        with patch("app.services.ttl_cache.time.monotonic", return_value=160.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that reading a key protects it from eviction."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -0,0 +1,123 @@
+"""Tests for user context keyword matching and summary caching."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.user_profile import UserProfile
+from app.services import user_context_service
+from app.services.user_context_service import UserContextService
+
+
+class TestExtractKeywords:
+    """Tests for mapping situation text to keyword categories."""
+
+    def test_shared_keyword_reports_every_category(self):
+        """Test that a keyword listed under two categories finds both."""
+        service = UserContextService(MagicMock())
+        assert sorted(service._extract_keywords("Should I INVEST?")) == ["finance", "startup"]
+        assert service._extract_keywords("no matches here") == []
+
+    def test_fallback_matches_automaton(self):
+        """Test that the regex keyword scan agrees with the automaton."""
+        service = UserContextService(MagicMock())
+        texts = ["My boss wants me at the gym", "a degree or a startup?", "nothing"]
+        expected = [sorted(service._extract_keywords(t)) for t in texts]
+        user_context_service._extract_keyword_categories.cache_clear()
+        with patch.object(user_context_service, "_KEYWORD_AUTOMATON", None):
+            assert [sorted(service._extract_keywords(t)) for t in texts] == expected
+        user_context_service._extract_keyword_categories.cache_clear()
+
+    def test_callers_get_their_own_list(self):
+        """Test that mutating one result does not change the cached categories."""
+        service = UserContextService(MagicMock())
+        first = service._extract_keywords("my salary")
+        first.append("mutated")
+        assert service._extract_keywords("my salary") == ["career"]
+
+
+class TestContextSummaryCache:
+    """Tests for mirroring fresh context summaries in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_cached_summary_skips_the_database(self):
+        """Test that a summary found in Redis is returned without a query."""
+        db = MagicMock()
+        db.execute = AsyncMock()
+        cache = AsyncMock()
+        cache.get.return_value = "USER CONTEXT:\nValues: growth"
+
+        context = await UserContextService(db, cache=cache).build_user_context(uuid.uuid4())
+
+        assert context == "USER CONTEXT:\nValues: growth"
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fresh_profile_summary_is_cached_until_it_expires(self):
+        """Test that a summary read from the profile is cached for its remaining lifetime."""
+        user_id = uuid.uuid4()
+        profile = UserProfile(
+            user_id=user_id,
+            context_summary="USER CONTEXT:\nName: Alex",
+            context_summary_updated_at=datetime.now(timezone.utc) - timedelta(hours=20),
+        )
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = profile
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        cache = AsyncMock()
+        cache.get.return_value = None
+
+        context = await UserContextService(db, cache=cache).build_user_context(user_id)
+
+        assert context == "USER CONTEXT:\nName: Alex"
+        key, value = cache.set.await_args.args
+        ttl = cache.set.await_args.kwargs["ex"]
+        assert (key, value) == (f"uctx:{user_id}", context)
+        assert timedelta(hours=3, minutes=59) < ttl <= timedelta(hours=4)
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_fall_back_to_the_database(self):
+        """Test that a failing cache read is treated as a miss."""
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=RuntimeError("database reached"))
+        cache = AsyncMock()
+        cache.get.side_effect = user_context_service.RedisError("down")
+
+        with pytest.raises(RuntimeError, match="database reached"):
+            await UserContextService(db, cache=cache).build_user_context(uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_event_loop_errors_fall_back_to_the_database(self):
+        """Test that a client bound to another event loop is treated as a miss."""
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=LookupError("database reached"))
+        cache = AsyncMock()
+        cache.get.side_effect = RuntimeError("attached to a different loop")
+
+        with pytest.raises(LookupError, match="database reached"):
+            await UserContextService(db, cache=cache).build_user_context(uuid.uuid4())
+
+    def test_each_event_loop_gets_its_own_client(self):
+        """Test that the shared client is scoped to the running event loop."""
+        settings = MagicMock(use_redis_context_cache=True, redis_url="redis://cache")
+        redis = MagicMock()
+        redis.from_url.side_effect = lambda *args, **kwargs: MagicMock()
+
+        async def resolve_twice():
+            service = UserContextService(MagicMock())
+            return service.cache, service.cache
+
+        with patch.object(user_context_service, "Redis", redis), patch.object(
+            user_context_service, "get_settings", return_value=settings
+        ):
+            assert user_context_service.get_context_cache() is None
+            first, again = asyncio.run(resolve_twice())
+            second, _ = asyncio.run(resolve_twice())
+
+        assert first is again
+        assert first is not second
+        assert redis.from_url.call_count == 2
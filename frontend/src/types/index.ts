@@ -258,6 +258,7 @@ export interface Decision {
   created_at: string;
   updated_at: string;
   nodes: DecisionNode[];
+  node_count?: number | null;
   current_node?: DecisionNode;
 }
 